@@ -0,0 +1,93 @@
+"""Measure how many bytes the recorder stores per sensor state change.
+
+Builds a sensor for a typical episode (several KB of HTML show notes and
+a full episode history) and reports the size of the attributes the
+recorder keeps, with the regular and the lean sensor. Needs a development
+environment with Home Assistant installed:
+
+    python benchmarks/attribute_size.py
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.podcast_index.history import EpisodeHistory  # noqa: E402
+from custom_components.podcast_index.sensor import (  # noqa: E402
+    PodcastIndexLeanSensor,
+    PodcastIndexSensor,
+)
+
+SHOW_NOTES = (
+    "<p>This week we talk about <strong>home automation</strong>, local control "
+    "and why your smart bulbs keep phoning home.</p>"
+    + "".join(
+        f'<p><a href="https://example.com/links/{i}">Link {i}</a>: a sponsor read, '
+        f"a chapter marker at {i:02d}:00 and the usual &amp; ever-growing list of "
+        "things we mentioned on the show.</p>"
+        for i in range(40)
+    )
+)
+
+
+def _episode(number: int, published: int) -> dict:
+    """Return a parsed episode like the API client produces."""
+    return {
+        "title": f"Episode {number}: Local control all the things",
+        "description": SHOW_NOTES,
+        "publish_date": published,
+        "duration": 3725,
+        "audio_url": f"https://cdn.example.com/audio/episode-{number}.mp3?source=feed&tracking=abcdef",
+        "podcast_title": "The Home Automation Show",
+        "episode_number": number,
+        "season_number": 3,
+        "guid": f"urn:uuid:6f1e0e9c-2a53-4c38-9f9e-{number:012d}",
+        "link": f"https://example.com/episodes/{number}",
+        "feed_url": "https://feeds.example.com/home-automation-show.xml",
+        "podcast_icon": "https://images.example.com/podcasts/home-automation-show/cover-3000x3000.jpg",
+        "podcast_id": "920666",
+        "search_term": "home automation",
+    }
+
+
+def _recorded_size(sensor: PodcastIndexSensor) -> tuple[int, int]:
+    """Return the size of all attributes and of the recorded ones, in bytes."""
+    attributes = sensor.extra_state_attributes
+    recorded = {
+        key: value
+        for key, value in attributes.items()
+        if key not in sensor._unrecorded_attributes
+    }
+    return len(json.dumps(attributes)), len(json.dumps(recorded))
+
+
+def main() -> None:
+    """Print the attribute sizes of each sensor variant."""
+    now = int(time.time())
+    history = EpisodeHistory(10)
+    history.add(_episode(100 - i, now - i * 7 * 86400) for i in range(10))
+    coordinator = SimpleNamespace(data=_episode(100, now), history=history)
+
+    results = {}
+    for label, sensor_class in (
+        ("full", PodcastIndexSensor),
+        ("lean", PodcastIndexLeanSensor),
+    ):
+        for with_history in (False, True):
+            sensor = sensor_class(coordinator, "PodcastIndex", "home automation", with_history)
+            name = f"{label}{' + recent_episodes' if with_history else ''}"
+            results[name] = _recorded_size(sensor)
+
+    baseline = results["full"][1]
+    print(f"{'variant':<26}{'attributes':>12}{'recorded':>12}{'saved':>8}")
+    for name, (total, recorded) in results.items():
+        print(f"{name:<26}{total:>12}{recorded:>12}{1 - recorded / baseline:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
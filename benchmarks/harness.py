@@ -0,0 +1,436 @@
+"""Benchmark the PodcastIndex client against the local mock API.
+
+For every term count and sync mode the harness starts a fresh mock server
+(benchmarks/mock_server.py) in its own process, so its memory and sockets
+stay out of the measurements, and replays the requests the integration
+makes:
+
+- setup: resolve every term to its feed, DEFAULT_SETUP_CONCURRENCY at a
+  time, and fetch the first episodes, like the first refresh does;
+- polls: publish new episodes on some feeds, then poll the way the sync
+  mode does (one request per term, batches of BATCH_MAX_FEEDS feeds, or a
+  /recent/data check followed by batches of the changed feeds only);
+- search_and_play: look up episodes for untracked terms, with and
+  without a cached resolution.
+
+It reports requests, bytes and 304 answers per poll cycle, setup and poll
+times, search_and_play latency, the client's peak Python memory, and the
+connections it opened. The results are written as JSON; pass an earlier
+results file with --compare to print the change of every metric.
+
+The client is loaded straight from the integration package and runs
+without Home Assistant; the coordinators themselves are not involved.
+
+    python benchmarks/harness.py [--terms 10,100,1000] [--modes per_term,batched,delta]
+        [--latency 0.02] [--error-rate 0] [--output results.json] [--compare old.json]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+from pathlib import Path
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import types
+from typing import Any
+
+import aiohttp
+
+from mock_server import API_PREFIX, CONTROL_PREFIX
+
+_ROOT = Path(__file__).resolve().parent.parent
+_MOCK_SERVER = Path(__file__).resolve().parent / "mock_server.py"
+_PACKAGE_DIR = _ROOT / "custom_components" / "podcast_index"
+
+# Import the client modules without running the package __init__, which
+# needs Home Assistant
+_package = types.ModuleType("podcast_index")
+_package.__path__ = [str(_PACKAGE_DIR)]
+sys.modules["podcast_index"] = _package
+api_module = importlib.import_module("podcast_index.podcast_index_api")
+const = importlib.import_module("podcast_index.const")
+models = importlib.import_module("podcast_index.models")
+
+MODES = ("per_term", "batched", "delta")
+
+
+class _Unlimited:
+    """Stand-in for the client's token bucket when rate limiting is off."""
+
+    async def acquire(self) -> None:
+        """Never wait."""
+
+
+class MockServer:
+    """The mock API running in a child process, driven through its control routes."""
+
+    def __init__(self, args: argparse.Namespace, feeds: int) -> None:
+        """Initialize the server settings."""
+        self._arguments = [
+            "--port", "0",
+            "--feeds", str(feeds),
+            "--episodes", str(args.episodes),
+            "--description-bytes", str(args.description_bytes),
+            "--latency", str(args.latency),
+            "--jitter", str(args.jitter),
+            "--error-rate", str(args.error_rate),
+            "--publish-interval", "0",
+            "--seed", str(args.seed),
+            *(["--no-etags"] if args.no_etags else []),
+        ]
+        self._process: asyncio.subprocess.Process | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._control_url = ""
+
+    async def start(self) -> str:
+        """Start the server and return the base URL to give the API client."""
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable, str(_MOCK_SERVER), *self._arguments,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        line = (await self._process.stdout.readline()).decode().strip()
+        if not line:
+            raise RuntimeError("The mock server failed to start")
+        base_url = line.rsplit(" ", 1)[-1]
+        self._control_url = base_url.removesuffix(API_PREFIX) + CONTROL_PREFIX
+        self._session = aiohttp.ClientSession()
+        return base_url
+
+    async def _control(self, method: str, path: str, **params: Any) -> dict[str, Any]:
+        """Send a control request."""
+        async with self._session.request(
+            method, f"{self._control_url}{path}", params=params
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def stats(self) -> dict[str, Any]:
+        """Return the request and connection counters."""
+        return await self._control("GET", "/stats")
+
+    async def reset(self) -> None:
+        """Clear the request counters."""
+        await self._control("POST", "/reset")
+
+    async def publish(self, fraction: float) -> None:
+        """Publish a new episode on a share of the feeds."""
+        await self._control("POST", "/publish", fraction=fraction)
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._session is not None:
+            await self._session.close()
+        if self._process is not None and self._process.returncode is None:
+            self._process.terminate()
+            await self._process.wait()
+
+
+def _percentile(values: list[float], share: float) -> float:
+    """Return a percentile of the values, in milliseconds."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * share))] * 1000, 2)
+
+
+class Scenario:
+    """One run of a sync mode with a number of terms against a fresh mock server."""
+
+    def __init__(self, args: argparse.Namespace, mode: str, terms: int) -> None:
+        """Initialize the scenario."""
+        self.args = args
+        self.mode = mode
+        self.terms = [f"podcast {number}" for number in range(1, terms + 1)]
+        self.server = MockServer(args, feeds=terms + args.lookups)
+        self.api: Any = None
+        self.podcasts: dict[str, dict[str, Any]] = {}
+        self.latest: dict[str, dict[str, Any]] = {}
+        self.failures = 0
+        self._since: int | None = None
+
+    async def _guarded(self, call: Any) -> Any:
+        """Await a client call, counting failures instead of raising them."""
+        try:
+            return await call
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.failures += 1
+            return None
+
+    async def _setup(self) -> None:
+        """Resolve every term and fetch the first episodes."""
+        semaphore = asyncio.Semaphore(const.DEFAULT_SETUP_CONCURRENCY)
+
+        async def resolve(term: str) -> None:
+            async with semaphore:
+                if podcast := await self._guarded(self.api.resolve_feed(term)):
+                    self.podcasts[term] = podcast
+
+        await asyncio.gather(*(resolve(term) for term in self.terms))
+        if self.mode == "per_term":
+
+            async def first_refresh(term: str) -> None:
+                async with semaphore:
+                    await self._poll_term(term, self.args.history_depth)
+
+            await asyncio.gather(*(first_refresh(term) for term in self.podcasts))
+        else:
+            await self._poll_feeds(set(self.podcasts))
+        self._since = int(time.time()) - const.DELTA_SINCE_OVERLAP
+
+    async def _poll_term(self, term: str, max_episodes: int = 1) -> None:
+        """Poll one term the way the per-term coordinator does."""
+        known = self.latest.get(term, {}).get("publish_date")
+        episodes = await self._guarded(
+            self.api.get_episodes_for_podcast(
+                self.podcasts[term], term, max_episodes=max_episodes, since=known
+            )
+        )
+        if episodes:
+            self.latest[term] = episodes[0]
+
+    async def _poll_feeds(self, terms: set[str]) -> None:
+        """Fetch the given terms in batches the way the batch coordinator does."""
+        feed_terms = {str(self.podcasts[term]["id"]): term for term in terms}
+        since = {
+            feed_id: known
+            for feed_id, term in feed_terms.items()
+            if (known := self.latest.get(term, {}).get("publish_date"))
+        }
+        episodes = await self._guarded(
+            self.api.get_episodes_by_feed_ids(
+                list(feed_terms), max(self.args.history_depth, 1), since=since
+            )
+        )
+        for feed_id, feed_episodes in (episodes or {}).items():
+            self.latest[feed_terms[feed_id]] = feed_episodes[0]
+
+    async def _poll(self) -> None:
+        """Run one poll cycle of the sync mode."""
+        if self.mode == "per_term":
+            await asyncio.gather(*(self._poll_term(term) for term in self.podcasts))
+        elif self.mode == "batched":
+            await self._poll_feeds(set(self.podcasts))
+        else:
+            feed_terms = {str(podcast["id"]): term for term, podcast in self.podcasts.items()}
+            result = await self._guarded(
+                self.api.get_updated_feed_ids(self._since, set(feed_terms))
+            )
+            if result is None:
+                return
+            changed, next_since, _complete = result
+            if changed:
+                await self._poll_feeds({feed_terms[feed_id] for feed_id in changed})
+            self._since = (next_since or int(time.time())) - const.DELTA_SINCE_OVERLAP
+
+    async def _search_and_play(self) -> dict[str, Any]:
+        """Time episode lookups for untracked terms, cold and with a cached feed."""
+        offset = len(self.terms)
+        cold: list[float] = []
+        cached: list[float] = []
+        resolved: dict[str, dict[str, Any]] = {}
+        for number in range(offset + 1, offset + self.args.lookups + 1):
+            term = f"podcast {number}"
+            started = time.perf_counter()
+            podcast = await self._guarded(self.api.search_podcasts(term))
+            if podcast:
+                await self._guarded(self.api.get_latest_episode_for_podcast(podcast, term))
+                resolved[term] = podcast
+            cold.append(time.perf_counter() - started)
+        for term, podcast in resolved.items():
+            started = time.perf_counter()
+            await self._guarded(self.api.get_latest_episode_for_podcast(podcast, term))
+            cached.append(time.perf_counter() - started)
+        return {
+            "cold_p50_ms": _percentile(cold, 0.5),
+            "cold_p95_ms": _percentile(cold, 0.95),
+            "cached_p50_ms": _percentile(cached, 0.5),
+            "cached_p95_ms": _percentile(cached, 0.95),
+        }
+
+    async def run(self) -> dict[str, Any]:
+        """Run the scenario and return its metrics."""
+        base_url = await self.server.start()
+        self.api = api_module.PodcastIndexAPI("benchmark", "benchmark", base_url=base_url)
+        if not self.args.rate_limit:
+            self.api._rate_limiter = _Unlimited()
+        tracemalloc.start()
+        try:
+            started = time.perf_counter()
+            await self._setup()
+            setup_s = time.perf_counter() - started
+            stats = await self.server.stats()
+            setup_requests = sum(stats["requests"].values())
+            server_errors = stats["errors"]
+
+            poll_times: list[float] = []
+            poll_requests: dict[str, int] = {}
+            poll_bytes = poll_not_modified = 0
+            for _ in range(self.args.polls):
+                await self.server.publish(self.args.publish_fraction)
+                await self.server.reset()
+                started = time.perf_counter()
+                await self._poll()
+                poll_times.append(time.perf_counter() - started)
+                stats = await self.server.stats()
+                for endpoint, count in stats["requests"].items():
+                    poll_requests[endpoint] = poll_requests.get(endpoint, 0) + count
+                poll_bytes += stats["bytes_sent"]
+                poll_not_modified += stats["not_modified"]
+                server_errors += stats["errors"]
+
+            await self.server.reset()
+            search_and_play = await self._search_and_play()
+            _kept, peak = tracemalloc.get_traced_memory()
+            stats = await self.server.stats()
+            server_errors += stats["errors"]
+        finally:
+            tracemalloc.stop()
+            await self.api.close()
+            await self.server.stop()
+
+        polls = max(self.args.polls, 1)
+        return {
+            "mode": self.mode,
+            "terms": len(self.terms),
+            "resolved_terms": len(self.podcasts),
+            "setup_s": round(setup_s, 3),
+            "setup_requests": setup_requests,
+            "requests_per_poll": round(sum(poll_requests.values()) / polls, 2),
+            "requests_per_poll_by_endpoint": {
+                endpoint: round(count / polls, 2)
+                for endpoint, count in sorted(poll_requests.items())
+            },
+            "bytes_per_poll": round(poll_bytes / polls),
+            "not_modified_per_poll": round(poll_not_modified / polls, 2),
+            "poll_p50_ms": _percentile(poll_times, 0.5),
+            "poll_max_ms": _percentile(poll_times, 1.0),
+            "search_and_play": search_and_play,
+            "peak_memory_kib": round(peak / 1024, 1),
+            "connections_opened": stats["connections_opened"],
+            "peak_open_connections": stats["peak_open_connections"],
+            "server_errors": server_errors,
+            "failed_calls": self.failures,
+        }
+
+
+def _metadata(args: argparse.Namespace) -> dict[str, Any]:
+    """Describe the code and settings the results were measured with."""
+    manifest = json.loads((_PACKAGE_DIR / "manifest.json").read_text())
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "version": manifest.get("version"),
+        "revision": revision,
+        "python": platform.python_version(),
+        "aiohttp": aiohttp.__version__,
+        "msgspec": models.msgspec.__version__,
+        "settings": {
+            key: value for key, value in vars(args).items() if key not in ("output", "compare")
+        },
+    }
+
+
+def _flatten(result: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Return the numeric metrics of a result keyed by dotted path."""
+    flat: dict[str, float] = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _compare(baseline: dict[str, Any], current: dict[str, Any]) -> None:
+    """Print how every metric changed since a baseline results file."""
+    previous = {(r["mode"], r["terms"]): r for r in baseline.get("results", [])}
+    print(
+        f"Comparing {current['metadata'].get('revision')} against "
+        f"{baseline.get('metadata', {}).get('revision')}"
+    )
+    for result in current["results"]:
+        old = previous.get((result["mode"], result["terms"]))
+        if old is None:
+            continue
+        print(f"\n{result['mode']} with {result['terms']} terms")
+        old_metrics = _flatten(old)
+        for name, value in _flatten(result).items():
+            if name not in old_metrics or name == "terms":
+                continue
+            before = old_metrics[name]
+            change = f"{(value - before) / before:+.0%}" if before else "n/a"
+            print(f"  {name:<48}{before:>12}{value:>12}{change:>8}")
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every scenario."""
+    results = []
+    for terms in args.terms:
+        for mode in args.modes:
+            print(f"Running {mode} with {terms} terms", file=sys.stderr)
+            results.append(await Scenario(args, mode, terms).run())
+    return {"metadata": _metadata(args), "results": results}
+
+
+def _int_list(value: str) -> list[int]:
+    """Parse a comma-separated list of integers."""
+    return [int(item) for item in value.split(",") if item]
+
+
+def _mode_list(value: str) -> list[str]:
+    """Parse a comma-separated list of sync modes."""
+    modes = [item for item in value.split(",") if item]
+    if unknown := set(modes) - set(MODES):
+        raise argparse.ArgumentTypeError(f"unknown sync modes: {', '.join(sorted(unknown))}")
+    return modes
+
+
+def main() -> None:
+    """Run the benchmark and write the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=_int_list, default=[10, 100, 1000])
+    parser.add_argument("--modes", type=_mode_list, default=list(MODES))
+    parser.add_argument("--polls", type=int, default=5, help="poll cycles per scenario")
+    parser.add_argument("--publish-fraction", type=float, default=0.05,
+                        help="share of feeds with a new episode before each poll")
+    parser.add_argument("--lookups", type=int, default=20, help="search_and_play lookups")
+    parser.add_argument("--history-depth", type=int, default=const.DEFAULT_HISTORY_DEPTH)
+    parser.add_argument("--episodes", type=int, default=20, help="episodes per feed")
+    parser.add_argument("--description-bytes", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 answers")
+    parser.add_argument("--rate-limit", action="store_true",
+                        help="keep the client's request rate limit (slow with many terms)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-etags", action="store_true",
+                        help="have the mock server send no ETags")
+    parser.add_argument("--output", type=Path, help="write the JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare with")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+    encoded = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(encoded + "\n")
+    else:
+        print(encoded)
+    if args.compare:
+        _compare(json.loads(args.compare.read_text()), results)
+
+
+if __name__ == "__main__":
+    main()
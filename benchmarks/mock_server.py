@@ -0,0 +1,368 @@
+"""Local stand-in for the PodcastIndex endpoints the integration calls.
+
+Serves a deterministic catalogue of feeds named "podcast 1", "podcast 2",
+... with synthetic episodes. Latency, error rate and payload size are
+configurable. Responses carry an ETag and conditional requests for an
+unchanged body get a 304, like a caching proxy would answer. Every request is counted per endpoint along with the
+connections clients opened. ``publish`` adds a new episode to some feeds so
+delta polls have something to find.
+
+Run on its own, the server also answers control requests under /_mock:
+GET /_mock/stats returns the counters, POST /_mock/reset clears them and
+POST /_mock/publish?fraction=0.05 publishes new episodes. These are not
+counted. benchmarks/harness.py runs it this way in a separate process:
+
+    python benchmarks/mock_server.py [--port 8089] [--latency 0.05] [--error-rate 0.01]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import hashlib
+import json
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+
+API_PREFIX = "/api/1.0"
+CONTROL_PREFIX = "/_mock"
+EPISODE_INTERVAL = 7 * 86400  # seconds between the synthetic episodes of a feed
+_SHOW_NOTES = (
+    "<p>Show notes with <a href='https://example.com/links'>links</a>, chapter "
+    "markers and the usual &amp; ever-growing list of sponsors.</p>"
+)
+
+
+class MockPodcastIndex:
+    """A PodcastIndex API served from memory with injectable slowness and errors."""
+
+    def __init__(
+        self,
+        feeds: int = 1000,
+        episodes_per_feed: int = 20,
+        description_bytes: int = 2000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        etags: bool = True,
+    ) -> None:
+        """Initialize the catalogue and the fault injection settings."""
+        self.feeds = feeds
+        self.episodes_per_feed = episodes_per_feed
+        self.description = (_SHOW_NOTES * (description_bytes // len(_SHOW_NOTES) + 1))[
+            :description_bytes
+        ]
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.etags = etags
+        self.requests: Counter[str] = Counter()
+        self.errors = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self.peak_open_connections = 0
+        self._random = random.Random(seed)
+        self._transports: dict[int, asyncio.BaseTransport] = {}
+        self._now = int(time.time())
+        # Publish times of the episodes of each feed, newest first
+        self._published: dict[int, list[int]] = {}
+        for feed_id in range(1, feeds + 1):
+            latest = self._now - self._random.randrange(EPISODE_INTERVAL)
+            self._published[feed_id] = [
+                latest - number * EPISODE_INTERVAL for number in range(episodes_per_feed)
+            ]
+        # (publish time, feed id) of episodes added by publish(), oldest first
+        self._recent: list[tuple[int, int]] = []
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def connections_opened(self) -> int:
+        """Return how many connections clients opened so far."""
+        return len(self._transports)
+
+    @property
+    def open_connections(self) -> int:
+        """Return how many client connections are open right now."""
+        return sum(not t.is_closing() for t in self._transports.values())
+
+    def reset_stats(self) -> None:
+        """Forget the request counters, keeping the catalogue."""
+        self.requests.clear()
+        self.errors = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self.peak_open_connections = self.open_connections
+
+    def publish(self, fraction: float) -> int:
+        """Add a new episode to a random fraction of the feeds; return how many."""
+        self._now = max(self._now + 1, int(time.time()))
+        count = round(self.feeds * fraction)
+        for feed_id in self._random.sample(range(1, self.feeds + 1), count):
+            published = self._published[feed_id]
+            published.insert(0, self._now)
+            del published[self.episodes_per_feed :]
+            self._recent.append((self._now, feed_id))
+        return count
+
+    def feed_id(self, term: str) -> int | None:
+        """Return the feed a search term finds, as the real search would rank it."""
+        digits = "".join(ch for ch in term if ch.isdigit())
+        if digits and 0 < int(digits) <= self.feeds:
+            return int(digits)
+        return None
+
+    def _feed(self, feed_id: int) -> dict[str, Any]:
+        """Return the feed object of a feed."""
+        return {
+            "id": feed_id,
+            "podcastGuid": f"{feed_id:08d}-1111-5000-8000-000000000000",
+            "title": f"Podcast {feed_id}",
+            "url": f"https://feeds.example.com/{feed_id}.xml",
+            "link": f"https://example.com/{feed_id}",
+            "description": self.description,
+            "author": f"Host {feed_id}",
+            "image": f"https://images.example.com/{feed_id}/cover.jpg",
+            "language": "en",
+            "categories": {"102": "Technology"},
+            "lastUpdateTime": self._published[feed_id][0],
+        }
+
+    def _episodes(self, feed_id: int, since: int) -> list[dict[str, Any]]:
+        """Return the episodes of a feed published from since on, newest first."""
+        episodes = []
+        for number, published in enumerate(self._published[feed_id]):
+            if published < since:
+                break
+            episodes.append(
+                {
+                    "id": feed_id * 10_000_000 + published % 10_000_000,
+                    "title": f"Podcast {feed_id} episode published {published}",
+                    "link": f"https://example.com/{feed_id}/{published}",
+                    "description": self.description,
+                    "guid": f"{feed_id}-{published}",
+                    "datePublished": published,
+                    "enclosureUrl": f"https://cdn.example.com/{feed_id}/{published}.mp3",
+                    "enclosureType": "audio/mpeg",
+                    "duration": 3600,
+                    "episode": number,
+                    "season": 1,
+                    "feedId": feed_id,
+                    "feedTitle": f"Podcast {feed_id}",
+                    "feedImage": f"https://images.example.com/{feed_id}/cover.jpg",
+                }
+            )
+        return episodes
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Count the request, then delay or fail it as configured."""
+        if request.path.startswith(CONTROL_PREFIX):
+            return await handler(request)
+        endpoint = request.path.removeprefix(API_PREFIX)
+        self.requests[endpoint] += 1
+        if (transport := request.transport) is not None:
+            self._transports.setdefault(id(transport), transport)
+            self.peak_open_connections = max(
+                self.peak_open_connections, self.open_connections
+            )
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self._random.random() * self.jitter)
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            raise web.HTTPServiceUnavailable(text="Injected error")
+        response = await handler(request)
+        if not isinstance(response, web.Response) or not isinstance(response.body, bytes):
+            return response
+        if self.etags:
+            etag = f'"{hashlib.md5(response.body).hexdigest()}"'
+            if request.headers.get("If-None-Match") == etag:
+                self.not_modified += 1
+                return web.Response(status=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+        self.bytes_sent += len(response.body)
+        return response
+
+    def _ok(self, **data: Any) -> web.Response:
+        """Return a successful API response."""
+        return web.json_response({"status": "true", **data}, dumps=json.dumps)
+
+    async def _search(self, request: web.Request) -> web.Response:
+        """Handle /search/byterm."""
+        feed_id = self.feed_id(request.query.get("q", ""))
+        feeds = [self._feed(feed_id)] if feed_id else []
+        return self._ok(feeds=feeds, count=len(feeds))
+
+    async def _podcast_by_id(self, request: web.Request) -> web.Response:
+        """Handle /podcasts/byfeedid."""
+        feed_id = int(request.query.get("id", "0"))
+        return self._ok(feed=self._feed(feed_id) if feed_id in self._published else [])
+
+    async def _podcast_by_url(self, request: web.Request) -> web.Response:
+        """Handle /podcasts/byfeedurl; unknown URLs are a 400 like upstream."""
+        feed_id = self.feed_id(request.query.get("url", "").rsplit("/", 1)[-1])
+        if feed_id is None:
+            raise web.HTTPBadRequest(text="Feed url not found")
+        return self._ok(feed=self._feed(feed_id))
+
+    async def _podcasts_by_guid(self, request: web.Request) -> web.Response:
+        """Handle POST /podcasts/batch/byguid."""
+        guids = await request.json()
+        feeds = [
+            self._feed(feed_id)
+            for guid in guids
+            if (feed_id := int(guid.split("-", 1)[0] or 0)) in self._published
+        ]
+        return self._ok(feeds=feeds, count=len(feeds))
+
+    async def _episodes_by_id(self, request: web.Request) -> web.Response:
+        """Handle /episodes/byfeedid with one or many comma-separated ids."""
+        feed_ids = [int(i) for i in request.query.get("id", "").split(",") if i.isdigit()]
+        since = int(request.query.get("since", 0))
+        items = sorted(
+            (
+                episode
+                for feed_id in feed_ids
+                if feed_id in self._published
+                for episode in self._episodes(feed_id, since)
+            ),
+            key=lambda episode: episode["datePublished"],
+            reverse=True,
+        )[: int(request.query.get("max", 10))]
+        return self._ok(items=items, count=len(items))
+
+    async def _episodes_by_url(self, request: web.Request) -> web.Response:
+        """Handle /episodes/byfeedurl."""
+        feed_id = self.feed_id(request.query.get("url", "").rsplit("/", 1)[-1])
+        items = self._episodes(feed_id, int(request.query.get("since", 0))) if feed_id else []
+        items = items[: int(request.query.get("max", 10))]
+        return self._ok(items=items, count=len(items))
+
+    async def _recent_data(self, request: web.Request) -> web.Response:
+        """Handle /recent/data, paging through published episodes with nextSince."""
+        since = int(request.query.get("since", 0))
+        page = [entry for entry in self._recent if entry[0] > since][
+            : int(request.query.get("max", 5000))
+        ]
+        items = [
+            {"feedId": feed_id, "episodeAdded": published, "feedTitle": f"Podcast {feed_id}"}
+            for published, feed_id in page
+        ]
+        return self._ok(
+            items=items,
+            feeds=[],
+            count=len(items),
+            nextSince=page[-1][0] if page else since,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the request and connection counters."""
+        return {
+            "requests": dict(self.requests),
+            "errors": self.errors,
+            "not_modified": self.not_modified,
+            "bytes_sent": self.bytes_sent,
+            "connections_opened": self.connections_opened,
+            "peak_open_connections": self.peak_open_connections,
+        }
+
+    async def _control_stats(self, request: web.Request) -> web.Response:
+        """Handle GET /_mock/stats."""
+        return web.json_response(self.stats())
+
+    async def _control_reset(self, request: web.Request) -> web.Response:
+        """Handle POST /_mock/reset."""
+        self.reset_stats()
+        return web.json_response(self.stats())
+
+    async def _control_publish(self, request: web.Request) -> web.Response:
+        """Handle POST /_mock/publish."""
+        published = self.publish(float(request.query.get("fraction", 0.05)))
+        return web.json_response({"published": published})
+
+    def make_app(self) -> web.Application:
+        """Return the aiohttp application serving the mock API."""
+        app = web.Application(middlewares=[self._middleware])
+        app.add_routes(
+            [
+                web.get(f"{API_PREFIX}/search/byterm", self._search),
+                web.get(f"{API_PREFIX}/podcasts/byfeedid", self._podcast_by_id),
+                web.get(f"{API_PREFIX}/podcasts/byfeedurl", self._podcast_by_url),
+                web.post(f"{API_PREFIX}/podcasts/batch/byguid", self._podcasts_by_guid),
+                web.get(f"{API_PREFIX}/episodes/byfeedid", self._episodes_by_id),
+                web.get(f"{API_PREFIX}/episodes/byfeedurl", self._episodes_by_url),
+                web.get(f"{API_PREFIX}/recent/data", self._recent_data),
+                web.get(f"{CONTROL_PREFIX}/stats", self._control_stats),
+                web.post(f"{CONTROL_PREFIX}/reset", self._control_reset),
+                web.post(f"{CONTROL_PREFIX}/publish", self._control_publish),
+            ]
+        )
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL to give the API client."""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        return f"http://{host}:{bound_port}{API_PREFIX}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Serve until interrupted."""
+    server = MockPodcastIndex(
+        feeds=args.feeds,
+        episodes_per_feed=args.episodes,
+        description_bytes=args.description_bytes,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        etags=not args.no_etags,
+    )
+    base_url = await server.start(port=args.port)
+    print(f"Serving the mock PodcastIndex API at {base_url}", flush=True)
+    try:
+        while True:
+            if args.publish_interval > 0:
+                await asyncio.sleep(args.publish_interval)
+                server.publish(args.publish_fraction)
+            else:
+                await asyncio.sleep(3600)
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Run the mock server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--feeds", type=int, default=1000)
+    parser.add_argument("--episodes", type=int, default=20, help="episodes per feed")
+    parser.add_argument("--description-bytes", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 answers")
+    parser.add_argument("--publish-interval", type=float, default=60.0,
+                        help="seconds between new episodes, 0 to publish on request only")
+    parser.add_argument("--publish-fraction", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-etags", action="store_true", help="send no ETags")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
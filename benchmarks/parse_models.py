@@ -0,0 +1,179 @@
+"""Compare response parsing before and after selective decoding.
+
+"before" decodes the whole body with the standard library and copies the
+used fields into dicts, as the client did originally. "after" uses
+models.decode_response, which only materializes the used fields with
+msgspec, and models.parse_episode like the client does now. The script
+reports the parse time per response, the peak memory while parsing, and
+the memory kept per tracked feed for its latest episode.
+
+Runs without Home Assistant:
+
+    python benchmarks/parse_models.py [--feeds 25] [--episodes 40] [--rounds 50]
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+_MODELS_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "podcast_index"
+    / "models.py"
+)
+_spec = importlib.util.spec_from_file_location("podcast_index_models", _MODELS_PATH)
+models = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = models
+_spec.loader.exec_module(models)
+
+
+def _api_episode(feed_id: int, number: int) -> dict[str, Any]:
+    """Return an episode object shaped like a real /episodes/byfeedid item."""
+    return {
+        "id": feed_id * 1000 + number,
+        "title": f"Episode {number}: Local control all the things",
+        "link": f"https://example.com/{feed_id}/episodes/{number}",
+        "description": "<p>Show notes with <a href='https://example.com'>links</a>.</p>" * 40,
+        "guid": f"urn:uuid:{feed_id:08d}-0000-4000-8000-{number:012d}",
+        "datePublished": 1_700_000_000 - number * 604_800,
+        "datePublishedPretty": "November 14, 2023 10:13pm",
+        "dateCrawled": 1_700_000_500,
+        "enclosureUrl": f"https://cdn.example.com/{feed_id}/episode-{number}.mp3",
+        "enclosureType": "audio/mpeg",
+        "enclosureLength": 58_000_000,
+        "duration": 3725,
+        "explicit": 0,
+        "episode": number,
+        "episodeType": "full",
+        "season": 3,
+        "image": f"https://images.example.com/{feed_id}/episode-{number}.jpg",
+        "feedItunesId": 1_234_567,
+        "feedUrl": f"https://feeds.example.com/{feed_id}.xml",
+        "feedImage": f"https://images.example.com/{feed_id}/cover.jpg",
+        "feedId": feed_id,
+        "podcastGuid": f"{feed_id:08d}-1111-5000-8000-000000000000",
+        "feedLanguage": "en",
+        "feedDead": 0,
+        "feedDuplicateOf": None,
+        "chaptersUrl": f"https://example.com/{feed_id}/chapters/{number}.json",
+        "transcriptUrl": f"https://example.com/{feed_id}/transcripts/{number}.srt",
+        "transcripts": [
+            {"url": f"https://example.com/{feed_id}/transcripts/{number}.{kind}", "type": kind}
+            for kind in ("srt", "vtt", "json")
+        ],
+        "persons": [
+            {
+                "id": person,
+                "name": f"Host {person}",
+                "role": "host",
+                "group": "cast",
+                "href": f"https://example.com/people/{person}",
+                "img": f"https://example.com/people/{person}.jpg",
+            }
+            for person in range(3)
+        ],
+        "soundbite": {"startTime": 120, "duration": 30, "title": "Best bit"},
+        "value": {
+            "model": {"type": "lightning", "method": "keysend", "suggested": "0.00000005000"},
+            "destinations": [
+                {"name": f"Host {person}", "address": "03ae9f91a0cb8ff43840e3c322c4c61f019d8c1c3cea15a25cfc425ac605e61a4a", "type": "node", "split": 45}
+                for person in range(3)
+            ],
+        },
+    }
+
+
+def _response(feeds: int, episodes: int) -> bytes:
+    """Return an encoded batched episodes response."""
+    items = [
+        _api_episode(feed_id, number)
+        for number in range(episodes)
+        for feed_id in range(1, feeds + 1)
+    ]
+    return json.dumps(
+        {"status": "true", "items": items, "count": len(items), "description": "Found matching items."}
+    ).encode()
+
+
+def _parse_before(body: bytes) -> dict[str, dict[str, Any]]:
+    """Parse the latest episode per feed the way the client used to."""
+    latest: dict[str, dict[str, Any]] = {}
+    for episode in json.loads(body).get("items") or []:
+        feed_id = str(episode.get("feedId", ""))
+        if feed_id and feed_id not in latest:
+            latest[feed_id] = {
+                "title": episode.get("title", ""),
+                "description": episode.get("description", ""),
+                "publish_date": episode.get("datePublished", 0),
+                "duration": episode.get("duration", 0),
+                "audio_url": episode.get("enclosureUrl", ""),
+                "podcast_title": episode.get("feedTitle", ""),
+                "episode_number": episode.get("episode", None),
+                "season_number": episode.get("season", None),
+                "guid": episode.get("guid", ""),
+                "link": episode.get("link", ""),
+            }
+    return latest
+
+
+def _parse_after(body: bytes) -> dict[str, dict[str, Any]]:
+    """Parse the latest episode per feed with selective decoding."""
+    latest: dict[str, dict[str, Any]] = {}
+    for episode in models.decode_response(body).get("items") or []:
+        feed_id = str(episode.get("feedId", ""))
+        if feed_id and feed_id not in latest:
+            latest[feed_id] = models.parse_episode(episode)
+    return latest
+
+
+def _time_per_call(parse: Callable[[bytes], Any], body: bytes, rounds: int) -> float:
+    """Return the mean parse time in milliseconds."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        parse(body)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def _memory(parse: Callable[[bytes], Any], body: bytes, feeds: int) -> tuple[int, float]:
+    """Return the peak bytes while parsing and the bytes kept per feed."""
+    tracemalloc.start()
+    result = parse(body)
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, kept / feeds
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=25)
+    parser.add_argument("--episodes", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    body = _response(args.feeds, args.episodes)
+    results: dict[str, Any] = {
+        "msgspec": models.msgspec.__version__,
+        "response_bytes": len(body),
+        "items": args.feeds * args.episodes,
+    }
+    for label, parse in (("before", _parse_before), ("after", _parse_after)):
+        peak, per_feed = _memory(parse, body, args.feeds)
+        results[label] = {
+            "parse_ms": round(_time_per_call(parse, body, args.rounds), 2),
+            "peak_parse_kib": round(peak / 1024, 1),
+            "kept_per_feed_bytes": round(per_feed),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,298 @@
 """The PodcastIndex integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
+import io
 import logging
-from typing import Any
+import time
+from typing import Any, TypeVar
 from datetime import timedelta
+from pathlib import Path
+from xml.etree.ElementTree import ParseError
 
+import aiohttp
+from homeassistant.components.http import StaticPathConfig
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY, CONF_NAME, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import (
+    CONF_API_KEY,
+    CONF_NAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.data_entry_flow import FlowResultType
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_API_SECRET,
     CONF_SEARCH_OR_ID,
+    DATA_API,
+    DATA_API_UNSUB_CLOSE,
+    DATA_API_USERS,
+    DATA_RESOLUTION_CACHE,
+    DATA_SCHEDULER,
+    DATA_EPISODE_INDEX,
+    DATA_RESPONSE_STORE,
+    DATA_AUDIO_PREFETCHER,
+    DATA_ARTWORK_CACHE,
+    DATA_ARTWORK_PATH_REGISTERED,
+    ARTWORK_DIRECTORY,
+    ARTWORK_URL_PATH,
+    EPISODE_INDEX_FILE,
+    EPISODE_INDEX_MAX_AGE,
+    EPISODE_INDEX_MAX_EPISODES,
+    ADAPTIVE_HISTORY_SIZE,
+    CONF_BACKGROUND_SETUP,
+    CONF_HISTORY_DEPTH,
+    CONF_PERSIST_RESPONSES,
+    CONF_DIRECT_FEEDS,
+    CONF_RESOLVE_ENCLOSURES,
+    CONF_PREFETCH_AUDIO,
+    CONF_CACHE_ARTWORK,
+    CONF_SETUP_CONCURRENCY,
+    DEFAULT_BACKGROUND_SETUP,
+    DEFAULT_HISTORY_DEPTH,
+    DEFAULT_PERSIST_RESPONSES,
+    DEFAULT_DIRECT_FEEDS,
+    DEFAULT_RESOLVE_ENCLOSURES,
+    DEFAULT_PREFETCH_AUDIO,
+    DEFAULT_CACHE_ARTWORK,
+    DEFAULT_SETUP_CONCURRENCY,
     DOMAIN,
+    EVENT_OPML_IMPORT_PROGRESS,
+    REQUEST_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SYNC_MODE,
+    CONF_SYNC_MODE,
+    SYNC_MODE_BATCHED,
+    SYNC_MODE_DELTA,
+    SYNC_MODE_ADAPTIVE,
+    SYNC_MODE_PER_TERM,
+)
+from .artwork import ArtworkCache
+from .coordinator import (
+    PodcastIndexBatchCoordinator,
+    PodcastIndexDeltaCoordinator,
+    PodcastIndexTermCoordinator,
+    async_resolve_term,
 )
+from .enclosures import EnclosureResolver
+from .episode_index import EpisodeIndex
+from .history import EpisodeRecord
+from .opml import OpmlFeed, iter_opml_feeds, podcast_guid
 from .podcast_index_api import PodcastIndexAPI
+from .prefetch import AudioPrefetcher
+from .resolution_cache import ResolutionCache
+from .response_store import ResponseCacheStore
+from .scheduler import AdaptivePollScheduler
+from .sensor import sensor_unique_id
+from .snapshot import EpisodeSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the services that aren't tied to one config entry.
+
+    They are registered once and look up the loaded entries and the shared
+    caches when called, so unloading an entry leaves nothing behind.
+    """
+    hass.data.setdefault(DOMAIN, {})
+
+    async def async_import_opml(call: ServiceCall) -> ServiceResponse:
+        """Track every feed of an OPML subscription list."""
+        path = call.data.get("path")
+        content = call.data.get("content")
+        target_entry_id = call.data.get("entry_id")
+
+        if not path and not content:
+            raise HomeAssistantError("Provide the path or the content of an OPML file")
+
+        # Any loaded entry can be targeted; the first one is the default
+        target_entry = (
+            hass.config_entries.async_get_entry(target_entry_id)
+            if target_entry_id
+            else next(
+                (
+                    config_entry
+                    for config_entry in hass.config_entries.async_entries(DOMAIN)
+                    if config_entry.entry_id in hass.data[DOMAIN]
+                ),
+                None,
+            )
+        )
+        if target_entry is None or target_entry.entry_id not in hass.data[DOMAIN]:
+            raise HomeAssistantError(f"Integration entry '{target_entry_id}' is not loaded")
+
+        if path:
+            # Relative paths are read from the configuration directory
+            full_path = Path(hass.config.path(path)).resolve()
+            if not (
+                full_path.is_relative_to(Path(hass.config.config_dir).resolve())
+                or hass.config.is_allowed_path(str(full_path))
+            ):
+                raise HomeAssistantError(f"Access to {path} is not allowed")
+
+        def _read_feeds() -> list[OpmlFeed]:
+            """Stream-parse the OPML file."""
+            if path:
+                with open(full_path, "rb") as file:
+                    return list(iter_opml_feeds(file))
+            return list(iter_opml_feeds(io.BytesIO(content.encode())))
+
+        try:
+            feeds = await hass.async_add_executor_job(_read_feeds)
+        except (OSError, ParseError) as ex:
+            raise HomeAssistantError(f"Failed to read OPML file: {ex}") from ex
+        _LOGGER.info("Importing %d feeds from OPML", len(feeds))
+        return await _async_import_opml(hass, target_entry, feeds)
+
+    async def async_prune_episode_index(call: ServiceCall) -> ServiceResponse:
+        """Drop old episodes from the local index and cap its size."""
+        max_age_days = call.data.get("max_age_days")
+        max_episodes = call.data.get("max_episodes")
+        if (episode_index := hass.data[DOMAIN].get(DATA_EPISODE_INDEX)) is None:
+            raise HomeAssistantError("No PodcastIndex integration entry has been loaded")
+        removed = await hass.async_add_executor_job(
+            episode_index.prune,
+            float(max_age_days) * 86400 if max_age_days else EPISODE_INDEX_MAX_AGE,
+            int(max_episodes) if max_episodes else EPISODE_INDEX_MAX_EPISODES,
+        )
+        _LOGGER.info("Pruned %d episode(s) from the local index", removed)
+        return {"removed": removed}
+
+    async def async_clear_resolution_cache(call: ServiceCall) -> None:
+        """Forget cached term resolutions so they are searched again."""
+        search_term = call.data.get("search_term")
+        if search_term is not None:
+            search_term = search_term.strip()
+        if (resolution_cache := hass.data[DOMAIN].get(DATA_RESOLUTION_CACHE)) is None:
+            return
+        count = resolution_cache.async_invalidate(search_term or None)
+        _LOGGER.info("Cleared %d cached term resolution(s)", count)
+
+    async def async_get_poll_schedule(call: ServiceCall) -> ServiceResponse:
+        """Return when each adaptively scheduled feed polls next, and why."""
+        scheduler: AdaptivePollScheduler | None = hass.data[DOMAIN].get(DATA_SCHEDULER)
+        if scheduler is None:
+            return {"feeds": []}
+        return {"feeds": scheduler.as_dict(call.data.get("entry_id"))}
+
+    async def async_get_recent_episodes(call: ServiceCall) -> ServiceResponse:
+        """Return the recent episodes kept in the history of every tracked feed."""
+        target_entry_id = call.data.get("entry_id")
+        search_term = (call.data.get("search_term") or "").strip().lower()
+        limit = call.data.get("limit")
+        since = call.data.get("since")
+        if since is not None:
+            since_datetime = dt_util.parse_datetime(str(since))
+            if since_datetime is None:
+                raise HomeAssistantError(f"Invalid since date: {since}")
+            if since_datetime.tzinfo is None:
+                since_datetime = since_datetime.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+            since = int(since_datetime.timestamp())
+
+        feeds = []
+        for config_entry in hass.config_entries.async_entries(DOMAIN):
+            if target_entry_id not in (None, config_entry.entry_id):
+                continue
+            if (entry_data := hass.data[DOMAIN].get(config_entry.entry_id)) is None:
+                continue
+            for term, coordinator in entry_data["coordinators"].items():
+                podcast_title = (coordinator.data or {}).get("podcast_title", "")
+                if search_term and search_term not in (term.lower(), podcast_title.lower()):
+                    continue
+                feeds.append({
+                    "entry_id": config_entry.entry_id,
+                    "search_term": term,
+                    "podcast_title": podcast_title,
+                    "episodes": [
+                        _episode_record_as_dict(record)
+                        for record in coordinator.history.recent(
+                            int(limit) if limit else None, since
+                        )
+                    ],
+                })
+        return {"feeds": feeds}
+
+    async def async_get_episode_details(call: ServiceCall) -> ServiceResponse:
+        """Return the full latest episode of tracked feeds, show notes included."""
+        target_entry_id = call.data.get("entry_id")
+        search_term = (call.data.get("search_term") or "").strip().lower()
+        episodes = []
+        for config_entry in hass.config_entries.async_entries(DOMAIN):
+            if target_entry_id not in (None, config_entry.entry_id):
+                continue
+            if (entry_data := hass.data[DOMAIN].get(config_entry.entry_id)) is None:
+                continue
+            for term, coordinator in entry_data["coordinators"].items():
+                if not (episode := coordinator.data):
+                    continue
+                podcast_title = episode.get("podcast_title", "")
+                if search_term and search_term not in (term.lower(), podcast_title.lower()):
+                    continue
+                episodes.append({"entry_id": config_entry.entry_id, **episode})
+        return {"episodes": episodes}
+
+    hass.services.async_register(
+        DOMAIN,
+        "import_opml",
+        async_import_opml,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN, "clear_resolution_cache", async_clear_resolution_cache
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "prune_episode_index",
+        async_prune_episode_index,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_poll_schedule",
+        async_get_poll_schedule,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_recent_episodes",
+        async_get_recent_episodes,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_episode_details",
+        async_get_episode_details,
+        supports_response=SupportsResponse.ONLY,
+    )
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up PodcastIndex from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -54,80 +323,314 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Split comma-separated list, strip whitespace, remove empty
     search_or_id_list = [s.strip() for s in search_or_id_raw.split(",") if s.strip()]
 
+    # All entries and coordinators share one client and its connection pool
+    api = _async_get_shared_api(hass, entry, api_key, api_secret)
+    if entry.options.get(CONF_PERSIST_RESPONSES, DEFAULT_PERSIST_RESPONSES):
+        await _async_persist_responses(hass, api)
+
+    sync_mode = entry.options.get(CONF_SYNC_MODE, DEFAULT_SYNC_MODE)
+
     # Store API and coordinators per term/id
     hass.data[DOMAIN][entry.entry_id] = {
-        "api": PodcastIndexAPI(api_key, api_secret, None),  # None, will be set per call
+        "api": api,
         "name": name,
         "coordinators": {},
+        "batch_coordinator": None,
+        "enclosure_resolver": None,
+        "audio_prefetcher": None,
+        "artwork_cache": None,
         "search_or_id_list": search_or_id_list,
+        "options": dict(entry.options),
     }
 
-    # Create a DataUpdateCoordinator for each term/id
+    # Term resolutions are shared by all entries and survive restarts
+    resolution_cache = await _async_get_resolution_cache(hass)
+    episode_index = await _async_get_episode_index(hass)
+
+    # Create a coordinator for each term/id. In batched and delta mode they
+    # don't poll themselves; the entry-level coordinator pushes data into them.
+    # In adaptive mode the scheduler decides when each of them refreshes.
+    entry_polling = sync_mode in (SYNC_MODE_BATCHED, SYNC_MODE_DELTA)
+    coordinators = hass.data[DOMAIN][entry.entry_id]["coordinators"]
     for term in search_or_id_list:
-        api = PodcastIndexAPI(api_key, api_secret, term)
-        coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name=f"{name} {term} Latest Episode",
-            update_method=lambda t=term, a=api: a.get_latest_episode(t),
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        coordinators[term] = _create_term_coordinator(
+            hass, entry, api, resolution_cache, name, term
+        )
+
+    # Seed the sensors with the last known episodes so they have a state
+    # right away, then keep the snapshot current as new data comes in.
+    snapshot = EpisodeSnapshot(hass, entry.entry_id)
+    hass.data[DOMAIN][entry.entry_id]["snapshot"] = snapshot
+    restored = await snapshot.async_restore(coordinators)
+    for coordinator in coordinators.values():
+        snapshot.async_track(coordinator)
+    entry.async_on_unload(snapshot.async_stop)
+
+    # Follow the enclosures' tracking redirects before anyone presses play
+    if entry.options.get(CONF_RESOLVE_ENCLOSURES, DEFAULT_RESOLVE_ENCLOSURES):
+        enclosure_resolver = EnclosureResolver(hass, api, entry.entry_id)
+        hass.data[DOMAIN][entry.entry_id]["enclosure_resolver"] = enclosure_resolver
+        for coordinator in coordinators.values():
+            enclosure_resolver.async_track(coordinator)
+        entry.async_on_unload(enclosure_resolver.async_stop)
+
+    # Download new episodes so playback doesn't depend on the CDN
+    if entry.options.get(CONF_PREFETCH_AUDIO, DEFAULT_PREFETCH_AUDIO) and (
+        prefetcher := await _async_get_audio_prefetcher(hass, api)
+    ) is not None:
+        hass.data[DOMAIN][entry.entry_id]["audio_prefetcher"] = prefetcher
+        for coordinator in coordinators.values():
+            prefetcher.async_track(entry.entry_id, coordinator)
+        entry.async_on_unload(lambda: prefetcher.async_stop(entry.entry_id))
+
+    # Serve small local thumbnails instead of the publishers' full-size artwork
+    if entry.options.get(CONF_CACHE_ARTWORK, DEFAULT_CACHE_ARTWORK):
+        artwork_cache = await _async_get_artwork_cache(hass, api, resolution_cache)
+        hass.data[DOMAIN][entry.entry_id]["artwork_cache"] = artwork_cache
+        for coordinator in coordinators.values():
+            artwork_cache.async_track(entry.entry_id, coordinator)
+        entry.async_on_unload(lambda: artwork_cache.async_stop(entry.entry_id))
+
+    scheduler: AdaptivePollScheduler | None = None
+    if sync_mode == SYNC_MODE_ADAPTIVE:
+        scheduler = hass.data[DOMAIN].setdefault(
+            DATA_SCHEDULER, AdaptivePollScheduler(hass)
+        )
+        entry.async_on_unload(lambda: scheduler.async_remove(entry.entry_id))
+
+    # First refreshes run concurrently, at most setup_concurrency at a time.
+    # Setup only waits for coordinators that have nothing to show yet; ones
+    # restored from the snapshot, or all of them with background_setup,
+    # refresh after the entry has finished loading.
+    concurrency = entry.options.get(CONF_SETUP_CONCURRENCY, DEFAULT_SETUP_CONCURRENCY)
+    background = entry.options.get(CONF_BACKGROUND_SETUP, DEFAULT_BACKGROUND_SETUP)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _async_first_refresh(
+        coordinator: DataUpdateCoordinator, blocking: bool
+    ) -> None:
+        """Run a coordinator's first refresh within the concurrency limit."""
+        async with semaphore:
+            if blocking:
+                await coordinator.async_config_entry_first_refresh()
+            else:
+                await coordinator.async_refresh()
+
+    async def _async_first_refresh_term(
+        coordinator: PodcastIndexTermCoordinator, blocking: bool
+    ) -> None:
+        """Refresh a term and hand it to the scheduler once its history is known."""
+        if scheduler is not None:
+            # Learn the release pattern from the first response
+            coordinator.seed_episodes = ADAPTIVE_HISTORY_SIZE
+        await _async_first_refresh(coordinator, blocking)
+        if scheduler is not None:
+            scheduler.async_add(entry.entry_id, coordinator)
+
+    if entry_polling:
+        coordinator_class = (
+            PodcastIndexDeltaCoordinator
+            if sync_mode == SYNC_MODE_DELTA
+            else PodcastIndexBatchCoordinator
+        )
+        batch_coordinator = coordinator_class(
+            hass, api, resolution_cache, name, coordinators, concurrency
+        )
+        # Restored episodes are the baseline for incremental fetches and the
+        # fallback if the first poll fails
+        batch_coordinator.data = {term: coordinators[term].data for term in restored}
+        entry.async_on_unload(
+            batch_coordinator.async_add_listener(batch_coordinator.async_fan_out)
+        )
+        hass.data[DOMAIN][entry.entry_id]["batch_coordinator"] = batch_coordinator
+        refresh = _async_first_refresh
+        batched = {term for term, c in coordinators.items() if not c.direct_feed}
+        warm = {
+            batch_coordinator: batched <= restored,
+            # Direct feeds poll on their own, next to the entry coordinator
+            **{
+                coordinator: term in restored
+                for term, coordinator in coordinators.items()
+                if coordinator.direct_feed
+            },
+        }
+    else:
+        refresh = _async_first_refresh_term
+        warm = {coordinator: term in restored for term, coordinator in coordinators.items()}
+
+    cold = [coordinator for coordinator, is_warm in warm.items() if not (background or is_warm)]
+    if cold:
+        results = await asyncio.gather(
+            *(refresh(coordinator, True) for coordinator in cold), return_exceptions=True
+        )
+        if errors := [result for result in results if isinstance(result, BaseException)]:
+            hass.data[DOMAIN].pop(entry.entry_id)
+            await _async_release_shared_api(hass, entry)
+            raise errors[0]
+
+    if deferred := [coordinator for coordinator in warm if coordinator not in cold]:
+        async def _async_refresh_deferred() -> None:
+            """Bring restored or background coordinators up to date."""
+            await asyncio.gather(*(refresh(coordinator, False) for coordinator in deferred))
+
+        entry.async_create_background_task(
+            hass, _async_refresh_deferred(), f"{DOMAIN} first refresh {entry.title}"
         )
-        await coordinator.async_config_entry_first_refresh()
-        hass.data[DOMAIN][entry.entry_id]["coordinators"][term] = coordinator
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     # Register services
-    async def async_search_and_play(call: ServiceCall) -> None:
-        """Search for a podcast and play its latest episode."""
+    async def async_search_and_play(call: ServiceCall) -> ServiceResponse:
+        """Search for a podcast and play its latest episode.
+
+        The episode comes from a coordinator that already tracks the term,
+        or from a single episodes request for a cached resolution, and is
+        looked up while the speaker is being prepared. The response reports
+        how long each step took.
+        """
         entity_id = call.data.get("entity_id")
         search_term = call.data.get("search_term")
         volume = call.data.get("volume")
         
         if not entity_id:
             _LOGGER.error("No entity_id provided")
-            return
+            return {"played": False}
         if not search_term:
             _LOGGER.error("No search_term provided")
-            return
+            return {"played": False}
             
         # Use the API for this entry
         api = hass.data[DOMAIN][entry.entry_id]["api"]
-        try:
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+
+        async def _async_timed(step: str, coro: Awaitable[_T]) -> _T:
+            """Await a step and record its duration in milliseconds."""
+            step_started = time.perf_counter()
+            try:
+                return await coro
+            finally:
+                timings[step] = round((time.perf_counter() - step_started) * 1000, 1)
+
+        async def _async_prepare_speaker() -> None:
+            """Unjoin the speaker and set its volume.
+
+            Failures are logged and don't stop playback; players without
+            grouping support, for one, reject the unjoin.
+            """
             # First, unjoin all speakers
-            await hass.services.async_call(
-                "media_player",
-                "unjoin",
-                {"entity_id": entity_id},
-            )
-            _LOGGER.info("Unjoined speakers for %s", entity_id)
+            try:
+                await _async_timed(
+                    "unjoin",
+                    hass.services.async_call(
+                        "media_player",
+                        "unjoin",
+                        {"entity_id": entity_id},
+                        blocking=True,
+                    ),
+                )
+                _LOGGER.info("Unjoined speakers for %s", entity_id)
+            except Exception as ex:
+                _LOGGER.debug("Could not unjoin %s, playing anyway: %s", entity_id, ex)
             
             # Set volume if provided
             if volume is not None:
-                await hass.services.async_call(
+                try:
+                    await _async_timed(
+                        "volume_set",
+                        hass.services.async_call(
+                            "media_player",
+                            "volume_set",
+                            {
+                                "entity_id": entity_id,
+                                "volume_level": volume / 100.0,  # Convert percentage to 0-1 scale
+                            },
+                            blocking=True,
+                        ),
+                    )
+                    _LOGGER.info("Set volume to %s%% for %s", volume, entity_id)
+                except Exception as ex:
+                    _LOGGER.warning("Could not set the volume of %s: %s", entity_id, ex)
+
+        async def _async_find_episode() -> tuple[dict[str, Any] | None, str]:
+            """Find the latest episode, preferring data that is already known.
+
+            The local episode index is only asked when the API can't be
+            reached or finds nothing, so it never overrides a real match.
+            """
+            if (episode := _async_find_tracked_episode(hass, search_term)) is not None:
+                return episode, "coordinator"
+            source = "search"
+            try:
+                podcast, cached = await async_resolve_term(api, resolution_cache, search_term)
+                if cached:
+                    source = "resolution_cache"
+                if podcast:
+                    episode = await api.get_latest_episode_for_podcast(podcast, search_term)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                local, _match = await episode_index.async_search(search_term)
+                if local is None:
+                    raise
+                _LOGGER.debug("Using the local episode index, the API failed: %s", ex)
+                return local, "local_index"
+            if episode is None:
+                # A show name or what an episode is about, from local data
+                local, _match = await episode_index.async_search(search_term)
+                if local is not None:
+                    return local, "local_index"
+            return episode, source
+
+        try:
+            _, (episode, source) = await asyncio.gather(
+                _async_prepare_speaker(),
+                _async_timed("lookup", _async_find_episode()),
+            )
+            if not episode or not episode.get("audio_url"):
+                _LOGGER.error("No audio URL found for search term: %s", search_term)
+                return {"played": False, "source": source, "timings_ms": timings}
+            audio_url = episode["audio_url"]
+            entry_data = hass.data[DOMAIN][entry.entry_id]
+            if (prefetcher := entry_data["audio_prefetcher"]) is not None and (
+                local_media_id := prefetcher.local_media_id(audio_url)
+            ) is not None:
+                # Play the downloaded copy; the CDN isn't needed at all
+                prefetcher.async_touch(audio_url)
+                audio_url = local_media_id
+            elif (enclosure_resolver := entry_data["enclosure_resolver"]) is not None:
+                # Skip the tracking redirects if they were already followed
+                audio_url = enclosure_resolver.get(audio_url) or audio_url
+            await _async_timed(
+                "play_media",
+                hass.services.async_call(
                     "media_player",
-                    "volume_set",
+                    "play_media",
                     {
                         "entity_id": entity_id,
-                        "volume_level": volume / 100.0,  # Convert percentage to 0-1 scale
+                        "media_content_id": audio_url,
+                        "media_content_type": "music",
                     },
-                )
-                _LOGGER.info("Set volume to %s%% for %s", volume, entity_id)
-            
-            episode = await api.get_latest_episode(search_term)
-            if not episode or not episode.get("audio_url"):
-                _LOGGER.error("No audio URL found for search term: %s", search_term)
-                return
-            await hass.services.async_call(
-                "media_player",
-                "play_media",
-                {
-                    "entity_id": entity_id,
-                    "media_content_id": episode["audio_url"],
-                    "media_content_type": "music",
-                },
+                    blocking=True,
+                ),
             )
-            _LOGGER.info("Playing latest episode for '%s' on %s", search_term, entity_id)
+            timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+            _LOGGER.info(
+                "Playing latest episode for '%s' on %s (episode from %s, timings in ms: %s)",
+                search_term,
+                entity_id,
+                source,
+                timings,
+            )
+            return {
+                "played": True,
+                "title": episode.get("title", ""),
+                "podcast_title": episode.get("podcast_title", ""),
+                "audio_url": audio_url,
+                "source": source,
+                "timings_ms": timings,
+            }
         except Exception as ex:
             _LOGGER.error("Failed to search and play episode: %s", ex)
+            return {"played": False, "timings_ms": timings}
 
     async def async_add_search_term(call: ServiceCall) -> None:
         """Add a new search term to the existing configuration."""
@@ -143,37 +646,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error("Empty search term provided")
             return
         
-        # Check if this service call is meant for this entry
-        if target_entry_id and target_entry_id != entry.entry_id:
-            # This service call is not meant for this entry, ignore it
+        # Any loaded entry can be targeted; the registering one is the default
+        target_entry = hass.config_entries.async_get_entry(target_entry_id or entry.entry_id)
+        if target_entry is None or target_entry.entry_id not in hass.data[DOMAIN]:
+            _LOGGER.error("Integration entry '%s' is not loaded", target_entry_id)
             return
         
         # Check if term already exists
-        entry_name = hass.data[DOMAIN][entry.entry_id]["name"]
-        if search_term in hass.data[DOMAIN][entry.entry_id]["search_or_id_list"]:
+        entry_data = hass.data[DOMAIN][target_entry.entry_id]
+        entry_name = entry_data["name"]
+        if search_term in entry_data["search_or_id_list"]:
             _LOGGER.warning("Search term '%s' already exists in integration '%s'", search_term, entry_name)
             return
             
         try:
-            # Test the API connection with the new term
-            api = PodcastIndexAPI(api_key, api_secret, search_term)
-            await api.test_connection()
-            await api.close()
-            
-            # Get current search terms and add the new one
-            current_terms = hass.data[DOMAIN][entry.entry_id]["search_or_id_list"]
-            new_terms = current_terms + [search_term]
-            
-            # Update the config entry with the new search terms
-            new_data = entry.data.copy()
-            new_data[CONF_SEARCH_OR_ID] = ", ".join(new_terms)
-            
-            hass.config_entries.async_update_entry(entry, data=new_data)
-            
-            # Reload the integration to pick up the new search term
-            await hass.config_entries.async_reload(entry.entry_id)
-            
-            _LOGGER.info("Added new search term '%s' to integration '%s' and reloaded", search_term, entry_name)
+            await _async_add_term(hass, target_entry, search_term)
+            _LOGGER.info("Added new search term '%s' to integration '%s'", search_term, entry_name)
                 
         except Exception as ex:
             _LOGGER.error("Failed to add search term '%s': %s", search_term, ex)
@@ -192,42 +680,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error("Empty search term provided")
             return
         
-        # Check if this service call is meant for this entry
-        if target_entry_id and target_entry_id != entry.entry_id:
-            # This service call is not meant for this entry, ignore it
+        # Any loaded entry can be targeted; the registering one is the default
+        target_entry = hass.config_entries.async_get_entry(target_entry_id or entry.entry_id)
+        if target_entry is None or target_entry.entry_id not in hass.data[DOMAIN]:
+            _LOGGER.error("Integration entry '%s' is not loaded", target_entry_id)
             return
         
         # Check if term exists
-        entry_name = hass.data[DOMAIN][entry.entry_id]["name"]
-        if search_term not in hass.data[DOMAIN][entry.entry_id]["search_or_id_list"]:
+        entry_data = hass.data[DOMAIN][target_entry.entry_id]
+        entry_name = entry_data["name"]
+        if search_term not in entry_data["search_or_id_list"]:
             _LOGGER.warning("Search term '%s' does not exist in integration '%s'", search_term, entry_name)
             return
+
+        if len(entry_data["search_or_id_list"]) == 1:
+            _LOGGER.error("Cannot remove the last search term. At least one search term is required.")
+            return
             
         try:
-            # Get current search terms and remove the specified one
-            current_terms = hass.data[DOMAIN][entry.entry_id]["search_or_id_list"]
-            new_terms = [term for term in current_terms if term != search_term]
-            
-            if not new_terms:
-                _LOGGER.error("Cannot remove the last search term. At least one search term is required.")
-                return
-            
-            # Update the config entry with the new search terms
-            new_data = entry.data.copy()
-            new_data[CONF_SEARCH_OR_ID] = ", ".join(new_terms)
-            
-            hass.config_entries.async_update_entry(entry, data=new_data)
-            
-            # Reload the integration to pick up the changes
-            await hass.config_entries.async_reload(entry.entry_id)
-            
-            _LOGGER.info("Removed search term '%s' from integration '%s' and reloaded", search_term, entry_name)
+            await _async_remove_term(hass, target_entry, search_term)
+            _LOGGER.info("Removed search term '%s' from integration '%s'", search_term, entry_name)
                 
         except Exception as ex:
             _LOGGER.error("Failed to remove search term '%s': %s", search_term, ex)
 
     hass.services.async_register(
-        DOMAIN, "search_and_play", async_search_and_play
+        DOMAIN,
+        "search_and_play",
+        async_search_and_play,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     
     hass.services.async_register(
@@ -246,8 +727,434 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
         hass.services.async_remove(DOMAIN, "search_and_play")
+        await _async_release_shared_api(hass, entry)
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the episode snapshot of a removed config entry."""
+    await EpisodeSnapshot(hass, entry.entry_id).async_remove()
+
+def _create_term_coordinator(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    api: PodcastIndexAPI,
+    cache: ResolutionCache,
+    name: str,
+    term: str,
+) -> PodcastIndexTermCoordinator:
+    """Create the coordinator of one search term or podcast id.
+
+    Only in per_term mode does it poll on its own, and for direct feeds in
+    batched and delta mode.
+    """
+    sync_mode = entry.options.get(CONF_SYNC_MODE, DEFAULT_SYNC_MODE)
+    direct_feed = term in _direct_feeds(entry)
+    self_polling = sync_mode == SYNC_MODE_PER_TERM or (
+        direct_feed and sync_mode in (SYNC_MODE_BATCHED, SYNC_MODE_DELTA)
+    )
+    return PodcastIndexTermCoordinator(
+        hass,
+        api,
+        cache,
+        name,
+        term,
+        update_interval=(
+            timedelta(seconds=DEFAULT_SCAN_INTERVAL) if self_polling else None
+        ),
+        history_depth=entry.options.get(CONF_HISTORY_DEPTH, DEFAULT_HISTORY_DEPTH),
+        episode_index=hass.data[DOMAIN].get(DATA_EPISODE_INDEX),
+        direct_feed=direct_feed,
+    )
+
+def _direct_feeds(entry: ConfigEntry) -> set[str]:
+    """Return the terms whose RSS feed is polled directly."""
+    direct_feeds = entry.options.get(CONF_DIRECT_FEEDS, DEFAULT_DIRECT_FEEDS)
+    return {term.strip() for term in direct_feeds.split(",") if term.strip()}
+
+async def _async_add_term(hass: HomeAssistant, entry: ConfigEntry, term: str) -> None:
+    """Start tracking a search term without reloading the entry.
+
+    The new coordinator's first refresh doubles as the validation of the
+    term; if it fails or finds no episode, nothing is added. Its result becomes the sensor's
+    first state and, in batched and delta mode, the baseline of the entry
+    coordinator, so no other feed is fetched again.
+    """
+    coordinator = _create_added_term_coordinator(hass, entry, term)
+    await coordinator.async_refresh()
+    if not coordinator.last_update_success:
+        raise HomeAssistantError(f"Failed to fetch '{term}': {coordinator.last_exception}")
+    if coordinator.data is None:
+        raise HomeAssistantError(f"No podcast episode found for '{term}'")
+    _async_track_terms(hass, entry, [coordinator])
+
+def _create_added_term_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, term: str
+) -> PodcastIndexTermCoordinator:
+    """Create the coordinator of a term added to a loaded entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = _create_term_coordinator(
+        hass,
+        entry,
+        entry_data["api"],
+        hass.data[DOMAIN][DATA_RESOLUTION_CACHE],
+        entry_data["name"],
+        term,
+    )
+    if entry.options.get(CONF_SYNC_MODE, DEFAULT_SYNC_MODE) == SYNC_MODE_ADAPTIVE:
+        # Learn the release pattern from the first response
+        coordinator.seed_episodes = ADAPTIVE_HISTORY_SIZE
+    return coordinator
+
+@callback
+def _async_track_terms(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    new_coordinators: list[PodcastIndexTermCoordinator],
+) -> None:
+    """Hook new term coordinators into a loaded entry and add their sensors.
+
+    The entry's search terms are saved once for all of them.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    scheduler: AdaptivePollScheduler | None = (
+        hass.data[DOMAIN].get(DATA_SCHEDULER)
+        if entry.options.get(CONF_SYNC_MODE, DEFAULT_SYNC_MODE) == SYNC_MODE_ADAPTIVE
+        else None
+    )
+    batch_coordinator = entry_data["batch_coordinator"]
+    terms = [coordinator.term for coordinator in new_coordinators]
+    for coordinator in new_coordinators:
+        entry_data["coordinators"][coordinator.term] = coordinator
+        if batch_coordinator is not None and coordinator.data:
+            batch_coordinator.data = {
+                **(batch_coordinator.data or {}),
+                coordinator.term: coordinator.data,
+            }
+        if scheduler is not None:
+            scheduler.async_add(entry.entry_id, coordinator)
+        entry_data["snapshot"].async_track(coordinator)
+        if entry_data["enclosure_resolver"] is not None:
+            entry_data["enclosure_resolver"].async_track(coordinator)
+        if entry_data["audio_prefetcher"] is not None:
+            entry_data["audio_prefetcher"].async_track(entry.entry_id, coordinator)
+        if entry_data["artwork_cache"] is not None:
+            entry_data["artwork_cache"].async_track(entry.entry_id, coordinator)
+    entry_data["search_or_id_list"] = [*entry_data["search_or_id_list"], *terms]
+    if (async_add_term_sensors := entry_data.get("async_add_term_sensors")) is not None:
+        async_add_term_sensors(terms)
+    _async_save_terms(hass, entry, entry_data["search_or_id_list"])
+
+async def _async_import_opml(
+    hass: HomeAssistant, entry: ConfigEntry, feeds: list[OpmlFeed]
+) -> dict[str, Any]:
+    """Resolve the feeds of an OPML file and track them all in one pass.
+
+    Feeds are looked up by their podcast GUID in batches first; the ones
+    the index doesn't know under that GUID are looked up by URL, at most
+    setup_concurrency at a time. Every resolved feed is tracked by its
+    PodcastIndex feed id, with the resolution cached so it isn't looked up
+    again. The new coordinators then get their first data together: one
+    entry-level refresh in batched and delta mode, concurrent term
+    refreshes otherwise. Progress is reported per feed with
+    EVENT_OPML_IMPORT_PROGRESS events.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    api: PodcastIndexAPI = entry_data["api"]
+    cache: ResolutionCache = hass.data[DOMAIN][DATA_RESOLUTION_CACHE]
+    concurrency = entry.options.get(CONF_SETUP_CONCURRENCY, DEFAULT_SETUP_CONCURRENCY)
+    total = len(feeds)
+    done = 0
+    resolved: dict[OpmlFeed, dict[str, Any]] = {}
+    failed: list[dict[str, str]] = []
+
+    @callback
+    def _async_progress(feed: OpmlFeed, status: str, error: str | None = None) -> None:
+        """Report that one feed was resolved or failed."""
+        nonlocal done
+        done += 1
+        if error is not None:
+            failed.append({"title": feed.title, "url": feed.url, "error": error})
+        hass.bus.async_fire(
+            EVENT_OPML_IMPORT_PROGRESS,
+            {
+                "entry_id": entry.entry_id,
+                "title": feed.title,
+                "url": feed.url,
+                "status": status,
+                "error": error,
+                "done": done,
+                "total": total,
+            },
+        )
+
+    guids = {podcast_guid(feed.url): feed for feed in feeds}
+    try:
+        by_guid = await api.get_podcasts_by_guids(list(guids))
+    except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+        _LOGGER.warning("GUID lookup failed, looking up every feed by URL: %s", ex)
+        by_guid = {}
+    for guid, podcast in by_guid.items():
+        resolved[guids[guid]] = podcast
+        _async_progress(guids[guid], "resolved")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _async_resolve_by_url(feed: OpmlFeed) -> None:
+        """Look up a feed the GUID lookup didn't find."""
+        async with semaphore:
+            try:
+                podcast = await api.get_podcast_by_feed_url(feed.url)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                _async_progress(feed, "failed", str(ex) or type(ex).__name__)
+                return
+        if podcast is None or not podcast.get("id"):
+            _async_progress(feed, "failed", "Feed not found in PodcastIndex")
+            return
+        resolved[feed] = podcast
+        _async_progress(feed, "resolved")
+
+    await asyncio.gather(
+        *(_async_resolve_by_url(feed) for feed in feeds if feed not in resolved)
+    )
+
+    added: list[dict[str, str]] = []
+    already_tracked: list[dict[str, str]] = []
+    new_coordinators: dict[str, PodcastIndexTermCoordinator] = {}
+    for feed in feeds:
+        if (podcast := resolved.get(feed)) is None:
+            continue
+        term = str(podcast["id"])
+        result = {"title": podcast.get("title") or feed.title, "url": feed.url, "search_term": term}
+        if term in entry_data["coordinators"] or term in new_coordinators:
+            already_tracked.append(result)
+            continue
+        cache.async_set(term, podcast)
+        new_coordinators[term] = _create_added_term_coordinator(hass, entry, term)
+        added.append(result)
+
+    if new_coordinators:
+        if (batch_coordinator := entry_data["batch_coordinator"]) is not None:
+            # The entry coordinator fetches all new feeds in a few batched requests
+            entry_data["coordinators"].update(new_coordinators)
+            await batch_coordinator.async_refresh()
+        else:
+            async def _async_first_refresh(coordinator: PodcastIndexTermCoordinator) -> None:
+                """Refresh a new term within the concurrency limit."""
+                async with semaphore:
+                    await coordinator.async_refresh()
+
+            await asyncio.gather(
+                *(_async_first_refresh(coordinator) for coordinator in new_coordinators.values())
+            )
+        _async_track_terms(hass, entry, list(new_coordinators.values()))
+
+    _LOGGER.info(
+        "Imported %d of %d OPML feeds into '%s' (%d already tracked, %d failed)",
+        len(added),
+        total,
+        entry_data["name"],
+        len(already_tracked),
+        len(failed),
+    )
+    return {
+        "total": total,
+        "added": added,
+        "already_tracked": already_tracked,
+        "failed": failed,
+    }
+
+async def _async_remove_term(hass: HomeAssistant, entry: ConfigEntry, term: str) -> None:
+    """Stop tracking a search term and remove its sensor without reloading the entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    entity_registry = er.async_get(hass)
+    if entity_id := entity_registry.async_get_entity_id(
+        Platform.SENSOR, DOMAIN, sensor_unique_id(entry_data["name"], term)
+    ):
+        entity_registry.async_remove(entity_id)
+
+    coordinator: PodcastIndexTermCoordinator = entry_data["coordinators"].pop(term)
+    entry_data["search_or_id_list"] = [
+        existing for existing in entry_data["search_or_id_list"] if existing != term
+    ]
+    if (batch_coordinator := entry_data["batch_coordinator"]) is not None and batch_coordinator.data:
+        batch_coordinator.data = {
+            existing: episode
+            for existing, episode in batch_coordinator.data.items()
+            if existing != term
+        }
+    if (scheduler := hass.data[DOMAIN].get(DATA_SCHEDULER)) is not None:
+        scheduler.async_remove(entry.entry_id, term)
+    entry_data["snapshot"].async_forget(term)
+    if entry_data["enclosure_resolver"] is not None:
+        entry_data["enclosure_resolver"].async_forget(term)
+    if entry_data["audio_prefetcher"] is not None:
+        entry_data["audio_prefetcher"].async_forget(entry.entry_id, term)
+    if entry_data["artwork_cache"] is not None:
+        entry_data["artwork_cache"].async_forget(entry.entry_id, term)
+    await coordinator.async_shutdown()
+    _async_save_terms(hass, entry, entry_data["search_or_id_list"])
+
+@callback
+def _async_save_terms(hass: HomeAssistant, entry: ConfigEntry, terms: list[str]) -> None:
+    """Store the entry's search terms; the update listener won't reload for this."""
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_SEARCH_OR_ID: ", ".join(terms)}
+    )
+
+def _episode_record_as_dict(record: EpisodeRecord) -> dict[str, Any]:
+    """Return a history record with its publish date in ISO format."""
+    episode = record.as_dict()
+    if record.publish_date:
+        episode["publish_date"] = dt_util.as_local(
+            dt_util.utc_from_timestamp(record.publish_date)
+        ).isoformat()
+    return episode
+
+@callback
+def _async_find_tracked_episode(hass: HomeAssistant, search_term: str) -> dict[str, Any] | None:
+    """Return the latest episode of a term some loaded entry already tracks.
+
+    Matches the term itself, case-insensitively, or the podcast title a
+    tracked term resolved to.
+    """
+    wanted = search_term.strip().lower()
+    for config_entry in hass.config_entries.async_entries(DOMAIN):
+        if (entry_data := hass.data[DOMAIN].get(config_entry.entry_id)) is None:
+            continue
+        for term, coordinator in entry_data["coordinators"].items():
+            episode = coordinator.data
+            if not episode or not episode.get("audio_url"):
+                continue
+            if wanted in (term.lower(), episode.get("podcast_title", "").lower()):
+                return episode
+    return None
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    # Data-only updates (a term added or removed) are applied in place
+    if dict(entry.options) != hass.data[DOMAIN][entry.entry_id]["options"]:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+async def _async_get_episode_index(hass: HomeAssistant) -> EpisodeIndex:
+    """Return the local episode index shared by every config entry."""
+    domain_data = hass.data[DOMAIN]
+    if DATA_EPISODE_INDEX not in domain_data:
+        index = EpisodeIndex(hass, hass.config.path(STORAGE_DIR, EPISODE_INDEX_FILE))
+        domain_data[DATA_EPISODE_INDEX] = index
+
+        async def _async_close_index(_event: Event) -> None:
+            """Close the database when Home Assistant shuts down."""
+            await hass.async_add_executor_job(index.close)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_index)
+    index = domain_data[DATA_EPISODE_INDEX]
+    await index.async_open()
+    return index
+
+async def _async_get_resolution_cache(hass: HomeAssistant) -> ResolutionCache:
+    """Return the term resolution cache shared by every config entry."""
+    cache: ResolutionCache = hass.data[DOMAIN].setdefault(
+        DATA_RESOLUTION_CACHE, ResolutionCache(hass)
+    )
+    await cache.async_load()
+    return cache
+
+def _async_get_shared_api(
+    hass: HomeAssistant, entry: ConfigEntry, api_key: str, api_secret: str
+) -> PodcastIndexAPI:
+    """Return the API client shared by every config entry, creating it if needed."""
+    domain_data = hass.data[DOMAIN]
+    if DATA_API not in domain_data:
+        api = PodcastIndexAPI(
+            api_key,
+            api_secret,
+            # Home Assistant's connector, SSL context and User-Agent; the
+            # session is closed with the client rather than at shutdown
+            session_factory=lambda: async_create_clientsession(
+                hass,
+                auto_cleanup=False,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            ),
+        )
+
+        async def _async_close_api(_event: Event) -> None:
+            """Close the shared session when Home Assistant shuts down."""
+            # A listener that has fired must not be removed again
+            domain_data.pop(DATA_API_UNSUB_CLOSE, None)
+            await api.close()
+
+        domain_data[DATA_API] = api
+        domain_data[DATA_API_USERS] = set()
+        domain_data[DATA_API_UNSUB_CLOSE] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_api
+        )
+    domain_data[DATA_API_USERS].add(entry.entry_id)
+    return domain_data[DATA_API]
+
+async def _async_persist_responses(hass: HomeAssistant, api: PodcastIndexAPI) -> None:
+    """Keep the response cache of the shared API client in .storage."""
+    domain_data = hass.data[DOMAIN]
+    if DATA_RESPONSE_STORE not in domain_data:
+        store = ResponseCacheStore(hass, api.response_cache)
+        domain_data[DATA_RESPONSE_STORE] = store
+        await store.async_load()
+
+async def _async_get_audio_prefetcher(
+    hass: HomeAssistant, api: PodcastIndexAPI
+) -> AudioPrefetcher | None:
+    """Return the audio prefetcher shared by every config entry, creating it if needed.
+
+    Local copies live in the "local" media directory, so media players can
+    play them through the media source integration.
+    """
+    domain_data = hass.data[DOMAIN]
+    if DATA_AUDIO_PREFETCHER not in domain_data:
+        if (media_dir := hass.config.media_dirs.get("local")) is None:
+            _LOGGER.warning("Audio prefetch needs a \"local\" media directory; it is disabled")
+            return None
+        prefetcher = AudioPrefetcher(hass, api, media_dir)
+        domain_data[DATA_AUDIO_PREFETCHER] = prefetcher
+        await prefetcher.async_load()
+    return domain_data[DATA_AUDIO_PREFETCHER]
+
+async def _async_get_artwork_cache(
+    hass: HomeAssistant, api: PodcastIndexAPI, cache: ResolutionCache
+) -> ArtworkCache:
+    """Return the artwork cache shared by every config entry, creating it if needed."""
+    domain_data = hass.data[DOMAIN]
+    if DATA_ARTWORK_CACHE not in domain_data:
+        artwork_cache = ArtworkCache(
+            hass, api, cache, Path(hass.config.path(STORAGE_DIR, ARTWORK_DIRECTORY))
+        )
+        domain_data[DATA_ARTWORK_CACHE] = artwork_cache
+        await artwork_cache.async_load()
+        # Static paths can't be removed, so this outlives the cache itself
+        if not domain_data.get(DATA_ARTWORK_PATH_REGISTERED):
+            domain_data[DATA_ARTWORK_PATH_REGISTERED] = True
+            await hass.http.async_register_static_paths(
+                [StaticPathConfig(ARTWORK_URL_PATH, str(artwork_cache.directory), True)]
+            )
+    return domain_data[DATA_ARTWORK_CACHE]
+
+async def _async_release_shared_api(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop an entry's hold on the shared API client and close it when unused."""
+    domain_data = hass.data[DOMAIN]
+    users: set[str] = domain_data.get(DATA_API_USERS, set())
+    users.discard(entry.entry_id)
+    if users or DATA_API not in domain_data:
+        return
+    api: PodcastIndexAPI = domain_data.pop(DATA_API)
+    domain_data.pop(DATA_API_USERS)
+    if (unsub_close := domain_data.pop(DATA_API_UNSUB_CLOSE, None)) is not None:
+        unsub_close()
+    if (store := domain_data.pop(DATA_RESPONSE_STORE, None)) is not None:
+        await store.async_save()
+    if (prefetcher := domain_data.pop(DATA_AUDIO_PREFETCHER, None)) is not None:
+        await prefetcher.async_shutdown()
+    if (artwork_cache := domain_data.pop(DATA_ARTWORK_CACHE, None)) is not None:
+        await artwork_cache.async_shutdown()
+    await api.close()
+
 def _load_secrets(secrets_path: str) -> dict[str, Any]:
     """Load secrets from secrets.yaml file."""
     import yaml
@@ -0,0 +1,218 @@
+"""Local cache of podcast artwork, resized to thumbnails."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+from pathlib import Path
+
+import aiohttp
+from PIL import Image
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    ARTWORK_CONCURRENCY,
+    ARTWORK_MAX_BYTES,
+    ARTWORK_QUALITY,
+    ARTWORK_SIZE,
+    ARTWORK_URL_PATH,
+    DOMAIN,
+)
+from .coordinator import PodcastIndexTermCoordinator
+from .podcast_index_api import PodcastIndexAPI
+from .resolution_cache import ResolutionCache
+
+_LOGGER = logging.getLogger(__name__)
+
+_PARTIAL_SUFFIX = ".part"
+
+
+def _filename(feed_id: str, image_url: str, last_updated: int) -> str:
+    """Return the thumbnail file name of a version of a feed's artwork.
+
+    The name changes with the image URL and the feed's lastUpdateTime, so
+    browsers may cache a thumbnail for as long as they like.
+    """
+    version = hashlib.sha1(f"{image_url}|{last_updated}".encode()).hexdigest()[:12]
+    return f"{feed_id}_{version}.jpg"
+
+
+def _scan(directory: Path) -> dict[str, str]:
+    """Create the directory and return the newest thumbnail of every feed.
+
+    Older versions and partial files left by a restart are deleted.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    newest: dict[str, tuple[float, str]] = {}
+    for path in sorted(directory.iterdir(), key=lambda path: path.stat().st_mtime):
+        if path.suffix == _PARTIAL_SUFFIX:
+            path.unlink(missing_ok=True)
+            continue
+        feed_id = path.name.split("_", 1)[0]
+        if (previous := newest.get(feed_id)) is not None:
+            (directory / previous[1]).unlink(missing_ok=True)
+        newest[feed_id] = (path.stat().st_mtime, path.name)
+    return {feed_id: name for feed_id, (_mtime, name) in newest.items()}
+
+
+def _save_thumbnail(image: bytes, path: Path) -> None:
+    """Resize an image to a JPEG thumbnail and write it atomically."""
+    with Image.open(io.BytesIO(image)) as original:
+        # Keeps the aspect ratio; JPEGs are decoded at a reduced scale
+        original.thumbnail((ARTWORK_SIZE, ARTWORK_SIZE))
+        thumbnail = original.convert("RGB")
+    partial = path.with_name(path.name + _PARTIAL_SUFFIX)
+    thumbnail.save(partial, "JPEG", quality=ARTWORK_QUALITY, optimize=True)
+    partial.replace(path)
+
+
+class ArtworkCache:
+    """Thumbnails of the tracked feeds' artwork, shared by all config entries.
+
+    Publishers' artwork is often a 3000x3000 image of several MB, which
+    every dashboard would otherwise fetch from the internet on every
+    render. Each feed's artwork is downloaded once, resized to at most
+    ARTWORK_SIZE pixels and served by Home Assistant under
+    ARTWORK_URL_PATH. It is fetched again only when the image URL or the
+    feed's lastUpdateTime changes, and deleted when the last term
+    tracking the feed is removed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: PodcastIndexAPI,
+        cache: ResolutionCache,
+        directory: Path,
+    ) -> None:
+        """Initialize the artwork cache of a directory."""
+        self._hass = hass
+        self._api = api
+        self._cache = cache
+        self.directory = directory
+        self._files: dict[str, str] = {}
+        # Newest lastUpdateTime of every feed, over all the terms tracking it
+        self._last_updated: dict[str, int] = {}
+        self._pending: set[str] = set()
+        self._semaphore = asyncio.Semaphore(ARTWORK_CONCURRENCY)
+        self._tasks: set[asyncio.Task] = set()
+        self._coordinators: dict[tuple[str, str], PodcastIndexTermCoordinator] = {}
+        self._unsubs: dict[tuple[str, str], CALLBACK_TYPE] = {}
+
+    async def async_load(self) -> None:
+        """Index the thumbnails made before a restart."""
+        self._files = await self._hass.async_add_executor_job(_scan, self.directory)
+        _LOGGER.debug("Found cached artwork of %d feeds", len(self._files))
+
+    def local_url(self, feed_id: str | None) -> str | None:
+        """Return the local URL of a feed's thumbnail, if there is one."""
+        if not feed_id or (name := self._files.get(str(feed_id))) is None:
+            return None
+        return f"{ARTWORK_URL_PATH}/{name}"
+
+    @callback
+    def async_track(self, entry_id: str, coordinator: PodcastIndexTermCoordinator) -> None:
+        """Cache the artwork of the coordinator's feed, whenever it changes."""
+        key = (entry_id, coordinator.term)
+
+        @callback
+        def _async_coordinator_updated() -> None:
+            """Fetch the artwork unless this version is cached."""
+            episode = coordinator.data
+            if not episode or not (feed_id := episode.get("podcast_id")):
+                return
+            if not (image_url := episode.get("podcast_icon")):
+                return
+            podcast = self._cache.get(coordinator.term, allow_expired=True)
+            last_updated = (
+                podcast.get("last_updated") or 0
+                if podcast and str(podcast.get("id")) == feed_id
+                else 0
+            )
+            if last_updated < self._last_updated.get(feed_id, 0):
+                # Another term has newer metadata of the feed; its version stays
+                return
+            self._last_updated[feed_id] = last_updated
+            self._async_schedule(feed_id, image_url, _filename(feed_id, image_url, last_updated))
+
+        self._coordinators[key] = coordinator
+        self._unsubs[key] = coordinator.async_add_listener(_async_coordinator_updated)
+        _async_coordinator_updated()
+
+    @callback
+    def async_forget(self, entry_id: str, term: str) -> None:
+        """Stop tracking a removed term, deleting its artwork if no term uses it."""
+        if (unsub := self._unsubs.pop((entry_id, term), None)) is not None:
+            unsub()
+        coordinator = self._coordinators.pop((entry_id, term), None)
+        if coordinator is None or not coordinator.data:
+            return
+        feed_id = coordinator.data.get("podcast_id")
+        if any(
+            other.data and other.data.get("podcast_id") == feed_id
+            for other in self._coordinators.values()
+        ):
+            return
+        self._last_updated.pop(feed_id, None)
+        if (name := self._files.pop(feed_id, None)) is not None:
+            self._hass.async_add_executor_job((self.directory / name).unlink, True)
+
+    @callback
+    def async_stop(self, entry_id: str) -> None:
+        """Stop tracking the coordinators of an unloaded entry, keeping their artwork."""
+        for key in [key for key in self._coordinators if key[0] == entry_id]:
+            self._coordinators.pop(key)
+            self._unsubs.pop(key)()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the downloads in progress."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        """Return the size of the cache for diagnostics."""
+        return {"feeds": len(self._files), "pending": len(self._pending)}
+
+    @callback
+    def _async_schedule(self, feed_id: str, image_url: str, name: str) -> None:
+        """Fetch a version of a feed's artwork in the background."""
+        if name in self._pending or self._files.get(feed_id) == name:
+            return
+        self._pending.add(name)
+        task = self._hass.async_create_background_task(
+            self._async_fetch(feed_id, image_url, name), f"{DOMAIN} artwork {feed_id}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_fetch(self, feed_id: str, image_url: str, name: str) -> None:
+        """Download, resize and store a feed's artwork."""
+        try:
+            async with self._semaphore:
+                image = await self._api.get_image(image_url, ARTWORK_MAX_BYTES)
+                await self._hass.async_add_executor_job(
+                    _save_thumbnail, image, self.directory / name
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            # Dashboards keep using the publisher's URL until the next change
+            _LOGGER.debug("Failed to download artwork of feed %s: %s", feed_id, ex)
+            return
+        except (OSError, ValueError, Image.DecompressionBombError) as ex:
+            _LOGGER.warning("Failed to resize artwork of feed %s: %s", feed_id, ex)
+            return
+        finally:
+            self._pending.discard(name)
+        previous = self._files.get(feed_id)
+        self._files[feed_id] = name
+        if previous is not None and previous != name:
+            await self._hass.async_add_executor_job(
+                (self.directory / previous).unlink, True
+            )
+        _LOGGER.debug("Cached artwork of feed %s as %s", feed_id, name)
+        # Sensors switch to the local thumbnail
+        for coordinator in self._coordinators.values():
+            if coordinator.data and coordinator.data.get("podcast_id") == feed_id:
+                coordinator.async_update_listeners()
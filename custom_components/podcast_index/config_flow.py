@@ -8,11 +8,39 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 
-from .const import CONF_SEARCH_OR_ID, DOMAIN
+from .const import (
+    CONF_BACKGROUND_SETUP,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_DIRECT_FEEDS,
+    CONF_RESOLVE_ENCLOSURES,
+    CONF_PREFETCH_AUDIO,
+    CONF_CACHE_ARTWORK,
+    CONF_PERSIST_RESPONSES,
+    CONF_HISTORY_ATTRIBUTE,
+    CONF_HISTORY_DEPTH,
+    CONF_LEAN_ATTRIBUTES,
+    CONF_SEARCH_OR_ID,
+    CONF_SETUP_CONCURRENCY,
+    CONF_SYNC_MODE,
+    DEFAULT_BACKGROUND_SETUP,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DEFAULT_DIRECT_FEEDS,
+    DEFAULT_RESOLVE_ENCLOSURES,
+    DEFAULT_PREFETCH_AUDIO,
+    DEFAULT_CACHE_ARTWORK,
+    DEFAULT_PERSIST_RESPONSES,
+    DEFAULT_HISTORY_ATTRIBUTE,
+    DEFAULT_HISTORY_DEPTH,
+    DEFAULT_LEAN_ATTRIBUTES,
+    DEFAULT_SETUP_CONCURRENCY,
+    DEFAULT_SYNC_MODE,
+    DOMAIN,
+    SYNC_MODES,
+)
 from .podcast_index_api import PodcastIndexAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -99,6 +127,14 @@ class PodcastIndexConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> PodcastIndexOptionsFlow:
+        """Get the options flow for this handler."""
+        return PodcastIndexOptionsFlow()
+
     def _load_secrets(self, secrets_path: str) -> dict[str, Any]:
         """Load secrets from secrets.yaml file."""
         import yaml
@@ -112,4 +148,86 @@ class PodcastIndexConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return yaml.safe_load(file) or {}
         except Exception as ex:
             _LOGGER.error("Failed to load secrets.yaml: %s", ex)
-            return {} 
\ No newline at end of file
+            return {}
+
+
+class PodcastIndexOptionsFlow(config_entries.OptionsFlow):
+    """Handle PodcastIndex options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SYNC_MODE,
+                        default=options.get(CONF_SYNC_MODE, DEFAULT_SYNC_MODE),
+                    ): vol.In(SYNC_MODES),
+                    vol.Optional(
+                        CONF_SETUP_CONCURRENCY,
+                        default=options.get(
+                            CONF_SETUP_CONCURRENCY, DEFAULT_SETUP_CONCURRENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+                    vol.Optional(
+                        CONF_BACKGROUND_SETUP,
+                        default=options.get(
+                            CONF_BACKGROUND_SETUP, DEFAULT_BACKGROUND_SETUP
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_HISTORY_DEPTH,
+                        default=options.get(CONF_HISTORY_DEPTH, DEFAULT_HISTORY_DEPTH),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                    vol.Optional(
+                        CONF_HISTORY_ATTRIBUTE,
+                        default=options.get(
+                            CONF_HISTORY_ATTRIBUTE, DEFAULT_HISTORY_ATTRIBUTE
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_LEAN_ATTRIBUTES,
+                        default=options.get(
+                            CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DIAGNOSTIC_SENSORS,
+                        default=options.get(
+                            CONF_DIAGNOSTIC_SENSORS, DEFAULT_DIAGNOSTIC_SENSORS
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PERSIST_RESPONSES,
+                        default=options.get(
+                            CONF_PERSIST_RESPONSES, DEFAULT_PERSIST_RESPONSES
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DIRECT_FEEDS,
+                        default=options.get(CONF_DIRECT_FEEDS, DEFAULT_DIRECT_FEEDS),
+                    ): str,
+                    vol.Optional(
+                        CONF_RESOLVE_ENCLOSURES,
+                        default=options.get(
+                            CONF_RESOLVE_ENCLOSURES, DEFAULT_RESOLVE_ENCLOSURES
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PREFETCH_AUDIO,
+                        default=options.get(CONF_PREFETCH_AUDIO, DEFAULT_PREFETCH_AUDIO),
+                    ): bool,
+                    vol.Optional(
+                        CONF_CACHE_ARTWORK,
+                        default=options.get(CONF_CACHE_ARTWORK, DEFAULT_CACHE_ARTWORK),
+                    ): bool,
+                }
+            ),
+        )
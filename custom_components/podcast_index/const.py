@@ -5,14 +5,174 @@ DOMAIN = "podcast_index"
 CONF_API_KEY = "api_key"
 CONF_API_SECRET = "api_secret"
 CONF_SEARCH_OR_ID = "search_or_id"  # Can be a search term or a podcast ID
+CONF_SYNC_MODE = "sync_mode"
+CONF_SETUP_CONCURRENCY = "setup_concurrency"
+CONF_BACKGROUND_SETUP = "background_setup"
+CONF_HISTORY_DEPTH = "history_depth"
+CONF_HISTORY_ATTRIBUTE = "history_attribute"
+CONF_LEAN_ATTRIBUTES = "lean_attributes"
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
+CONF_PERSIST_RESPONSES = "persist_responses"
+CONF_DIRECT_FEEDS = "direct_feeds"
+CONF_RESOLVE_ENCLOSURES = "resolve_enclosures"
+CONF_PREFETCH_AUDIO = "prefetch_audio"
+CONF_CACHE_ARTWORK = "cache_artwork"
+
+# Sync modes
+SYNC_MODE_PER_TERM = "per_term"  # One coordinator and poll per term
+SYNC_MODE_BATCHED = "batched"  # One batched episodes request per entry
+SYNC_MODE_DELTA = "delta"  # Fetch episodes only for feeds the index reports changed
+SYNC_MODE_ADAPTIVE = "adaptive"  # Poll each feed around its expected releases
+SYNC_MODES = [SYNC_MODE_DELTA, SYNC_MODE_BATCHED, SYNC_MODE_ADAPTIVE, SYNC_MODE_PER_TERM]
 
 DEFAULT_NAME = "PodcastIndex"
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes
+DEFAULT_SYNC_MODE = SYNC_MODE_DELTA
+DEFAULT_SETUP_CONCURRENCY = 8  # First refreshes / resolutions run at once
+DEFAULT_BACKGROUND_SETUP = False
+DEFAULT_HISTORY_DEPTH = 10  # Episodes kept per feed
+DEFAULT_HISTORY_ATTRIBUTE = False
+DEFAULT_LEAN_ATTRIBUTES = False
+DEFAULT_DIAGNOSTIC_SENSORS = False
+DEFAULT_PERSIST_RESPONSES = False
+DEFAULT_DIRECT_FEEDS = ""  # Comma-separated terms polled from their RSS feed
+DEFAULT_RESOLVE_ENCLOSURES = False
+DEFAULT_PREFETCH_AUDIO = False
+DEFAULT_CACHE_ARTWORK = False
+
+# Sensor state
+LEAN_DESCRIPTION_LENGTH = 200  # characters of plain text kept
+HOURS_SINCE_PUBLISH_UPDATE_INTERVAL = 3600  # seconds, one step of the rounded value
+
+# Batched polling
+BATCH_MAX_FEEDS = 25  # Feed ids per /episodes/byfeedid request
+BATCH_MAX_EPISODES = 1000  # Largest "max" the API accepts; requests ask for less
+BATCH_MAX_GUIDS = 100  # Podcast GUIDs per /podcasts/batch/byguid request
+
+# Delta sync
+DELTA_PAGE_SIZE = 5000  # Largest "max" /recent/data accepts
+DELTA_MAX_PAGES = 5  # Pages per poll before falling back to a full sync
+DELTA_SINCE_OVERLAP = 60  # seconds re-read each poll to absorb clock skew
+DELTA_FULL_SYNC_INTERVAL = 6 * 3600  # seconds between full batched refreshes
 
 # PodcastIndex API endpoints
 PODCAST_INDEX_BASE_URL = "https://api.podcastindex.org/api/1.0"
 PODCAST_INDEX_SEARCH_ENDPOINT = "/search/byterm"
 PODCAST_INDEX_EPISODES_ENDPOINT = "/episodes/byfeedurl"
+PODCAST_INDEX_EPISODES_BY_ID_ENDPOINT = "/episodes/byfeedid"
+PODCAST_INDEX_PODCAST_BY_ID_ENDPOINT = "/podcasts/byfeedid"
+PODCAST_INDEX_PODCAST_BY_URL_ENDPOINT = "/podcasts/byfeedurl"
+PODCAST_INDEX_PODCASTS_BY_GUID_ENDPOINT = "/podcasts/batch/byguid"
+PODCAST_INDEX_RECENT_DATA_ENDPOINT = "/recent/data"
+
+# Direct RSS polling
+RSS_FEED_ENDPOINT = "rss"  # Pseudo endpoint for metrics and the response cache
+RSS_CHUNK_SIZE = 16 * 1024  # bytes read from a feed at a time
+RSS_MAX_BYTES = 2 * 1024 * 1024  # bytes read looking for the first item
+
+# Enclosure redirect resolution
+ENCLOSURE_ENDPOINT = "enclosure"  # Pseudo endpoint for metrics
+ENCLOSURE_MAX_REDIRECTS = 10
+ENCLOSURE_RESOLVE_CONCURRENCY = 4  # Redirect chains followed at once per entry
+ENCLOSURE_CACHE_SIZE = 500  # Final URLs kept per entry
+# Seconds a final URL is played instead of the enclosure; CDN URLs may be
+# signed and expire, so they are resolved again after this.
+ENCLOSURE_RESOLVE_TTL = 3600
+
+# Audio prefetch
+AUDIO_ENDPOINT = "audio"  # Pseudo endpoint for metrics
+PREFETCH_DIRECTORY = DOMAIN  # below the "local" media directory
+PREFETCH_QUOTA = 2 * 1024**3  # bytes of audio kept on disk across all entries
+PREFETCH_RATE_LIMIT = 1024**2  # bytes per second; downloads run one at a time
+PREFETCH_CHUNK_SIZE = 64 * 1024  # bytes written to disk at a time
+PREFETCH_EXTENSIONS = (".mp3", ".m4a", ".aac", ".ogg", ".opus", ".mp4", ".wav")
+PREFETCH_SKIPPED_SIZE = 500  # evicted or oversized episodes remembered
+
+# Artwork cache
+ARTWORK_ENDPOINT = "artwork"  # Pseudo endpoint for metrics
+ARTWORK_DIRECTORY = f"{DOMAIN}_artwork"  # in the .storage directory
+ARTWORK_URL_PATH = f"/api/{DOMAIN}/artwork"
+ARTWORK_SIZE = 300  # pixels, longest side of a thumbnail
+ARTWORK_QUALITY = 85  # JPEG quality of thumbnails
+ARTWORK_MAX_BYTES = 20 * 1024 * 1024  # largest original image downloaded
+ARTWORK_CONCURRENCY = 2  # Images downloaded and resized at once
+
+# Shared HTTP client
+USER_AGENT = "HomeAssistant-PodcastIndex-Integration/1.0"
+REQUEST_TIMEOUT = 30  # seconds
+RATE_LIMIT_PER_SECOND = 4  # Sustained API requests per second
+RATE_LIMIT_BURST = 10  # Requests allowed back to back before throttling
+
+# Response cache
+RESPONSE_CACHE_MAX_BYTES = 4 * 1024 * 1024  # response bodies kept in memory
+# Seconds a response is used without asking the API; 0 revalidates it on
+# every request. Endpoints not listed, like /recent/data, are never cached.
+RESPONSE_CACHE_TTLS = {
+    PODCAST_INDEX_SEARCH_ENDPOINT: 3600,
+    PODCAST_INDEX_PODCAST_BY_URL_ENDPOINT: 3600,
+    PODCAST_INDEX_PODCASTS_BY_GUID_ENDPOINT: 3600,
+    # Refetched to pick up metadata changes after a new episode
+    PODCAST_INDEX_PODCAST_BY_ID_ENDPOINT: 0,
+    PODCAST_INDEX_EPISODES_ENDPOINT: 0,
+    PODCAST_INDEX_EPISODES_BY_ID_ENDPOINT: 0,
+    RSS_FEED_ENDPOINT: 0,
+}
+
+# Metrics
+METRICS_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+METRICS_TOP_FEEDS = 10  # Most requested feeds listed in diagnostics
+METRICS_UPDATE_INTERVAL = 60  # seconds between diagnostic sensor updates
+
+# Resilience
+BACKOFF_INITIAL = 10  # seconds an endpoint rests after its first failure
+BACKOFF_MAX = 900  # seconds, cap of the doubling per-endpoint backoff
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive outage errors that open the circuit
+CIRCUIT_RESET_TIMEOUT = 60  # seconds before a probe request is let through
+
+# Adaptive scheduling
+ADAPTIVE_TICK_INTERVAL = 30  # seconds between checks for due feeds
+ADAPTIVE_HISTORY_SIZE = 10  # publish times kept per feed
+ADAPTIVE_MIN_HISTORY = 3  # publish times needed before trusting a pattern
+ADAPTIVE_MIN_INTERVAL = 120  # seconds, poll interval inside a release window
+ADAPTIVE_LEARNING_INTERVAL = 900  # seconds, poll interval without a pattern
+ADAPTIVE_MAX_INTERVAL = 6 * 3600  # seconds, longest wait between polls
+ADAPTIVE_MIN_WINDOW = 3600  # seconds either side of an expected release
+ADAPTIVE_DORMANT_RELEASES = 4  # missed releases before a feed counts as dormant
+ADAPTIVE_REQUEST_BUDGET = 240  # polls per hour across all entries
+
+# Storage
+STORAGE_VERSION = 1
+RESOLUTION_CACHE_STORAGE_KEY = f"{DOMAIN}.resolutions"
+RESOLUTION_CACHE_TTL = 7 * 24 * 3600  # 1 week
+RESOLUTION_CACHE_NEGATIVE_TTL = 3600  # seconds a term that matched nothing is not searched
+RESOLUTION_CACHE_SAVE_DELAY = 30  # seconds
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+RESPONSE_CACHE_STORAGE_KEY = f"{DOMAIN}.responses"
+RESPONSE_CACHE_SAVE_DELAY = 300  # seconds
+PREFETCH_STORAGE_KEY = f"{DOMAIN}.prefetch"
+PREFETCH_SAVE_DELAY = 30  # seconds
+
+# Local episode index
+EPISODE_INDEX_FILE = f"{DOMAIN}_episodes.db"  # in the .storage directory
+EPISODE_INDEX_MAX_AGE = 365 * 24 * 3600  # seconds since publishing
+EPISODE_INDEX_MAX_EPISODES = 20000
+EPISODE_INDEX_FUZZY_CUTOFF = 0.85  # difflib ratio for matching show names
+
+# Events
+EVENT_OPML_IMPORT_PROGRESS = f"{DOMAIN}_opml_import_progress"
+
+# Keys in hass.data[DOMAIN] shared by all config entries
+DATA_API = "api"
+DATA_API_USERS = "api_users"
+DATA_API_UNSUB_CLOSE = "api_unsub_close"
+DATA_RESOLUTION_CACHE = "resolution_cache"
+DATA_SCHEDULER = "scheduler"
+DATA_EPISODE_INDEX = "episode_index"
+DATA_RESPONSE_STORE = "response_store"
+DATA_AUDIO_PREFETCHER = "audio_prefetcher"
+DATA_ARTWORK_CACHE = "artwork_cache"
+DATA_ARTWORK_PATH_REGISTERED = "artwork_path_registered"
 
 # Sensor attributes
 ATTR_TITLE = "title"
@@ -26,4 +186,8 @@ ATTR_SEASON_NUMBER = "season_number"
 ATTR_SEARCH_OR_ID = "search_or_id"
 ATTR_FEED_URL = "feed_url"
 ATTR_HOURS_SINCE_PUBLISH = "hours_since_publish"
-ATTR_PODCAST_ICON = "podcast_icon" 
\ No newline at end of file
+ATTR_PODCAST_ICON = "podcast_icon"
+ATTR_STALE = "stale"
+ATTR_LOCAL_AUDIO_URL = "local_audio_url"
+ATTR_STALE_SINCE = "stale_since" 
+ATTR_RECENT_EPISODES = "recent_episodes"
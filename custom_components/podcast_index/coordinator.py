@@ -0,0 +1,477 @@
+"""Data update coordinators for the PodcastIndex integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import (
+    ADAPTIVE_HISTORY_SIZE,
+    ATTR_STALE,
+    ATTR_STALE_SINCE,
+    DEFAULT_HISTORY_DEPTH,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SETUP_CONCURRENCY,
+    DELTA_FULL_SYNC_INTERVAL,
+    DELTA_SINCE_OVERLAP,
+)
+from .episode_index import EpisodeIndex
+from .history import EpisodeHistory
+from .podcast_index_api import PodcastIndexAPI
+from .resolution_cache import ResolutionCache
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_resolve_term(
+    api: PodcastIndexAPI, cache: ResolutionCache, term: str
+) -> tuple[dict[str, Any] | None, bool]:
+    """Resolve a term to its podcast feed, going through the resolution cache.
+
+    Returns the podcast, or None if the term matches no feed, and whether
+    the answer came from the cache. An expired cache entry is still used
+    when the API can't be reached, as a term rarely starts pointing at a
+    different feed. A term that matched nothing isn't searched again for a
+    while.
+    """
+    if cache.unresolved(term):
+        return None, True
+    if (podcast := cache.get(term)) is not None:
+        return podcast, True
+    try:
+        podcast = await api.resolve_feed(term)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        if (podcast := cache.get(term, allow_expired=True)) is not None:
+            _LOGGER.debug("Using expired resolution for '%s' while the API is unreachable", term)
+            return podcast, True
+        raise
+    if not podcast or not podcast.get("id"):
+        cache.async_set_unresolved(term)
+        return None, False
+    return cache.async_set(term, podcast), False
+
+
+async def async_refresh_podcast(
+    api: PodcastIndexAPI, cache: ResolutionCache, term: str, podcast: dict[str, Any]
+) -> dict[str, Any]:
+    """Refetch a feed's metadata after it published a new episode.
+
+    Title, URL and artwork rarely change, so they are otherwise only
+    refetched when the resolution cache entry expires.
+    """
+    try:
+        fresh = await api.get_podcast_by_feed_id(str(podcast["id"]))
+    except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+        _LOGGER.debug("Keeping cached metadata for '%s': %s", term, ex)
+        return podcast
+    if not fresh:
+        return podcast
+    if fresh.get("last_updated") != podcast.get("last_updated"):
+        _LOGGER.debug(
+            "Feed for '%s' updated at %s, refreshed its metadata",
+            term,
+            fresh.get("last_updated"),
+        )
+    return cache.async_set(term, fresh)
+
+
+def _mark_stale(episode: dict[str, Any]) -> dict[str, Any]:
+    """Return the episode flagged as last known data that couldn't be refreshed."""
+    if episode.get(ATTR_STALE):
+        return episode
+    return {**episode, ATTR_STALE: True, ATTR_STALE_SINCE: int(time.time())}
+
+
+def _mark_fresh(episode: dict[str, Any]) -> dict[str, Any]:
+    """Return the episode without the stale flag, after a successful refresh."""
+    if not episode.get(ATTR_STALE):
+        return episode
+    return {
+        key: value
+        for key, value in episode.items()
+        if key not in (ATTR_STALE, ATTR_STALE_SINCE)
+    }
+
+
+def _is_new_episode(
+    previous: dict[str, Any] | None, episode: dict[str, Any]
+) -> bool:
+    """Return True if an episode replaces a different, previously known one."""
+    return previous is not None and previous.get("guid") != episode.get("guid")
+
+
+def _known_since(previous: dict[str, Any] | None, podcast: dict[str, Any]) -> int | None:
+    """Return the publish time to fetch from, if the previous data is for this feed."""
+    if previous and previous.get("podcast_id") == str(podcast.get("id")):
+        return previous.get("publish_date") or None
+    return None
+
+
+class PodcastIndexTermCoordinator(DataUpdateCoordinator[dict[str, Any] | None]):
+    """Fetch the latest episode for a single search term or podcast id."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: PodcastIndexAPI,
+        cache: ResolutionCache,
+        name: str,
+        term: str,
+        update_interval: timedelta | None,
+        history_depth: int = DEFAULT_HISTORY_DEPTH,
+        episode_index: EpisodeIndex | None = None,
+        direct_feed: bool = False,
+    ) -> None:
+        """Initialize the term coordinator.
+
+        With ``direct_feed`` the coordinator polls the podcast's RSS feed
+        itself instead of the API, and batch coordinators leave it out.
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{name} {term} Latest Episode",
+            update_interval=update_interval,
+            # Polls that find the same episode don't notify the sensor
+            always_update=False,
+        )
+        self.api = api
+        self.cache = cache
+        self.term = term
+        # Episodes to fetch on the first poll, to learn the release pattern
+        self.seed_episodes = 1
+        self.publish_times: list[int] = []
+        self.history = EpisodeHistory(history_depth)
+        self.episode_index = episode_index
+        self.direct_feed = direct_feed
+        # Cleared for feeds that list their oldest episode first
+        self._feed_newest_first = True
+
+    def _record_publish_times(self, episodes: list[dict[str, Any]]) -> None:
+        """Remember the most recent publish times, oldest first."""
+        times = set(self.publish_times)
+        times.update(e["publish_date"] for e in episodes if e.get("publish_date"))
+        self.publish_times = sorted(times)[-ADAPTIVE_HISTORY_SIZE:]
+
+    def record_episodes(self, episodes: list[dict[str, Any]]) -> None:
+        """Keep fetched episodes in the history and the local search index."""
+        self.history.add(episodes)
+        if self.episode_index is not None:
+            self.episode_index.async_add(episodes)
+
+    async def _async_update_data(self) -> dict[str, Any] | None:
+        """Fetch the latest episode, serving the last one while the API fails.
+
+        Stale data keeps the sensor available and is flagged with the
+        ``stale`` attribute until a refresh succeeds again.
+        """
+        try:
+            return await self._async_fetch()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            if not self.data:
+                raise
+            if not self.data.get(ATTR_STALE):
+                _LOGGER.warning(
+                    "Serving last known episode for '%s' while the API is unavailable: %s",
+                    self.term,
+                    ex,
+                )
+            return _mark_stale(self.data)
+
+    async def _async_fetch(self) -> dict[str, Any] | None:
+        """Fetch the latest episode incrementally.
+
+        The feed comes from the resolution cache and only episodes newer
+        than the known one are requested, so an unchanged feed costs one
+        small request. Feed metadata is refetched when a new episode shows
+        up.
+
+        Direct feeds are read from their RSS feed once the history holds
+        the first poll's episodes, falling back to the API when the feed
+        can't be fetched or parsed.
+        """
+        podcast, _cached = await async_resolve_term(self.api, self.cache, self.term)
+        if not podcast:
+            _LOGGER.warning("No podcast found for search term: %s", self.term)
+            return None
+        previous = self.data
+        if (
+            self.direct_feed
+            and self._feed_newest_first
+            and self.history
+            and podcast.get("feed_url")
+        ):
+            try:
+                episode = await self.api.get_latest_episode_from_feed(podcast, self.term)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                _LOGGER.debug(
+                    "Reading the feed of '%s' failed, asking the API: %s", self.term, ex
+                )
+            else:
+                if (
+                    episode is not None
+                    and previous
+                    and episode["publish_date"] < (previous.get("publish_date") or 0)
+                ):
+                    # Serial shows often list episode 1 first; only the API
+                    # knows which episode is the newest
+                    _LOGGER.warning(
+                        "The feed of '%s' doesn't list its newest episode first;"
+                        " polling it through the API instead",
+                        self.term,
+                    )
+                    self._feed_newest_first = False
+                elif episode is not None:
+                    if _is_new_episode(previous, episode):
+                        self._record_publish_times([episode])
+                        self.record_episodes([episode])
+                    return await self._async_use_episode(previous, podcast, episode)
+        since = _known_since(previous, podcast)
+        episodes = await self.api.get_episodes_for_podcast(
+            podcast,
+            self.term,
+            # The first poll fills the history in the same request; later ones
+            # get every episode since the known one, so several releases
+            # between polls leave no gap in the history
+            max_episodes=max(self.history.depth, 1 if self.history else self.seed_episodes),
+            since=since,
+        )
+        if not episodes:
+            return _mark_fresh(previous) if since else None
+        self._record_publish_times(episodes)
+        self.record_episodes(episodes)
+        return await self._async_use_episode(previous, podcast, episodes[0])
+
+    async def _async_use_episode(
+        self,
+        previous: dict[str, Any] | None,
+        podcast: dict[str, Any],
+        episode: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Return the latest episode, refetching feed metadata when it is new."""
+        if _is_new_episode(previous, episode):
+            podcast = await async_refresh_podcast(self.api, self.cache, self.term, podcast)
+            self.api.add_podcast_info(episode, podcast, self.term)
+        return episode
+
+
+class PodcastIndexBatchCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    """Fetch the latest episode of every term in a config entry in batches.
+
+    Terms are resolved to PodcastIndex feed ids through the resolution
+    cache, then each poll asks for the latest episodes of all resolved
+    feeds with one batched request per BATCH_MAX_FEEDS feeds. The data is
+    a mapping of term to episode, which is fanned out to the per-term
+    coordinators the sensors listen to.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: PodcastIndexAPI,
+        cache: ResolutionCache,
+        name: str,
+        term_coordinators: dict[str, PodcastIndexTermCoordinator],
+        resolve_concurrency: int = DEFAULT_SETUP_CONCURRENCY,
+    ) -> None:
+        """Initialize the batch coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{name} Latest Episodes",
+            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        )
+        self.api = api
+        self.cache = cache
+        self.term_coordinators = term_coordinators
+        self._podcasts: dict[str, dict[str, Any]] = {}
+        self._resolve_semaphore = asyncio.Semaphore(resolve_concurrency)
+
+    async def _async_resolve(self, term: str) -> dict[str, Any] | None:
+        """Resolve one term, keeping its last known feed if the API fails."""
+        async with self._resolve_semaphore:
+            try:
+                podcast, _cached = await async_resolve_term(self.api, self.cache, term)
+                return podcast
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                _LOGGER.warning("Failed to resolve '%s', will retry next poll: %s", term, ex)
+                return self._podcasts.get(term)
+
+    async def _async_resolve_terms(self) -> None:
+        """Resolve every term to a feed, mostly from the resolution cache.
+
+        Cache misses are resolved concurrently, bounded by the entry's
+        setup concurrency.
+        """
+        # Direct feeds are polled by their own term coordinators
+        terms = [
+            term
+            for term, coordinator in self.term_coordinators.items()
+            if not coordinator.direct_feed
+        ]
+        resolved = await asyncio.gather(*(self._async_resolve(term) for term in terms))
+        podcasts: dict[str, dict[str, Any]] = {}
+        for term, podcast in zip(terms, resolved):
+            if podcast:
+                podcasts[term] = podcast
+            else:
+                _LOGGER.warning("No podcast feed found for search term: %s", term)
+        self._podcasts = podcasts
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch the latest episode for all resolved feeds."""
+        await self._async_resolve_terms()
+        return await self._async_fetch_terms(set(self._podcasts))
+
+    async def _async_fetch_terms(self, terms: set[str]) -> dict[str, dict[str, Any]]:
+        """Fetch the latest episodes of some resolved terms in batches.
+
+        Returns data for every resolved term; terms that weren't fetched or
+        have no new episode keep their previous data.
+        """
+        previous = self.data or {}
+        podcasts = {term: self._podcasts[term] for term in terms if term in self._podcasts}
+        feed_ids = list(dict.fromkeys(str(p["id"]) for p in podcasts.values()))
+        since = {
+            str(podcast["id"]): known
+            for term, podcast in podcasts.items()
+            if (known := _known_since(previous.get(term), podcast))
+        }
+        # Enough episodes per feed to fill the histories without gaps
+        max_episodes = max(
+            [1, *(coordinator.history.depth for coordinator in self.term_coordinators.values())]
+        )
+        try:
+            episodes = (
+                await self.api.get_episodes_by_feed_ids(feed_ids, max_episodes, since=since)
+                if feed_ids
+                else {}
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            return self._stale_data(ex)
+        latest = {feed_id: feed_episodes[0] for feed_id, feed_episodes in episodes.items()}
+
+        data: dict[str, dict[str, Any]] = {}
+        for term, podcast in self._podcasts.items():
+            episode = latest.get(str(podcast["id"])) if term in podcasts else None
+            if episode is None:
+                if term in previous:
+                    data[term] = _mark_fresh(previous[term])
+                continue
+            if _is_new_episode(previous.get(term), episode):
+                podcast = await async_refresh_podcast(self.api, self.cache, term, podcast)
+            # Every episode the batch returned for the feed is recorded, with
+            # the show's title and feed URL as on the per-term path
+            recorded = [
+                self.api.add_podcast_info(dict(feed_episode), podcast, term)
+                for feed_episode in episodes[str(podcast["id"])]
+            ]
+            data[term] = recorded[0]
+            if (term_coordinator := self.term_coordinators.get(term)) is not None:
+                term_coordinator.record_episodes(recorded)
+        return data
+
+    def _stale_data(self, ex: Exception) -> dict[str, dict[str, Any]]:
+        """Serve the last known episodes, flagged stale, after a failed poll."""
+        if not self.data:
+            raise UpdateFailed(f"Error fetching latest episodes: {ex}") from ex
+        if not any(episode.get(ATTR_STALE) for episode in self.data.values()):
+            _LOGGER.warning(
+                "Serving last known episodes for %s while the API is unavailable: %s",
+                self.name,
+                ex,
+            )
+        return {term: _mark_stale(episode) for term, episode in self.data.items()}
+
+    @callback
+    def async_fan_out(self) -> None:
+        """Push the latest batch result to the per-term coordinators.
+
+        Terms whose episode didn't change are skipped, so their sensors
+        and the snapshot aren't updated for nothing.
+        """
+        for term, coordinator in self.term_coordinators.items():
+            if coordinator.direct_feed:
+                continue
+            if not self.last_update_success:
+                coordinator.async_set_update_error(self.last_exception)
+            elif term in self.data and (
+                not coordinator.last_update_success or coordinator.data != self.data[term]
+            ):
+                coordinator.async_set_updated_data(self.data[term])
+
+
+class PodcastIndexDeltaCoordinator(PodcastIndexBatchCoordinator):
+    """Fetch episodes only for feeds the index reports as changed.
+
+    Each poll makes one /recent/data call for everything added to the index
+    since the previous poll and intersects it with the tracked feed ids.
+    Episodes are then fetched in batches for the changed feeds only, so a
+    poll where none of the tracked feeds published costs a single request.
+    A full batched refresh runs on the first poll, every
+    DELTA_FULL_SYNC_INTERVAL, and whenever the recent data couldn't be
+    read completely.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: PodcastIndexAPI,
+        cache: ResolutionCache,
+        name: str,
+        term_coordinators: dict[str, PodcastIndexTermCoordinator],
+        resolve_concurrency: int = DEFAULT_SETUP_CONCURRENCY,
+    ) -> None:
+        """Initialize the delta coordinator."""
+        super().__init__(hass, api, cache, name, term_coordinators, resolve_concurrency)
+        self._since: int | None = None
+        self._last_full_sync = 0.0
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch episodes for the feeds that changed since the last poll."""
+        await self._async_resolve_terms()
+        started = time.time()
+        if self._since is None or started - self._last_full_sync > DELTA_FULL_SYNC_INTERVAL:
+            data = await self._async_fetch_terms(set(self._podcasts))
+            self._since = int(started) - DELTA_SINCE_OVERLAP
+            self._last_full_sync = started
+            return data
+
+        previous = self.data or {}
+        feed_terms: dict[str, set[str]] = {}
+        for term, podcast in self._podcasts.items():
+            feed_terms.setdefault(str(podcast["id"]), set()).add(term)
+        try:
+            changed, next_since, complete = await self.api.get_updated_feed_ids(
+                self._since, set(feed_terms)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            return self._stale_data(ex)
+
+        if not complete:
+            _LOGGER.debug("Too many index changes since %s, running a full sync", self._since)
+            self._since = None
+            return await self._async_update_data()
+
+        terms = {term for feed_id in changed for term in feed_terms[feed_id]}
+        # Newly added or newly resolved terms have nothing to compare against yet
+        terms.update(term for term in self._podcasts if term not in previous)
+        _LOGGER.debug(
+            "%d of %d tracked feeds changed since %s",
+            len(changed),
+            len(feed_terms),
+            self._since,
+        )
+        data = await self._async_fetch_terms(terms)
+        self._since = (next_since or int(started)) - DELTA_SINCE_OVERLAP
+        return data
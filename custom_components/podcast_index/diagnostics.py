@@ -0,0 +1,97 @@
+"""Diagnostics support for the PodcastIndex integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_STALE,
+    CONF_API_KEY,
+    CONF_API_SECRET,
+    DATA_EPISODE_INDEX,
+    DATA_RESOLUTION_CACHE,
+    DATA_SCHEDULER,
+    DOMAIN,
+)
+
+TO_REDACT = {CONF_API_KEY, CONF_API_SECRET}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return request metrics, cache hit rates and poll state of an entry.
+
+    The API client and the caches are shared by every entry, so their
+    numbers cover the whole integration.
+    """
+    domain_data = hass.data[DOMAIN]
+    entry_data = domain_data[entry.entry_id]
+    api = entry_data["api"]
+
+    metrics = api.metrics.as_dict()
+    if (cache := domain_data.get(DATA_RESOLUTION_CACHE)) is not None:
+        metrics["caches"]["resolution"] = cache.stats.as_dict()
+
+    terms: dict[str, Any] = {}
+    for term, coordinator in entry_data["coordinators"].items():
+        data = coordinator.data or {}
+        terms[term] = {
+            "podcast_id": data.get("podcast_id"),
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": (
+                str(coordinator.last_exception) if coordinator.last_exception else None
+            ),
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "stale": bool(data.get(ATTR_STALE)),
+            "publish_date": data.get("publish_date"),
+            "history": len(coordinator.history),
+        }
+
+    batch_coordinator = entry_data.get("batch_coordinator")
+    scheduler = domain_data.get(DATA_SCHEDULER)
+    episode_index = domain_data.get(DATA_EPISODE_INDEX)
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "api": {
+            **metrics,
+            "circuit_open": api.circuit_breaker.is_open,
+            "response_cache": api.response_cache.stats(),
+        },
+        "batch_coordinator": (
+            {
+                "last_update_success": batch_coordinator.last_update_success,
+                "update_interval": batch_coordinator.update_interval.total_seconds()
+                if batch_coordinator.update_interval
+                else None,
+            }
+            if batch_coordinator is not None
+            else None
+        ),
+        "poll_schedule": scheduler.as_dict(entry.entry_id) if scheduler else None,
+        "episode_index_available": (
+            episode_index.available if episode_index is not None else False
+        ),
+        "audio_prefetch": (
+            prefetcher.stats()
+            if (prefetcher := entry_data["audio_prefetcher"]) is not None
+            else None
+        ),
+        "artwork_cache": (
+            artwork_cache.stats()
+            if (artwork_cache := entry_data["artwork_cache"]) is not None
+            else None
+        ),
+        "terms": terms,
+    }
@@ -0,0 +1,109 @@
+"""Background resolution of enclosure redirect chains."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import logging
+import time
+
+import aiohttp
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    ENCLOSURE_CACHE_SIZE,
+    ENCLOSURE_RESOLVE_CONCURRENCY,
+    ENCLOSURE_RESOLVE_TTL,
+)
+from .coordinator import PodcastIndexTermCoordinator
+from .podcast_index_api import PodcastIndexAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EnclosureResolver:
+    """Final URLs of the latest episodes' enclosures, resolved in the background.
+
+    Whenever a tracked coordinator gets an episode whose enclosure isn't
+    resolved yet, its redirect chain is followed with a HEAD request, at
+    most ENCLOSURE_RESOLVE_CONCURRENCY at a time. ``search_and_play``
+    then hands the final URL to the speaker, which no longer has to walk
+    the tracking redirects when playback starts. Final URLs are used for
+    ENCLOSURE_RESOLVE_TTL seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: PodcastIndexAPI, entry_id: str) -> None:
+        """Initialize the resolver of an entry."""
+        self._hass = hass
+        self._api = api
+        self._entry_id = entry_id
+        self._resolved: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._pending: set[str] = set()
+        self._semaphore = asyncio.Semaphore(ENCLOSURE_RESOLVE_CONCURRENCY)
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    def get(self, url: str) -> str | None:
+        """Return the final URL of an enclosure, if it was resolved recently."""
+        if (resolved := self._resolved.get(url)) is None:
+            return None
+        final_url, expires_at = resolved
+        if time.time() >= expires_at:
+            del self._resolved[url]
+            return None
+        return final_url
+
+    @callback
+    def async_track(self, coordinator: PodcastIndexTermCoordinator) -> None:
+        """Resolve the enclosure of every new episode the coordinator gets."""
+
+        @callback
+        def _async_coordinator_updated() -> None:
+            """Resolve the latest episode's enclosure unless it is known."""
+            if coordinator.data and (url := coordinator.data.get("audio_url")):
+                self._async_schedule(url)
+
+        self._unsubs[coordinator.term] = coordinator.async_add_listener(
+            _async_coordinator_updated
+        )
+        _async_coordinator_updated()
+
+    @callback
+    def async_forget(self, term: str) -> None:
+        """Stop tracking a removed term."""
+        if (unsub := self._unsubs.pop(term, None)) is not None:
+            unsub()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking every coordinator."""
+        while self._unsubs:
+            self._unsubs.popitem()[1]()
+
+    @callback
+    def _async_schedule(self, url: str) -> None:
+        """Start resolving an enclosure in the background."""
+        if url in self._pending or self.get(url) is not None:
+            return
+        self._pending.add(url)
+        self._hass.async_create_background_task(
+            self._async_resolve(url), f"{DOMAIN} resolve enclosure {self._entry_id}"
+        )
+
+    async def _async_resolve(self, url: str) -> None:
+        """Follow an enclosure's redirects and cache the final URL."""
+        try:
+            async with self._semaphore:
+                final_url = await self._api.resolve_redirects(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            # The speaker follows the redirects itself, as it always did
+            _LOGGER.debug("Failed to resolve the redirects of %s: %s", url, ex)
+            return
+        finally:
+            self._pending.discard(url)
+        self._resolved[url] = (final_url, time.time() + ENCLOSURE_RESOLVE_TTL)
+        self._resolved.move_to_end(url)
+        while len(self._resolved) > ENCLOSURE_CACHE_SIZE:
+            self._resolved.popitem(last=False)
+        if final_url != url:
+            _LOGGER.debug("Resolved enclosure %s to %s", url, final_url)
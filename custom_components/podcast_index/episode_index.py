@@ -0,0 +1,267 @@
+"""Local full-text index over the episodes of tracked feeds."""
+from __future__ import annotations
+
+import asyncio
+import difflib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    EPISODE_INDEX_FUZZY_CUTOFF,
+    EPISODE_INDEX_MAX_AGE,
+    EPISODE_INDEX_MAX_EPISODES,
+)
+
+# Only annotations need Home Assistant, so the index is tested without it
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    id INTEGER PRIMARY KEY,
+    guid TEXT NOT NULL UNIQUE,
+    podcast_title TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    audio_url TEXT NOT NULL,
+    publish_date INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS episodes_publish_date ON episodes (publish_date);
+CREATE INDEX IF NOT EXISTS episodes_podcast_title ON episodes (podcast_title);
+CREATE VIRTUAL TABLE IF NOT EXISTS episodes_fts USING fts5(
+    podcast_title, title, description,
+    content='episodes', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS episodes_ai AFTER INSERT ON episodes BEGIN
+    INSERT INTO episodes_fts (rowid, podcast_title, title, description)
+    VALUES (new.id, new.podcast_title, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS episodes_ad AFTER DELETE ON episodes BEGIN
+    INSERT INTO episodes_fts (episodes_fts, rowid, podcast_title, title, description)
+    VALUES ('delete', old.id, old.podcast_title, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS episodes_au AFTER UPDATE ON episodes BEGIN
+    INSERT INTO episodes_fts (episodes_fts, rowid, podcast_title, title, description)
+    VALUES ('delete', old.id, old.podcast_title, old.title, old.description);
+    INSERT INTO episodes_fts (rowid, podcast_title, title, description)
+    VALUES (new.id, new.podcast_title, new.title, new.description);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO episodes (guid, podcast_title, title, description, audio_url, publish_date)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (guid) DO UPDATE SET
+    podcast_title = excluded.podcast_title,
+    title = excluded.title,
+    description = excluded.description,
+    audio_url = excluded.audio_url,
+    publish_date = excluded.publish_date
+WHERE description != excluded.description
+    OR podcast_title != excluded.podcast_title
+    OR title != excluded.title
+    OR audio_url != excluded.audio_url
+"""
+
+# Matches in the episode title count more than matches in the show notes
+_SEARCH = """
+SELECT e.podcast_title, e.title, e.description, e.audio_url, e.publish_date, e.guid
+FROM episodes_fts
+JOIN episodes e ON e.id = episodes_fts.rowid
+WHERE episodes_fts MATCH ?
+ORDER BY bm25(episodes_fts, 2.0, 4.0, 1.0), e.publish_date DESC
+LIMIT ?
+"""
+
+_COLUMNS = ("podcast_title", "title", "description", "audio_url", "publish_date", "guid")
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+
+class EpisodeIndex:
+    """SQLite FTS5 index of episode titles and show notes.
+
+    Coordinators hand over every episode they fetch; the episodes are
+    written in batches in the executor. search_and_play queries the index
+    to answer from local data, by fuzzy show name or by what an episode is
+    about. After each write, episodes older than EPISODE_INDEX_MAX_AGE are
+    dropped and the index is capped at EPISODE_INDEX_MAX_EPISODES.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the index stored at path."""
+        self.hass = hass
+        self._path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._open_lock = asyncio.Lock()
+        self._opened = False
+        self._pending: dict[str, tuple[Any, ...]] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._podcast_titles: list[str] = []
+
+    @property
+    def available(self) -> bool:
+        """Return True once the database is open."""
+        return self._connection is not None
+
+    async def async_open(self) -> None:
+        """Open the database once."""
+        async with self._open_lock:
+            if self._opened:
+                return
+            await self.hass.async_add_executor_job(self.open)
+            self._opened = True
+
+    def open(self) -> None:
+        """Open the database and create the schema. Runs in the executor."""
+        try:
+            # .storage doesn't exist yet on a new installation
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+        except (OSError, sqlite3.Error) as ex:
+            _LOGGER.warning(
+                "Local episode search is unavailable, can't open %s: %s", self._path, ex
+            )
+            return
+        try:
+            connection.executescript(_SCHEMA)
+        except sqlite3.OperationalError as ex:
+            connection.close()
+            _LOGGER.warning("Local episode search is unavailable, SQLite lacks FTS5: %s", ex)
+            return
+        self._connection = connection
+        self._podcast_titles = self._load_podcast_titles()
+
+    def close(self) -> None:
+        """Close the database. Runs in the executor."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def async_add(self, episodes: list[dict[str, Any]]) -> None:
+        """Queue fetched episodes to be written to the index. Runs in the event loop."""
+        if self._connection is None:
+            return
+        for episode in episodes:
+            if not (guid := episode.get("guid")) or not episode.get("audio_url"):
+                continue
+            self._pending[guid] = (
+                guid,
+                episode.get("podcast_title") or "",
+                episode.get("title") or "",
+                _HTML_TAG.sub(" ", episode.get("description") or ""),
+                episode["audio_url"],
+                episode.get("publish_date") or 0,
+            )
+        if self._pending and self._flush_task is None:
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_flush(), "podcast_index episode index flush"
+            )
+
+    async def _async_flush(self) -> None:
+        """Write the queued episodes, including ones queued while writing."""
+        try:
+            while self._pending:
+                rows = list(self._pending.values())
+                self._pending.clear()
+                await self.hass.async_add_executor_job(self._write, rows)
+        finally:
+            self._flush_task = None
+
+    def _write(self, rows: list[tuple[Any, ...]]) -> None:
+        """Upsert episodes and prune the index. Runs in the executor."""
+        with self._lock:
+            if self._connection is None:
+                return
+            with self._connection:
+                self._connection.executemany(_UPSERT, rows)
+            self._prune(EPISODE_INDEX_MAX_AGE, EPISODE_INDEX_MAX_EPISODES)
+            self._podcast_titles = self._load_podcast_titles()
+
+    def prune(self, max_age: float, max_episodes: int) -> int:
+        """Drop old episodes and cap the index size. Runs in the executor."""
+        with self._lock:
+            if self._connection is None:
+                return 0
+            removed = self._prune(max_age, max_episodes)
+            self._podcast_titles = self._load_podcast_titles()
+            return removed
+
+    def _prune(self, max_age: float, max_episodes: int) -> int:
+        """Drop episodes older than max_age seconds and all but the newest max_episodes."""
+        assert self._connection is not None
+        with self._connection:
+            removed = self._connection.execute(
+                "DELETE FROM episodes WHERE publish_date < ?",
+                (int(time.time() - max_age),),
+            ).rowcount
+            removed += self._connection.execute(
+                """
+                DELETE FROM episodes WHERE id IN (
+                    SELECT id FROM episodes ORDER BY publish_date DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (max_episodes,),
+            ).rowcount
+        if removed:
+            _LOGGER.debug("Pruned %d episodes from the local index", removed)
+        return removed
+
+    def _load_podcast_titles(self) -> list[str]:
+        """Return the distinct show names in the index."""
+        assert self._connection is not None
+        return [
+            row[0]
+            for row in self._connection.execute(
+                "SELECT DISTINCT podcast_title FROM episodes WHERE podcast_title != ''"
+            )
+        ]
+
+    async def async_search(self, query: str) -> tuple[dict[str, Any] | None, str]:
+        """Find the episode a free-text query most likely asks for.
+
+        A query that is (nearly) a show name returns that show's newest
+        episode; otherwise the best full-text match on titles and show
+        notes is returned. The second value tells which of the two matched.
+        Numeric queries are podcast ids, which only the API can resolve.
+        """
+        if self._connection is None or not query.strip() or query.strip().isdigit():
+            return None, "none"
+        return await self.hass.async_add_executor_job(self._search, query)
+
+    def _search(self, query: str) -> tuple[dict[str, Any] | None, str]:
+        """Search the index. Runs in the executor."""
+        with self._lock:
+            if self._connection is None:
+                return None, "none"
+            titles = {title.lower(): title for title in self._podcast_titles}
+            if match := difflib.get_close_matches(
+                query.strip().lower(), titles, n=1, cutoff=EPISODE_INDEX_FUZZY_CUTOFF
+            ):
+                row = self._connection.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM episodes"
+                    " WHERE podcast_title = ? ORDER BY publish_date DESC LIMIT 1",
+                    (titles[match[0]],),
+                ).fetchone()
+                if row is not None:
+                    return dict(zip(_COLUMNS, row)), "show"
+
+            # Every word must appear as a whole word
+            tokens = _TOKEN.findall(query)
+            if not tokens:
+                return None, "none"
+            fts_query = " ".join(f'"{token}"' for token in tokens)
+            row = self._connection.execute(_SEARCH, (fts_query, 1)).fetchone()
+            if row is not None:
+                return dict(zip(_COLUMNS, row)), "episode"
+            return None, "none"
@@ -0,0 +1,131 @@
+"""Bounded per-feed episode history for the PodcastIndex integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+
+class EpisodeRecord:
+    """The fields of an episode worth keeping in the history.
+
+    Descriptions and podcast metadata are left out; the latest episode in
+    the coordinator data still has them.
+    """
+
+    __slots__ = (
+        "guid",
+        "title",
+        "publish_date",
+        "duration",
+        "audio_url",
+        "episode_number",
+        "season_number",
+        "link",
+    )
+
+    def __init__(
+        self,
+        guid: str,
+        title: str,
+        publish_date: int,
+        duration: int,
+        audio_url: str,
+        episode_number: int | None,
+        season_number: int | None,
+        link: str,
+    ) -> None:
+        """Initialize the record."""
+        self.guid = guid
+        self.title = title
+        self.publish_date = publish_date
+        self.duration = duration
+        self.audio_url = audio_url
+        self.episode_number = episode_number
+        self.season_number = season_number
+        self.link = link
+
+    @classmethod
+    def from_episode(cls, episode: dict[str, Any]) -> EpisodeRecord:
+        """Create a record from a parsed episode."""
+        return cls(
+            episode.get("guid") or episode.get("audio_url", ""),
+            episode.get("title", ""),
+            episode.get("publish_date") or 0,
+            episode.get("duration") or 0,
+            episode.get("audio_url", ""),
+            episode.get("episode_number"),
+            episode.get("season_number"),
+            episode.get("link", ""),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a dict for storage, service responses and attributes."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class EpisodeHistory:
+    """The most recent episodes of one feed, newest first, keyed by guid.
+
+    Episodes are added as polls return them, so the history fills up over
+    time without extra requests. It never holds more than ``depth``
+    records; adding a newer episode drops the oldest one.
+    """
+
+    __slots__ = ("depth", "_records")
+
+    def __init__(self, depth: int) -> None:
+        """Initialize an empty history."""
+        self.depth = depth
+        self._records: dict[str, EpisodeRecord] = {}
+
+    def __len__(self) -> int:
+        """Return the number of episodes in the history."""
+        return len(self._records)
+
+    def add(self, episodes: Iterable[dict[str, Any]]) -> bool:
+        """Add parsed episodes not seen before; return True if any was added."""
+        added = False
+        for episode in episodes:
+            record = EpisodeRecord.from_episode(episode)
+            if record.guid and record.guid not in self._records:
+                self._records[record.guid] = record
+                added = True
+        if added:
+            newest = sorted(
+                self._records.values(),
+                key=lambda record: record.publish_date,
+                reverse=True,
+            )[: self.depth]
+            self._records = {record.guid: record for record in newest}
+        return added
+
+    def recent(
+        self, limit: int | None = None, since: int | None = None
+    ) -> list[EpisodeRecord]:
+        """Return the newest episodes, optionally published from ``since`` on."""
+        records = [
+            record
+            for record in self._records.values()
+            if since is None or record.publish_date >= since
+        ]
+        return records[:limit] if limit is not None else records
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the history for storage, newest first."""
+        return [record.as_dict() for record in self._records.values()]
+
+    def restore(self, stored: list[dict[str, Any]]) -> None:
+        """Replace the history with stored records.
+
+        Records are stored by field name, so adding a field later doesn't
+        shift the stored values of the others.
+        """
+        self._records = {
+            record.guid: record
+            for record in (
+                EpisodeRecord.from_episode(values)
+                for values in stored[: self.depth]
+                if isinstance(values, dict)
+            )
+            if record.guid
+        }
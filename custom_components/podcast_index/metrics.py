@@ -0,0 +1,216 @@
+"""Runtime metrics of PodcastIndex API requests and caches."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+from .const import METRICS_LATENCY_BUCKETS, METRICS_TOP_FEEDS
+
+
+class CacheStats:
+    """Hit and miss counts of a cache."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize empty counts."""
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool) -> None:
+        """Count one lookup."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the share of lookups that were hits, or None before any."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts for diagnostics."""
+        hit_rate = self.hit_rate
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(hit_rate, 3) if hit_rate is not None else None,
+        }
+
+
+class EndpointMetrics:
+    """Request counts, latency histogram and sizes of one API endpoint.
+
+    Latencies are counted into the buckets of METRICS_LATENCY_BUCKETS, in
+    seconds, plus one overflow bucket, so the memory used stays fixed
+    however many requests are made.
+    """
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "rejected",
+        "statuses",
+        "bytes_received",
+        "latency_total",
+        "latency_max",
+        "latency_buckets",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.statuses: Counter[int] = Counter()
+        self.bytes_received = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.latency_buckets = [0] * (len(METRICS_LATENCY_BUCKETS) + 1)
+
+    def record(
+        self, latency: float, status: int | None, received: int, failed: bool
+    ) -> None:
+        """Count one request that was sent."""
+        self.requests += 1
+        if failed:
+            self.errors += 1
+        if status is not None:
+            self.statuses[status] += 1
+        self.bytes_received += received
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_buckets[bisect_left(METRICS_LATENCY_BUCKETS, latency)] += 1
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return the mean latency in seconds, or None before any request."""
+        return self.latency_total / self.requests if self.requests else None
+
+    def latency_percentile(self, share: float) -> float | None:
+        """Return the upper bound of the bucket holding a latency percentile.
+
+        The bound is capped at the slowest latency seen, which is also what
+        latencies beyond the last bucket report.
+        """
+        if not self.requests:
+            return None
+        target = share * self.requests
+        seen = 0
+        for bound, count in zip(METRICS_LATENCY_BUCKETS, self.latency_buckets):
+            seen += count
+            if seen >= target:
+                return min(bound, self.latency_max)
+        return self.latency_max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics, latencies in milliseconds."""
+        bounds = [f"le_{int(bound * 1000)}ms" for bound in METRICS_LATENCY_BUCKETS]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "statuses": dict(self.statuses),
+            "bytes_received": self.bytes_received,
+            "latency_mean_ms": to_ms(self.mean_latency),
+            "latency_p95_ms": to_ms(self.latency_percentile(0.95)),
+            "latency_max_ms": to_ms(self.latency_max if self.requests else None),
+            "latency_histogram": dict(
+                zip([*bounds, "overflow"], self.latency_buckets)
+            ),
+        }
+
+
+class ApiMetrics:
+    """Metrics of every request the API client made since it was created.
+
+    Requests are counted per endpoint and per feed id, so slow endpoints
+    and hot feeds stand out. Requests refused while an endpoint backs off
+    or the circuit breaker is open count as rejected, not as sent.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.error_types: Counter[str] = Counter()
+        self.feed_requests: Counter[str] = Counter()
+        self.caches: dict[str, CacheStats] = {}
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them if needed."""
+        if (metrics := self.endpoints.get(endpoint)) is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def cache(self, name: str) -> CacheStats:
+        """Return the hit and miss counts of a named cache."""
+        if (stats := self.caches.get(name)) is None:
+            stats = self.caches[name] = CacheStats()
+        return stats
+
+    def record_request(
+        self,
+        endpoint: str,
+        latency: float,
+        status: int | None,
+        received: int,
+        error: BaseException | None = None,
+        feed_ids: Iterable[str] = (),
+    ) -> None:
+        """Count one request that was sent, successful or not."""
+        self._endpoint(endpoint).record(latency, status, received, error is not None)
+        if error is not None:
+            self.error_types[type(error).__name__] += 1
+        self.feed_requests.update(feed_ids)
+
+    def record_rejected(self, endpoint: str) -> None:
+        """Count a request refused before it was sent."""
+        self._endpoint(endpoint).rejected += 1
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests sent."""
+        return sum(metrics.requests for metrics in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        """Return the number of requests that failed."""
+        return sum(metrics.errors for metrics in self.endpoints.values())
+
+    @property
+    def bytes_received(self) -> int:
+        """Return the number of response bytes received."""
+        return sum(metrics.bytes_received for metrics in self.endpoints.values())
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return the mean latency of all requests in seconds."""
+        requests = self.requests
+        if not requests:
+            return None
+        return sum(m.latency_total for m in self.endpoints.values()) / requests
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "latency_mean_ms": to_ms(self.mean_latency),
+            "error_types": dict(self.error_types),
+            "endpoints": {
+                endpoint: metrics.as_dict()
+                for endpoint, metrics in sorted(self.endpoints.items())
+            },
+            "hot_feeds": dict(self.feed_requests.most_common(METRICS_TOP_FEEDS)),
+            "caches": {name: stats.as_dict() for name, stats in self.caches.items()},
+        }
+
+
+def to_ms(seconds: float | None) -> float | None:
+    """Return seconds as milliseconds rounded to 0.1 ms."""
+    return round(seconds * 1000, 1) if seconds is not None else None
@@ -0,0 +1,104 @@
+"""Parsing and selective JSON decoding of PodcastIndex API responses."""
+from __future__ import annotations
+
+from typing import Any
+
+import msgspec
+
+
+def parse_podcast(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of a feed object of an API response the integration uses."""
+    return {
+        "id": data.get("id"),
+        "title": data.get("title") or "",
+        "description": data.get("description") or "",
+        "feed_url": data.get("url") or "",
+        "website": data.get("link") or "",
+        "language": data.get("language") or "",
+        "author": data.get("author") or "",
+        "categories": data.get("categories") or {},
+        "image": data.get("image") or "",
+        "last_updated": data.get("lastUpdateTime") or 0,
+    }
+
+
+def parse_episode(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of an episode item of an API response the integration uses.
+
+    Episodes parsed from RSS feeds have the same keys.
+    """
+    return {
+        "title": data.get("title") or "",
+        "description": data.get("description") or "",
+        "publish_date": data.get("datePublished") or 0,
+        "duration": data.get("duration") or 0,
+        "audio_url": data.get("enclosureUrl") or "",
+        "podcast_title": data.get("feedTitle") or "",
+        "episode_number": data.get("episode"),
+        "season_number": data.get("season"),
+        "guid": data.get("guid") or "",
+        "link": data.get("link") or "",
+    }
+
+
+# Only the fields declared here are materialized; msgspec skips every
+# other key of the response (transcripts, persons, value blocks, ...)
+# without building Python objects for it.
+class _ApiFeed(msgspec.Struct, omit_defaults=True):
+    """Fields of a feed object the integration reads."""
+
+    id: Any = None
+    feedId: Any = None
+    podcastGuid: Any = None
+    title: Any = None
+    description: Any = None
+    url: Any = None
+    link: Any = None
+    language: Any = None
+    author: Any = None
+    categories: Any = None
+    image: Any = None
+    lastUpdateTime: Any = None
+
+
+class _ApiEpisode(msgspec.Struct, omit_defaults=True):
+    """Fields of an episode object the integration reads."""
+
+    feedId: Any = None
+    title: Any = None
+    description: Any = None
+    datePublished: Any = None
+    duration: Any = None
+    enclosureUrl: Any = None
+    feedTitle: Any = None
+    episode: Any = None
+    season: Any = None
+    guid: Any = None
+    link: Any = None
+
+
+class _ApiResponse(msgspec.Struct, omit_defaults=True):
+    """Top-level fields of an API response the integration reads."""
+
+    status: Any = None
+    description: Any = None
+    # An unknown feed id comes back as an empty list
+    feed: _ApiFeed | list[Any] | None = None
+    feeds: list[_ApiFeed] | None = None
+    items: list[_ApiEpisode] | None = None
+    episodes: list[_ApiEpisode] | None = None
+    nextSince: Any = None
+
+
+_RESPONSE_DECODER = msgspec.json.Decoder(_ApiResponse)
+
+
+def decode_response(body: bytes) -> dict[str, Any]:
+    """Decode an API response body, keeping only the fields that are used.
+
+    Returns plain dicts and lists. Raises ValueError for invalid JSON.
+    """
+    try:
+        return msgspec.to_builtins(_RESPONSE_DECODER.decode(body))
+    except msgspec.DecodeError as ex:
+        raise ValueError(str(ex)) from ex
@@ -1,9 +1,12 @@
 """PodcastIndex API client."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
+from collections.abc import AsyncIterator, Callable
 import time
 from typing import Any
+from xml.etree.ElementTree import ParseError
 import aiohttp
 import logging
 
@@ -11,29 +14,246 @@ from .const import (
     PODCAST_INDEX_BASE_URL,
     PODCAST_INDEX_SEARCH_ENDPOINT,
     PODCAST_INDEX_EPISODES_ENDPOINT,
+    PODCAST_INDEX_EPISODES_BY_ID_ENDPOINT,
+    PODCAST_INDEX_PODCAST_BY_ID_ENDPOINT,
+    PODCAST_INDEX_PODCAST_BY_URL_ENDPOINT,
+    PODCAST_INDEX_PODCASTS_BY_GUID_ENDPOINT,
+    PODCAST_INDEX_RECENT_DATA_ENDPOINT,
     CONF_SEARCH_OR_ID,
     ATTR_SEARCH_OR_ID,
+    BATCH_MAX_EPISODES,
+    BATCH_MAX_FEEDS,
+    BATCH_MAX_GUIDS,
+    DELTA_MAX_PAGES,
+    DELTA_PAGE_SIZE,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+    REQUEST_TIMEOUT,
+    RSS_CHUNK_SIZE,
+    RSS_FEED_ENDPOINT,
+    RSS_MAX_BYTES,
+    ARTWORK_ENDPOINT,
+    AUDIO_ENDPOINT,
+    ENCLOSURE_ENDPOINT,
+    ENCLOSURE_MAX_REDIRECTS,
+    USER_AGENT,
+)
+from .metrics import ApiMetrics
+from .models import decode_response, parse_episode, parse_podcast
+from .response_cache import ResponseCache, response_cache_key
+from .rss import FirstItemParser
+from .resilience import (
+    CircuitBreaker,
+    EndpointBackoff,
+    PodcastIndexUnavailableError,
+    is_outage,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class _TokenBucket:
+    """Token bucket limiting how fast requests may start."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize a full bucket refilling at ``rate`` tokens per second."""
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it.
+
+        Waiters queue on the lock, so tokens are handed out in call order.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
 class PodcastIndexAPI:
     """PodcastIndex API client."""
 
-    def __init__(self, api_key: str, api_secret: str, search_term: str) -> None:
-        """Initialize the PodcastIndex API client."""
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        search_term: str | None = None,
+        base_url: str = PODCAST_INDEX_BASE_URL,
+        session_factory: Callable[[], aiohttp.ClientSession] | None = None,
+    ) -> None:
+        """Initialize the PodcastIndex API client.
+
+        ``base_url`` points the client at another server, such as the mock
+        API the benchmarks run against. ``session_factory`` creates the
+        session when one is needed; without it the client opens a plain
+        aiohttp session.
+        """
         self.api_key = api_key
         self.api_secret = api_secret
         self.search_term = search_term
+        self.base_url = base_url.rstrip("/")
         self.session: aiohttp.ClientSession | None = None
+        self._session_factory = session_factory
+        self._rate_limiter = _TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        self.backoff = EndpointBackoff()
+        self.circuit_breaker = CircuitBreaker()
+        self._in_flight: dict[tuple[Any, ...], asyncio.Task] = {}
+        self.metrics = ApiMetrics()
+        self.response_cache = ResponseCache()
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        """Get or create the aiohttp session, reused for every request."""
+        if self.session is None or self.session.closed:
+            if self._session_factory is not None:
+                self.session = self._session_factory()
+            else:
+                self.session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                )
         return self.session
 
+    async def _request(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        json_body: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Perform an authenticated request against the API and return the JSON body.
+
+        Requests are GETs, or POSTs when a JSON body is given. Identical
+        requests that are already in flight are joined instead of sent
+        again, so concurrent callers (coordinators, services, several
+        entries tracking the same feed) share one response. Callers must
+        not modify the returned data.
+        """
+        key = (
+            endpoint,
+            tuple(sorted((name, str(value)) for name, value in params.items())),
+            tuple(json_body or ()),
+        )
+        task = self._in_flight.get(key)
+        self.metrics.cache("in_flight").record(task is not None)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._fetch(endpoint, params, json_body)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        else:
+            _LOGGER.debug("Joining in-flight request to %s %s", endpoint, params)
+        # A cancelled caller must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: tuple[Any, ...], task: asyncio.Task) -> None:
+        """Forget a finished request."""
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            # Mark the error as retrieved in case every caller went away
+            task.exception()
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        json_body: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Send one request once the rate limiter allows it.
+
+        Fresh responses of cacheable endpoints are answered from the
+        response cache without a request. Otherwise a cached response is
+        revalidated with its ETag or Last-Modified date, and a 304 answer
+        reuses its decoded body instead of downloading it again.
+
+        Requests fail fast with PodcastIndexUnavailableError while the
+        endpoint backs off or the shared circuit breaker is open.
+        """
+        cache_key: str | None = None
+        cached = None
+        if self.response_cache.cacheable(endpoint):
+            cache_key = response_cache_key(endpoint, params, json_body)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None and cached.fresh:
+                self.metrics.cache("response").record(True)
+                return cached.data
+        try:
+            self.backoff.check(endpoint)
+            self.circuit_breaker.check()
+        except PodcastIndexUnavailableError:
+            self.metrics.record_rejected(endpoint)
+            raise
+        feed_ids = str(params["id"]).split(",") if "id" in params else ()
+        started: float | None = None
+        status: int | None = None
+        try:
+            await self._rate_limiter.acquire()
+            session = await self._get_session()
+            started = time.monotonic()
+            async with session.request(
+                "GET" if json_body is None else "POST",
+                f"{self.base_url}{endpoint}",
+                params=params,
+                json=json_body,
+                headers={
+                    **self._generate_auth_headers(),
+                    **(cached.validators() if cached is not None else {}),
+                },
+            ) as response:
+                status = response.status
+                not_modified = status == 304 and cached is not None
+                body = b""
+                if not not_modified:
+                    response.raise_for_status()
+                    body = await response.read()
+                response_headers = response.headers
+            latency = time.monotonic() - started
+            if not_modified:
+                # The cached body is still current; nothing to download or decode
+                data = cached.data
+                self.response_cache.revalidated(cache_key, endpoint, response_headers)
+            else:
+                try:
+                    data = decode_response(body)
+                except ValueError as ex:
+                    raise aiohttp.ClientPayloadError(
+                        f"Invalid JSON from {endpoint}: {ex}"
+                    ) from ex
+                if cache_key is not None:
+                    self.response_cache.store(
+                        cache_key, endpoint, data, len(body), response_headers
+                    )
+            if cache_key is not None:
+                self.metrics.cache("response").record(not_modified)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            if started is not None:
+                self.metrics.record_request(
+                    endpoint, time.monotonic() - started, status, 0, ex, feed_ids
+                )
+            if is_outage(ex):
+                self.backoff.record_failure(endpoint, ex)
+                self.circuit_breaker.record_failure()
+            else:
+                # The API answered, it just didn't like the request
+                self.circuit_breaker.record_success()
+            raise
+        except BaseException:
+            self.circuit_breaker.release_probe()
+            raise
+        self.metrics.record_request(endpoint, latency, status, len(body), feed_ids=feed_ids)
+        self.backoff.record_success(endpoint)
+        self.circuit_breaker.record_success()
+        return data
+
     def _generate_auth_headers(self) -> dict[str, str]:
         """Generate authentication headers for PodcastIndex API."""
         # PodcastIndex uses a custom authentication method
@@ -45,7 +265,7 @@ class PodcastIndexAPI:
         auth_hash = hashlib.sha1(auth_string.encode()).hexdigest()
         
         return {
-            "User-Agent": "HomeAssistant-PodcastIndex-Integration/1.0",
+            "User-Agent": USER_AGENT,
             "Authorization": auth_hash,
             "X-Auth-Key": self.api_key,
             "X-Auth-Date": timestamp,
@@ -63,32 +283,20 @@ class PodcastIndexAPI:
 
     async def search_podcasts(self, search_term: str | None = None) -> dict[str, Any] | None:
         """Search for podcasts by term."""
-        session = await self._get_session()
-        
         term = search_term or self.search_term
         params = {
             "q": term,
             "max": 1,  # Get only the top result
         }
         
-        headers = self._generate_auth_headers()
-        
         try:
-            async with session.get(
-                f"{PODCAST_INDEX_BASE_URL}{PODCAST_INDEX_SEARCH_ENDPOINT}",
-                params=params,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                
-                if data.get("status") == "true" and data.get("feeds"):
-                    podcast = data["feeds"][0]  # Get the first (top) result
-                    return self._parse_podcast(podcast)
-                else:
-                    _LOGGER.warning("No podcasts found or API returned error: %s", data)
-                    return None
+            data = await self._request(PODCAST_INDEX_SEARCH_ENDPOINT, params)
+            if data.get("status") == "true" and data.get("feeds"):
+                podcast = data["feeds"][0]  # Get the first (top) result
+                return self._parse_podcast(podcast)
+            else:
+                _LOGGER.warning("No podcasts found or API returned error: %s", data)
+                return None
                     
         except aiohttp.ClientError as ex:
             _LOGGER.error("Failed to search podcasts: %s", ex)
@@ -103,27 +311,17 @@ class PodcastIndexAPI:
         term = search_term or self.search_term
         if term and term.isdigit():
             # First, get the podcast feed information to get the title
-            session = await self._get_session()
             params = {
                 "id": term,
             }
-            headers = self._generate_auth_headers()
             try:
                 # Get podcast feed information
-                async with session.get(
-                    f"{PODCAST_INDEX_BASE_URL}/podcasts/byfeedid",
-                    params=params,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response:
-                    response.raise_for_status()
-                    feed_data = await response.json()
-                    
-                    if feed_data.get("status") == "true" and feed_data.get("feed"):
-                        podcast = self._parse_podcast(feed_data["feed"])
-                    else:
-                        _LOGGER.warning("No podcast feed found for ID: %s", term)
-                        podcast = None
+                feed_data = await self._request(PODCAST_INDEX_PODCAST_BY_ID_ENDPOINT, params)
+                if feed_data.get("status") == "true" and feed_data.get("feed"):
+                    podcast = self._parse_podcast(feed_data["feed"])
+                else:
+                    _LOGGER.warning("No podcast feed found for ID: %s", term)
+                    podcast = None
                         
             except aiohttp.ClientError as ex:
                 _LOGGER.error("Failed to fetch podcast feed by ID: %s", ex)
@@ -138,33 +336,26 @@ class PodcastIndexAPI:
                 "max": 1,  # Get only the latest episode
             }
             try:
-                async with session.get(
-                    f"{PODCAST_INDEX_BASE_URL}/episodes/byfeedid",
-                    params=params,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    episodes = data.get("episodes") or data.get("items")
-                    if data.get("status") == "true" and episodes:
-                        episode = episodes[0]
-                        episode_data = self._parse_episode(episode)
-                        # Add podcast information if available
-                        if podcast:
-                            episode_data.update({
-                                "podcast_title": podcast.get("title", ""),
-                                "feed_url": podcast.get("feed_url", ""),
-                                "podcast_icon": podcast.get("image", ""),
-                            })
+                data = await self._request(PODCAST_INDEX_EPISODES_BY_ID_ENDPOINT, params)
+                episodes = data.get("episodes") or data.get("items")
+                if data.get("status") == "true" and episodes:
+                    episode = episodes[0]
+                    episode_data = self._parse_episode(episode)
+                    # Add podcast information if available
+                    if podcast:
                         episode_data.update({
-                            "podcast_id": term,
-                            "search_term": term,
+                            "podcast_title": podcast.get("title", ""),
+                            "feed_url": podcast.get("feed_url", ""),
+                            "podcast_icon": podcast.get("image", ""),
                         })
-                        return episode_data
-                    else:
-                        _LOGGER.warning("No episodes found or API returned error: %s", data)
-                        return None
+                    episode_data.update({
+                        "podcast_id": term,
+                        "search_term": term,
+                    })
+                    return episode_data
+                else:
+                    _LOGGER.warning("No episodes found or API returned error: %s", data)
+                    return None
             except aiohttp.ClientError as ex:
                 _LOGGER.error("Failed to fetch latest episode by podcast id: %s", ex)
                 raise
@@ -178,40 +369,52 @@ class PodcastIndexAPI:
             _LOGGER.warning("No podcast found for search term: %s", term)
             return None
         
-        # Then get the latest episode
-        session = await self._get_session()
-        
-        params = {
-            "url": podcast["feed_url"],
-            "max": 1,  # Get only the latest episode
-        }
-        
-        headers = self._generate_auth_headers()
+        return await self.get_latest_episode_for_podcast(podcast, term)
+
+    async def get_latest_episode_for_podcast(
+        self, podcast: dict[str, Any], search_term: str, since: int | None = None
+    ) -> dict[str, Any] | None:
+        """Get the latest episode of an already resolved podcast feed.
+
+        With ``since`` only episodes published from that timestamp on are
+        requested, and None is returned quietly when there are none.
+        """
+        episodes = await self.get_episodes_for_podcast(podcast, search_term, since=since)
+        return episodes[0] if episodes else None
+
+    async def get_episodes_for_podcast(
+        self,
+        podcast: dict[str, Any],
+        search_term: str,
+        max_episodes: int = 1,
+        since: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get the newest episodes of an already resolved podcast feed, newest first."""
+        if podcast.get("id"):
+            endpoint = PODCAST_INDEX_EPISODES_BY_ID_ENDPOINT
+            params: dict[str, Any] = {"id": podcast["id"]}
+        else:
+            endpoint = PODCAST_INDEX_EPISODES_ENDPOINT
+            params = {"url": podcast["feed_url"]}
+        params["max"] = max_episodes
+        if since:
+            params["since"] = since
         
         try:
-            async with session.get(
-                f"{PODCAST_INDEX_BASE_URL}{PODCAST_INDEX_EPISODES_ENDPOINT}",
-                params=params,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                episodes = data.get("episodes") or data.get("items")
-                if data.get("status") == "true" and episodes:
-                    episode = episodes[0]  # Get the first (latest) episode
-                    episode_data = self._parse_episode(episode)
-                    # Add podcast and search term info
-                    episode_data.update({
-                        "podcast_title": podcast.get("title", ""),
-                        "feed_url": podcast.get("feed_url", ""),
-                        "podcast_icon": podcast.get("image", ""),
-                        "search_term": term,
-                    })
-                    return episode_data
-                else:
-                    _LOGGER.warning("No episodes found or API returned error: %s", data)
-                    return None
+            data = await self._request(endpoint, params)
+            episodes = data.get("episodes") or data.get("items")
+            if data.get("status") == "true" and episodes:
+                # Add podcast and search term info
+                return [
+                    self.add_podcast_info(self._parse_episode(episode), podcast, search_term)
+                    for episode in episodes
+                ]
+            elif since and data.get("status") == "true":
+                _LOGGER.debug("No new episodes for '%s' since %s", search_term, since)
+                return []
+            else:
+                _LOGGER.warning("No episodes found or API returned error: %s", data)
+                return []
                     
         except aiohttp.ClientError as ex:
             _LOGGER.error("Failed to fetch latest episode: %s", ex)
@@ -220,37 +423,380 @@ class PodcastIndexAPI:
             _LOGGER.error("Unexpected error fetching latest episode: %s", ex)
             raise
 
-    def _parse_podcast(self, podcast_data: dict[str, Any]) -> dict[str, Any]:
-        """Parse podcast data from PodcastIndex API response."""
+    async def get_latest_episode_from_feed(
+        self, podcast: dict[str, Any], search_term: str
+    ) -> dict[str, Any] | None:
+        """Get the latest episode of a resolved podcast from its RSS feed.
+
+        The feed is fetched from its own host, without the API rate limiter,
+        backoff or circuit breaker. The request is conditional on the last
+        answer's ETag or Last-Modified date, and a 304 reuses the episode
+        parsed then. Otherwise the feed is parsed while it streams in and
+        the download stops at the end of the first item, so only the head
+        of long feeds is read. Returns None if the feed has no items.
+
+        Raises aiohttp.ClientError, or asyncio.TimeoutError, if the feed
+        can't be fetched or parsed.
+        """
+        feed_url = podcast["feed_url"]
+        cache_key = response_cache_key(RSS_FEED_ENDPOINT, {"url": feed_url})
+        cached = self.response_cache.get(cache_key)
+        feed_ids = (str(podcast["id"]),) if podcast.get("id") else ()
+        parser = FirstItemParser()
+        started = time.monotonic()
+        status: int | None = None
+        try:
+            session = await self._get_session()
+            async with session.get(
+                feed_url,
+                headers={
+                    "User-Agent": USER_AGENT,
+                    **(cached.validators() if cached is not None else {}),
+                },
+            ) as response:
+                status = response.status
+                not_modified = status == 304 and cached is not None
+                if not not_modified:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(RSS_CHUNK_SIZE):
+                        if parser.feed(chunk) or parser.bytes_read >= RSS_MAX_BYTES:
+                            break
+                response_headers = response.headers
+        except ParseError as ex:
+            error = aiohttp.ClientPayloadError(f"Invalid RSS from {feed_url}: {ex}")
+            self.metrics.record_request(
+                RSS_FEED_ENDPOINT, time.monotonic() - started, status,
+                parser.bytes_read, error, feed_ids,
+            )
+            raise error from ex
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            self.metrics.record_request(
+                RSS_FEED_ENDPOINT, time.monotonic() - started, status,
+                parser.bytes_read, ex, feed_ids,
+            )
+            raise
+        self.metrics.record_request(
+            RSS_FEED_ENDPOINT, time.monotonic() - started, status,
+            parser.bytes_read, feed_ids=feed_ids,
+        )
+        self.metrics.cache("response").record(not_modified)
+        if not_modified:
+            self.response_cache.revalidated(cache_key, RSS_FEED_ENDPOINT, response_headers)
+            episode = cached.data
+        else:
+            if (episode := parser.episode) is None:
+                _LOGGER.debug("No items in the first %d bytes of %s", parser.bytes_read, feed_url)
+                return None
+            self.response_cache.store(
+                cache_key, RSS_FEED_ENDPOINT, episode, parser.bytes_read, response_headers
+            )
+        # The cached episode is shared; add the podcast info to a copy
+        return self.add_podcast_info(dict(episode), podcast, search_term)
+
+    async def resolve_redirects(self, url: str) -> str:
+        """Follow the redirects of a URL and return the URL they end at.
+
+        Enclosure URLs usually pass through tracking redirects before the
+        CDN. A HEAD request follows them without downloading any audio;
+        servers that refuse HEAD get a GET for the first byte instead.
+        Like feeds, these hosts are not the API's, so the rate limiter,
+        backoff and circuit breaker don't apply.
+
+        Raises aiohttp.ClientError, or asyncio.TimeoutError, if the chain
+        can't be followed or ends in an error.
+        """
+        started = time.monotonic()
+        status: int | None = None
+        headers = {"User-Agent": USER_AGENT}
+        try:
+            session = await self._get_session()
+            async with session.head(
+                url, allow_redirects=True, max_redirects=ENCLOSURE_MAX_REDIRECTS,
+                headers=headers,
+            ) as response:
+                status = response.status
+                if status not in (405, 501):
+                    response.raise_for_status()
+                final_url = str(response.url)
+            if status in (405, 501):
+                async with session.get(
+                    url, max_redirects=ENCLOSURE_MAX_REDIRECTS,
+                    headers={**headers, "Range": "bytes=0-0"},
+                ) as response:
+                    status = response.status
+                    response.raise_for_status()
+                    final_url = str(response.url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            self.metrics.record_request(
+                ENCLOSURE_ENDPOINT, time.monotonic() - started, status, 0, ex
+            )
+            raise
+        self.metrics.record_request(ENCLOSURE_ENDPOINT, time.monotonic() - started, status, 0)
+        return final_url
+
+    async def stream_audio(self, url: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Yield an episode's audio file chunk by chunk as it downloads.
+
+        Downloads are not bound by the total request timeout, only by how
+        long a connect or a read may stall. Like feeds, audio is served by
+        the publisher's hosts, so the rate limiter, backoff and circuit
+        breaker don't apply.
+
+        Raises aiohttp.ClientError, or asyncio.TimeoutError, if the file
+        can't be downloaded.
+        """
+        started = time.monotonic()
+        status: int | None = None
+        received = 0
+        error: BaseException | None = None
+        try:
+            session = await self._get_session()
+            async with session.get(
+                url,
+                max_redirects=ENCLOSURE_MAX_REDIRECTS,
+                headers={"User-Agent": USER_AGENT},
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT
+                ),
+            ) as response:
+                status = response.status
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    received += len(chunk)
+                    yield chunk
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            error = ex
+            raise
+        finally:
+            self.metrics.record_request(
+                AUDIO_ENDPOINT, time.monotonic() - started, status, received, error
+            )
+
+    async def get_image(self, url: str, max_bytes: int) -> bytes:
+        """Download an image, such as a podcast's artwork.
+
+        Like feeds, artwork is served by the publisher's hosts, so the rate
+        limiter, backoff and circuit breaker don't apply.
+
+        Raises aiohttp.ClientError, or asyncio.TimeoutError, if the image
+        can't be downloaded or is larger than ``max_bytes``.
+        """
+        started = time.monotonic()
+        status: int | None = None
+        body = bytearray()
+        try:
+            session = await self._get_session()
+            async with session.get(url, headers={"User-Agent": USER_AGENT}) as response:
+                status = response.status
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(RSS_CHUNK_SIZE):
+                    body += chunk
+                    if len(body) > max_bytes:
+                        raise aiohttp.ClientPayloadError(
+                            f"Image at {url} is larger than {max_bytes} bytes"
+                        )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            self.metrics.record_request(
+                ARTWORK_ENDPOINT, time.monotonic() - started, status, len(body), ex
+            )
+            raise
+        self.metrics.record_request(
+            ARTWORK_ENDPOINT, time.monotonic() - started, status, len(body)
+        )
+        return bytes(body)
+
+    async def get_podcast_by_feed_id(self, feed_id: str) -> dict[str, Any] | None:
+        """Get podcast feed information by PodcastIndex feed id."""
+        try:
+            data = await self._request(PODCAST_INDEX_PODCAST_BY_ID_ENDPOINT, {"id": feed_id})
+            if data.get("status") == "true" and data.get("feed"):
+                return self._parse_podcast(data["feed"])
+            _LOGGER.warning("No podcast feed found for ID: %s", feed_id)
+            return None
+        except aiohttp.ClientError as ex:
+            _LOGGER.error("Failed to fetch podcast feed by ID: %s", ex)
+            raise
+
+    async def get_podcast_by_feed_url(self, feed_url: str) -> dict[str, Any] | None:
+        """Get podcast feed information by feed URL."""
+        try:
+            data = await self._request(PODCAST_INDEX_PODCAST_BY_URL_ENDPOINT, {"url": feed_url})
+        except aiohttp.ClientResponseError as ex:
+            # Unknown feed URLs are answered with an error status
+            if ex.status in (400, 404):
+                _LOGGER.debug("No podcast feed found for URL %s: %s", feed_url, ex)
+                return None
+            raise
+        except aiohttp.ClientError as ex:
+            _LOGGER.error("Failed to fetch podcast feed by URL: %s", ex)
+            raise
+        if data.get("status") == "true" and data.get("feed"):
+            return self._parse_podcast(data["feed"])
+        _LOGGER.debug("No podcast feed found for URL: %s", feed_url)
+        return None
+
+    async def get_podcasts_by_guids(self, guids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get the podcast feeds of many podcast GUIDs, BATCH_MAX_GUIDS per request.
+
+        Returns the parsed podcasts keyed by GUID; unknown GUIDs are left out.
+        """
+        podcasts: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(guids), BATCH_MAX_GUIDS):
+            batch = guids[start:start + BATCH_MAX_GUIDS]
+            try:
+                data = await self._request(PODCAST_INDEX_PODCASTS_BY_GUID_ENDPOINT, {}, batch)
+            except aiohttp.ClientError as ex:
+                _LOGGER.error("Failed to fetch podcast feeds by GUID: %s", ex)
+                raise
+            if data.get("status") != "true":
+                _LOGGER.warning("API returned error for podcast GUIDs: %s", data)
+                continue
+            for feed in data.get("feeds") or []:
+                if (guid := feed.get("podcastGuid")) and feed.get("id"):
+                    podcasts[guid] = self._parse_podcast(feed)
+        return podcasts
+
+    async def resolve_feed(self, search_term: str) -> dict[str, Any] | None:
+        """Resolve a search term or numeric podcast id to its podcast feed."""
+        if search_term.isdigit():
+            return await self.get_podcast_by_feed_id(search_term)
+        return await self.search_podcasts(search_term)
+
+    async def get_latest_episodes_by_feed_ids(
+        self,
+        feed_ids: list[str],
+        max_episodes: int = 1,
+        since: dict[str, int] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get the latest episode of several feeds with one request per batch.
+
+        Feeds without episodes in the response are left out of the result.
+        See get_episodes_by_feed_ids for ``since``.
+        """
+        episodes = await self.get_episodes_by_feed_ids(feed_ids, max_episodes, since)
+        return {feed_id: feed_episodes[0] for feed_id, feed_episodes in episodes.items()}
+
+    async def get_episodes_by_feed_ids(
+        self,
+        feed_ids: list[str],
+        max_episodes: int = 1,
+        since: dict[str, int] | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get up to max_episodes newest episodes of several feeds, one request per batch.
+
+        The endpoint accepts a comma-separated list of feed ids and returns
+        their episodes newest first, so each feed's list starts with its
+        latest episode. A batch asks for max_episodes per feed in it. When
+        its response is full, busy feeds may have crowded out the others,
+        so feeds without an episode in it are asked for on their own.
+        Feeds without episodes are left out of the result.
+
+        ``since`` maps feed ids to the publish time of their latest known
+        episode. When every feed of a batch has one, only episodes from the
+        oldest of those times on are requested.
+        """
+        episodes: dict[str, list[dict[str, Any]]] = {}
+        since = since or {}
+        for start in range(0, len(feed_ids), BATCH_MAX_FEEDS):
+            batch = feed_ids[start:start + BATCH_MAX_FEEDS]
+            limit = min(len(batch) * max_episodes, BATCH_MAX_EPISODES)
+            params = {
+                "id": ",".join(batch),
+                "max": limit,
+            }
+            if all(since.get(feed_id) for feed_id in batch):
+                params["since"] = min(since[feed_id] for feed_id in batch)
+            items = await self._get_episodes_by_feed_ids(batch, params)
+            for episode in items:
+                if feed_id := str(episode.get("feedId", "")):
+                    episodes.setdefault(feed_id, []).append(self._parse_episode(episode))
+            if len(items) < limit or len(batch) == 1:
+                continue
+            for feed_id in batch:
+                if feed_id in episodes:
+                    continue
+                params = {"id": feed_id, "max": max_episodes}
+                if since.get(feed_id):
+                    params["since"] = since[feed_id]
+                for episode in await self._get_episodes_by_feed_ids([feed_id], params):
+                    episodes.setdefault(feed_id, []).append(self._parse_episode(episode))
         return {
-            "title": podcast_data.get("title", ""),
-            "description": podcast_data.get("description", ""),
-            "feed_url": podcast_data.get("url", ""),
-            "website": podcast_data.get("link", ""),
-            "language": podcast_data.get("language", ""),
-            "author": podcast_data.get("author", ""),
-            "categories": podcast_data.get("categories", {}),
-            "image": podcast_data.get("image", ""),
-            "last_updated": podcast_data.get("lastUpdateTime", 0),
+            feed_id: feed_episodes[:max_episodes]
+            for feed_id, feed_episodes in episodes.items()
         }
 
+    async def _get_episodes_by_feed_ids(
+        self, feed_ids: list[str], params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Request the episodes of some feeds; return the raw items."""
+        try:
+            data = await self._request(PODCAST_INDEX_EPISODES_BY_ID_ENDPOINT, params)
+        except aiohttp.ClientError as ex:
+            _LOGGER.error("Failed to fetch latest episodes for feeds %s: %s", feed_ids, ex)
+            raise
+        if data.get("status") != "true":
+            _LOGGER.warning("API returned error for feeds %s: %s", feed_ids, data)
+            return []
+        return data.get("items") or data.get("episodes") or []
+
+    async def get_updated_feed_ids(
+        self, since: int, feed_ids: set[str]
+    ) -> tuple[set[str], int | None, bool]:
+        """Find which of the given feeds got new episodes since a timestamp.
+
+        Reads /recent/data page by page, following its nextSince cursor.
+        Returns the changed feed ids, the cursor to continue from next time
+        and whether all changes were read within DELTA_MAX_PAGES pages.
+        """
+        changed: set[str] = set()
+        cursor = since
+        for _ in range(DELTA_MAX_PAGES):
+            params = {
+                "since": cursor,
+                "max": DELTA_PAGE_SIZE,
+            }
+            try:
+                data = await self._request(PODCAST_INDEX_RECENT_DATA_ENDPOINT, params)
+            except aiohttp.ClientError as ex:
+                _LOGGER.error("Failed to fetch recently updated feeds: %s", ex)
+                raise
+            if data.get("status") != "true":
+                _LOGGER.warning("API returned error for recent data: %s", data)
+                return changed, None, False
+            items = data.get("items") or []
+            for record in (data.get("feeds") or []) + items:
+                feed_id = str(record.get("feedId", ""))
+                if feed_id in feed_ids:
+                    changed.add(feed_id)
+            next_since = data.get("nextSince")
+            if len(items) < DELTA_PAGE_SIZE or not next_since or next_since <= cursor:
+                return changed, next_since, True
+            cursor = next_since
+        return changed, cursor, False
+
+    def add_podcast_info(
+        self, episode_data: dict[str, Any], podcast: dict[str, Any], search_term: str
+    ) -> dict[str, Any]:
+        """Add podcast and search term information to a parsed episode."""
+        episode_data.update({
+            "podcast_title": podcast.get("title", ""),
+            "feed_url": podcast.get("feed_url", ""),
+            "podcast_icon": podcast.get("image", ""),
+            "podcast_id": str(podcast.get("id", "")),
+            "search_term": search_term,
+        })
+        return episode_data
+
+    def _parse_podcast(self, podcast_data: dict[str, Any]) -> dict[str, Any]:
+        """Parse podcast data from PodcastIndex API response."""
+        return parse_podcast(podcast_data)
+
     def _parse_episode(self, episode_data: dict[str, Any]) -> dict[str, Any]:
         """Parse episode data from PodcastIndex API response."""
-        return {
-            "title": episode_data.get("title", ""),
-            "description": episode_data.get("description", ""),
-            "publish_date": episode_data.get("datePublished", 0),
-            "duration": episode_data.get("duration", 0),
-            "audio_url": episode_data.get("enclosureUrl", ""),
-            "podcast_title": episode_data.get("feedTitle", ""),
-            "episode_number": episode_data.get("episode", None),
-            "season_number": episode_data.get("season", None),
-            "guid": episode_data.get("guid", ""),
-            "link": episode_data.get("link", ""),
-        }
+        return parse_episode(episode_data)
 
     async def close(self) -> None:
-        """Close the aiohttp session."""
+        """Close the aiohttp session and its connection pool."""
         if self.session:
             await self.session.close()
             self.session = None 
\ No newline at end of file
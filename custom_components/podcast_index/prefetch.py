@@ -0,0 +1,303 @@
+"""Background download of the newest episodes' audio."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from contextlib import aclosing
+import hashlib
+import logging
+import os
+from pathlib import Path
+import time
+from typing import BinaryIO
+from urllib.parse import urlparse
+
+import aiohttp
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    PREFETCH_CHUNK_SIZE,
+    PREFETCH_DIRECTORY,
+    PREFETCH_EXTENSIONS,
+    PREFETCH_QUOTA,
+    PREFETCH_RATE_LIMIT,
+    PREFETCH_SAVE_DELAY,
+    PREFETCH_SKIPPED_SIZE,
+    PREFETCH_STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .coordinator import PodcastIndexTermCoordinator
+from .podcast_index_api import PodcastIndexAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+_PARTIAL_SUFFIX = ".part"
+
+
+def _filename(url: str) -> str:
+    """Return the local file name of an audio URL."""
+    extension = Path(urlparse(url).path).suffix.lower()
+    if extension not in PREFETCH_EXTENSIONS:
+        extension = ".mp3"
+    return hashlib.sha1(url.encode()).hexdigest()[:20] + extension
+
+
+def _scan(directory: Path) -> list[tuple[str, int]]:
+    """Create the directory and list its audio files, least recently used first.
+
+    Partial downloads left by a restart are deleted.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    files: list[tuple[float, str, int]] = []
+    for path in directory.iterdir():
+        if path.suffix == _PARTIAL_SUFFIX:
+            path.unlink(missing_ok=True)
+        elif path.is_file():
+            stat = path.stat()
+            files.append((stat.st_mtime, path.name, stat.st_size))
+    return [(name, size) for _mtime, name, size in sorted(files)]
+
+
+def _touch(path: Path) -> None:
+    """Set a file's modification time to now, unless it was deleted meanwhile."""
+    try:
+        os.utime(path)
+    except OSError as ex:
+        _LOGGER.debug("Failed to touch %s: %s", path, ex)
+
+
+class AudioPrefetcher:
+    """Local copies of the newest episodes, shared by all config entries.
+
+    When a tracked coordinator gets an episode whose audio isn't on disk
+    yet, it is downloaded below the "local" media directory. Downloads
+    run one at a time and are paced to PREFETCH_RATE_LIMIT bytes per
+    second, so together they never use more of the connection than that.
+    Once the files add up to more than PREFETCH_QUOTA bytes, the least
+    recently downloaded or played are deleted, except the current episode
+    of every tracked feed. Evicted episodes, and new ones that don't fit
+    next to the current episodes, are remembered across restarts and not
+    downloaded again. Local copies are offered as media source ids, which
+    media players and the media browser resolve to a URL on Home Assistant
+    itself.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, api: PodcastIndexAPI, media_dir: str
+    ) -> None:
+        """Initialize the prefetcher of a media directory."""
+        self._hass = hass
+        self._api = api
+        self._directory = Path(media_dir) / PREFETCH_DIRECTORY
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self.size = 0
+        self._skipped: dict[str, None] = {}
+        self._store: Store[dict[str, list[str]]] = Store(
+            hass, STORAGE_VERSION, PREFETCH_STORAGE_KEY
+        )
+        self._lock = asyncio.Lock()
+        self._pending: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._coordinators: dict[tuple[str, str], PodcastIndexTermCoordinator] = {}
+        self._unsubs: dict[tuple[str, str], CALLBACK_TYPE] = {}
+
+    async def async_load(self) -> None:
+        """Index the audio files downloaded before a restart."""
+        for name, size in await self._hass.async_add_executor_job(_scan, self._directory):
+            self._files[name] = size
+            self.size += size
+        stored = await self._store.async_load() or {}
+        self._skipped = dict.fromkeys(stored.get("skipped", []))
+        _LOGGER.debug("Found %d prefetched episodes (%d bytes)", len(self._files), self.size)
+
+    def local_media_id(self, url: str) -> str | None:
+        """Return the media source id of an episode's local copy, if there is one."""
+        if (name := _filename(url)) not in self._files:
+            return None
+        return f"media-source://media_source/local/{PREFETCH_DIRECTORY}/{name}"
+
+    @callback
+    def async_touch(self, url: str) -> None:
+        """Mark a local copy as just played, so it is evicted last."""
+        if (name := _filename(url)) in self._files:
+            self._files.move_to_end(name)
+            # The modification time keeps the order across restarts
+            self._hass.async_add_executor_job(_touch, self._directory / name)
+
+    @callback
+    def async_track(self, entry_id: str, coordinator: PodcastIndexTermCoordinator) -> None:
+        """Download the audio of every new episode the coordinator gets."""
+        key = (entry_id, coordinator.term)
+
+        @callback
+        def _async_coordinator_updated() -> None:
+            """Download the latest episode's audio unless it is on disk."""
+            if coordinator.data and (url := coordinator.data.get("audio_url")):
+                self._async_schedule(url)
+
+        self._coordinators[key] = coordinator
+        self._unsubs[key] = coordinator.async_add_listener(_async_coordinator_updated)
+        _async_coordinator_updated()
+
+    @callback
+    def async_forget(self, entry_id: str, term: str) -> None:
+        """Stop tracking a removed term."""
+        self._coordinators.pop((entry_id, term), None)
+        if (unsub := self._unsubs.pop((entry_id, term), None)) is not None:
+            unsub()
+
+    @callback
+    def async_stop(self, entry_id: str) -> None:
+        """Stop tracking the coordinators of an unloaded entry."""
+        for key in [key for key in self._coordinators if key[0] == entry_id]:
+            self.async_forget(*key)
+
+    async def async_shutdown(self) -> None:
+        """Cancel the downloads in progress, keeping the finished ones."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._store.async_save(self._skipped_as_dict())
+
+    def stats(self) -> dict[str, int]:
+        """Return the size of the local copies for diagnostics."""
+        return {
+            "episodes": len(self._files),
+            "bytes": self.size,
+            "quota": PREFETCH_QUOTA,
+            "pending": len(self._pending),
+            "skipped": len(self._skipped),
+        }
+
+    def _current(self) -> set[str]:
+        """Return the local files of the tracked feeds' current episodes."""
+        return {
+            _filename(url)
+            for coordinator in self._coordinators.values()
+            if coordinator.data and (url := coordinator.data.get("audio_url"))
+        } & self._files.keys()
+
+    def _skipped_as_dict(self) -> dict[str, list[str]]:
+        """Return the skipped episodes for storage."""
+        return {"skipped": list(self._skipped)}
+
+    @callback
+    def _async_skip(self, names: list[str]) -> None:
+        """Never download these episodes again."""
+        for name in names:
+            self._skipped.pop(name, None)
+            self._skipped[name] = None
+        while len(self._skipped) > PREFETCH_SKIPPED_SIZE:
+            del self._skipped[next(iter(self._skipped))]
+        self._store.async_delay_save(self._skipped_as_dict, PREFETCH_SAVE_DELAY)
+
+    @callback
+    def _async_schedule(self, url: str) -> None:
+        """Queue the download of an episode's audio."""
+        name = _filename(url)
+        if url in self._pending or name in self._files or name in self._skipped:
+            return
+        self._pending.add(url)
+        task = self._hass.async_create_background_task(
+            self._async_download(url), f"{DOMAIN} prefetch {url}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_download(self, url: str) -> None:
+        """Download one episode once the previous download has finished."""
+        name = _filename(url)
+        path = self._directory / name
+        partial = path.with_name(name + _PARTIAL_SUFFIX)
+        try:
+            async with self._lock:
+                # Room left next to the current episodes, which are never evicted
+                room = PREFETCH_QUOTA - sum(
+                    self._files[current] for current in self._current() - {name}
+                )
+                size = await self._async_stream_to(url, partial, room)
+                if size is None:
+                    return
+                if size > room:
+                    _LOGGER.warning(
+                        "Not prefetching %s, it doesn't fit the disk quota next to "
+                        "the current episodes of the tracked feeds",
+                        url,
+                    )
+                    self._async_skip([name])
+                    return
+                await self._hass.async_add_executor_job(partial.rename, path)
+        finally:
+            self._pending.discard(url)
+        self._files[name] = size
+        self.size += size
+        _LOGGER.debug("Prefetched %s (%d bytes)", url, size)
+        evicted = await self._async_evict(keep={name, *self._current()})
+        if evicted:
+            self._async_skip(evicted)
+        changed = {name, *evicted}
+        # Sensors show the local copy, or stop showing an evicted one
+        for coordinator in self._coordinators.values():
+            if coordinator.data and _filename(coordinator.data.get("audio_url") or "") in changed:
+                coordinator.async_update_listeners()
+
+    async def _async_stream_to(self, url: str, partial: Path, room: int) -> int | None:
+        """Write an episode to a partial file; return its size, or None on failure.
+
+        Once the episode is larger than room, the download stops and
+        room + 1 is returned.
+        """
+        if room <= 0:
+            return room + 1
+        try:
+            file: BinaryIO = await self._hass.async_add_executor_job(partial.open, "wb")
+        except OSError as ex:
+            _LOGGER.warning("Failed to prefetch %s: %s", url, ex)
+            return None
+        written = 0
+        complete = False
+        started = time.monotonic()
+        try:
+            async with aclosing(
+                self._api.stream_audio(url, PREFETCH_CHUNK_SIZE)
+            ) as chunks:
+                async for chunk in chunks:
+                    written += len(chunk)
+                    if written > room:
+                        break
+                    await self._hass.async_add_executor_job(file.write, chunk)
+                    # Pause whenever the download runs ahead of the bandwidth cap
+                    if (ahead := written / PREFETCH_RATE_LIMIT - (time.monotonic() - started)) > 0:
+                        await asyncio.sleep(ahead)
+                else:
+                    complete = True
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as ex:
+            _LOGGER.warning("Failed to prefetch %s: %s", url, ex)
+            return None
+        finally:
+            await self._hass.async_add_executor_job(file.close)
+            if not complete:
+                await self._hass.async_add_executor_job(partial.unlink, True)
+        return written if complete else room + 1
+
+    async def _async_evict(self, keep: set[str]) -> list[str]:
+        """Delete the least recently used files until the quota is met.
+
+        Files in keep, the one just downloaded and the tracked feeds'
+        current episodes, are never deleted.
+        """
+        evicted: list[str] = []
+        for name in list(self._files):
+            if self.size <= PREFETCH_QUOTA:
+                break
+            if name in keep:
+                continue
+            self.size -= self._files.pop(name)
+            await self._hass.async_add_executor_job(
+                (self._directory / name).unlink, True
+            )
+            evicted.append(name)
+        return evicted
@@ -0,0 +1,149 @@
+"""Backoff and circuit breaking for PodcastIndex API requests."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+
+import aiohttp
+
+from .const import (
+    BACKOFF_INITIAL,
+    BACKOFF_MAX,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PodcastIndexUnavailableError(aiohttp.ClientError):
+    """Raised instead of sending a request while the API is considered down.
+
+    It is a ClientError so callers handle it like any other failed request,
+    without waiting for a timeout first.
+    """
+
+
+def is_outage(ex: BaseException) -> bool:
+    """Return True if an error means the API is struggling, not the request.
+
+    Client errors such as 400 or 404 say nothing about the API's health and
+    must not trip the breaker; 429 and 5xx responses, timeouts and
+    connection errors do.
+    """
+    if isinstance(ex, aiohttp.ClientResponseError):
+        return ex.status == 429 or ex.status >= 500
+    return isinstance(ex, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def _retry_after(ex: BaseException) -> float:
+    """Return the Retry-After delay a response asked for, if any."""
+    if isinstance(ex, aiohttp.ClientResponseError) and ex.headers:
+        try:
+            return float(ex.headers.get("Retry-After", 0))
+        except ValueError:
+            return 0
+    return 0
+
+
+class EndpointBackoff:
+    """Exponential backoff with jitter, tracked per endpoint.
+
+    After each consecutive failure an endpoint is left alone for a delay
+    that doubles from BACKOFF_INITIAL up to BACKOFF_MAX. Half of the delay
+    is randomized so many callers don't come back in lockstep.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the backoff state."""
+        self._failures: dict[str, int] = {}
+        self._retry_at: dict[str, float] = {}
+
+    def check(self, endpoint: str) -> None:
+        """Raise if the endpoint is still backing off."""
+        retry_at = self._retry_at.get(endpoint, 0)
+        if (remaining := retry_at - time.monotonic()) > 0:
+            raise PodcastIndexUnavailableError(
+                f"{endpoint} is backing off for another {remaining:.0f}s"
+            )
+
+    def record_success(self, endpoint: str) -> None:
+        """Reset the endpoint after a successful request."""
+        self._failures.pop(endpoint, None)
+        self._retry_at.pop(endpoint, None)
+
+    def record_failure(self, endpoint: str, ex: BaseException) -> None:
+        """Back off the endpoint after a failed request."""
+        failures = self._failures.get(endpoint, 0) + 1
+        self._failures[endpoint] = failures
+        delay = min(BACKOFF_MAX, BACKOFF_INITIAL * 2 ** (failures - 1))
+        delay = max(delay / 2 + random.uniform(0, delay / 2), _retry_after(ex))
+        self._retry_at[endpoint] = time.monotonic() + delay
+        _LOGGER.debug(
+            "%s failed %d time(s) in a row, backing off for %.0fs: %s",
+            endpoint,
+            failures,
+            delay,
+            ex,
+        )
+
+
+class CircuitBreaker:
+    """Circuit breaker shared by every request of an API client.
+
+    After CIRCUIT_FAILURE_THRESHOLD consecutive outage errors the circuit
+    opens and requests fail immediately. After CIRCUIT_RESET_TIMEOUT a
+    single probe request is let through; its outcome closes the circuit or
+    opens it again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a closed circuit."""
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being refused."""
+        return self._opened_at is not None
+
+    def check(self) -> None:
+        """Raise if the circuit is open and it isn't time for a probe yet."""
+        if self._opened_at is None:
+            return
+        if self._probing or time.monotonic() - self._opened_at < CIRCUIT_RESET_TIMEOUT:
+            raise PodcastIndexUnavailableError(
+                "PodcastIndex API circuit is open after repeated failures"
+            )
+        self._probing = True
+        _LOGGER.debug("Circuit half-open, sending a probe request")
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self._opened_at is not None:
+            _LOGGER.info("PodcastIndex API is reachable again, closing the circuit")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count an outage error and open the circuit once there are enough."""
+        self._failures += 1
+        if self._probing or (
+            self._opened_at is None and self._failures >= CIRCUIT_FAILURE_THRESHOLD
+        ):
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "PodcastIndex API failed %d times in a row, pausing requests for %ds",
+                    self._failures,
+                    CIRCUIT_RESET_TIMEOUT,
+                )
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Let another probe through if the last one ended without a verdict."""
+        self._probing = False
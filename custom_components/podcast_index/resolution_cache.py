@@ -0,0 +1,127 @@
+"""Persistent cache of search term to podcast feed resolutions."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    RESOLUTION_CACHE_NEGATIVE_TTL,
+    RESOLUTION_CACHE_SAVE_DELAY,
+    RESOLUTION_CACHE_STORAGE_KEY,
+    RESOLUTION_CACHE_TTL,
+    STORAGE_VERSION,
+)
+from .metrics import CacheStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Podcast fields worth keeping; everything else in a search result is unused
+_CACHED_FIELDS = ("id", "title", "feed_url", "image", "last_updated")
+
+
+class ResolutionCache:
+    """Map search terms to the podcast feed they resolved to.
+
+    Entries live in Home Assistant's .storage so restarts don't repeat the
+    searches, and expire after RESOLUTION_CACHE_TTL seconds so a term that
+    starts matching a different feed is eventually picked up. Terms that
+    matched no feed are remembered for RESOLUTION_CACHE_NEGATIVE_TTL
+    seconds, so a typo doesn't cost a search on every poll.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, RESOLUTION_CACHE_STORAGE_KEY
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self.stats = CacheStats()
+
+    @staticmethod
+    def _key(term: str) -> str:
+        """Normalize a term so equivalent spellings share an entry."""
+        return term.strip().lower()
+
+    async def async_load(self) -> None:
+        """Load the cache from storage once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._entries = await self._store.async_load() or {}
+            self._loaded = True
+            _LOGGER.debug("Loaded %d cached term resolutions", len(self._entries))
+
+    def get(self, term: str, allow_expired: bool = False) -> dict[str, Any] | None:
+        """Return the cached podcast for a term, or None if missing or expired.
+
+        Lookups that don't allow expired entries count towards ``stats``.
+        """
+        entry = self._entries.get(self._key(term))
+        if entry is not None and entry["podcast"] is None:
+            # Handled by unresolved()
+            return None
+        fresh = (
+            entry is not None
+            and time.time() - entry["resolved_at"] <= RESOLUTION_CACHE_TTL
+        )
+        if not allow_expired:
+            self.stats.record(fresh)
+        if entry is None or not (fresh or allow_expired):
+            return None
+        return entry["podcast"]
+
+    def unresolved(self, term: str) -> bool:
+        """Return True if the term recently matched no feed.
+
+        A True answer counts as a hit towards ``stats``.
+        """
+        entry = self._entries.get(self._key(term))
+        if (
+            entry is None
+            or entry["podcast"] is not None
+            or time.time() - entry["resolved_at"] > RESOLUTION_CACHE_NEGATIVE_TTL
+        ):
+            return False
+        self.stats.record(True)
+        return True
+
+    @callback
+    def async_set_unresolved(self, term: str) -> None:
+        """Remember that a term matched no feed."""
+        self._entries[self._key(term)] = {"podcast": None, "resolved_at": time.time()}
+        self._async_schedule_save()
+
+    @callback
+    def async_set(self, term: str, podcast: dict[str, Any]) -> dict[str, Any]:
+        """Cache the podcast a term resolved to and return the cached copy."""
+        cached = {field: podcast.get(field) for field in _CACHED_FIELDS}
+        self._entries[self._key(term)] = {
+            "podcast": cached,
+            "resolved_at": time.time(),
+        }
+        self._async_schedule_save()
+        return cached
+
+    @callback
+    def async_invalidate(self, term: str | None = None) -> int:
+        """Drop one term, or every term when none is given; return the count."""
+        if term is None:
+            count = len(self._entries)
+            self._entries.clear()
+        else:
+            count = 1 if self._entries.pop(self._key(term), None) else 0
+        if count:
+            self._async_schedule_save()
+        return count
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Write the cache to storage after a short delay."""
+        self._store.async_delay_save(lambda: self._entries, RESOLUTION_CACHE_SAVE_DELAY)
@@ -0,0 +1,179 @@
+"""Conditional-request cache of decoded PodcastIndex API responses."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+import time
+from typing import Any
+from urllib.parse import urlencode
+
+from .const import RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_TTLS
+
+
+def response_cache_key(
+    endpoint: str, params: Mapping[str, Any], json_body: list[str] | None = None
+) -> str:
+    """Return the cache key of a request: endpoint, sorted params and body.
+
+    Auth headers are not part of the key; they change with every request.
+    """
+    key = f"{endpoint}?{urlencode(sorted((name, str(value)) for name, value in params.items()))}"
+    if json_body:
+        key += "#" + ",".join(json_body)
+    return key
+
+
+class CachedResponse:
+    """A decoded response body with its validators and expiry time."""
+
+    __slots__ = ("data", "etag", "last_modified", "expires_at", "size")
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        etag: str | None,
+        last_modified: str | None,
+        expires_at: float,
+        size: int,
+    ) -> None:
+        """Initialize the cached response."""
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.size = size
+
+    @property
+    def fresh(self) -> bool:
+        """Return True while the response may be used without asking the API."""
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        """Return True if the API can confirm the response is still current."""
+        return bool(self.etag or self.last_modified)
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def as_list(self) -> list[Any]:
+        """Return the response as a compact list for storage."""
+        return [getattr(self, field) for field in self.__slots__]
+
+
+class ResponseCache:
+    """Size-bounded LRU of decoded API responses, revalidated with ETags.
+
+    A response is served without a request while it is fresh, for the TTL
+    RESPONSE_CACHE_TTLS gives its endpoint. Afterwards it is kept only if
+    the API sent an ETag or Last-Modified header, so the next request can
+    be conditional and a 304 reuses the decoded body. Endpoints without a
+    TTL are never cached. The least recently used responses are evicted
+    once their bodies add up to more than ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = RESPONSE_CACHE_MAX_BYTES) -> None:
+        """Initialize an empty cache."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        # Called after every change, to schedule saving the cache
+        self.on_change: Callable[[], None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    @staticmethod
+    def cacheable(endpoint: str) -> bool:
+        """Return True if responses of the endpoint are cached."""
+        return endpoint in RESPONSE_CACHE_TTLS
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response of a request, fresh or revalidatable."""
+        if (cached := self._entries.get(key)) is None:
+            return None
+        if not cached.fresh and not cached.revalidatable:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return cached
+
+    def store(
+        self,
+        key: str,
+        endpoint: str,
+        data: dict[str, Any],
+        size: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Cache a full response, if it can be reused at all."""
+        ttl = RESPONSE_CACHE_TTLS[endpoint]
+        cached = CachedResponse(
+            data,
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+            time.time() + ttl,
+            size,
+        )
+        self._remove(key)
+        if (not ttl and not cached.revalidatable) or size > self.max_bytes:
+            return
+        self._entries[key] = cached
+        self.size += size
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+        self._changed()
+
+    def revalidated(self, key: str, endpoint: str, headers: Mapping[str, str]) -> None:
+        """Extend a cached response after the API answered 304 Not Modified."""
+        if (cached := self._entries.get(key)) is None:
+            return
+        cached.expires_at = time.time() + RESPONSE_CACHE_TTLS[endpoint]
+        cached.etag = headers.get("ETag") or cached.etag
+        cached.last_modified = headers.get("Last-Modified") or cached.last_modified
+        self._changed()
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+        self.size = 0
+        self._changed()
+
+    def _remove(self, key: str) -> None:
+        """Drop one cached response."""
+        if (cached := self._entries.pop(key, None)) is not None:
+            self.size -= cached.size
+
+    def _changed(self) -> None:
+        """Tell the owner the cache changed."""
+        if self.on_change is not None:
+            self.on_change()
+
+    def as_dict(self) -> dict[str, list[Any]]:
+        """Return the cache in its storage format, least recently used first."""
+        return {key: cached.as_list() for key, cached in self._entries.items()}
+
+    def restore(self, stored: dict[str, list[Any]]) -> None:
+        """Add responses in the storage format, skipping ones that can't be used."""
+        for key, values in stored.items():
+            cached = CachedResponse(*values)
+            if (cached.fresh or cached.revalidatable) and key not in self._entries:
+                self._entries[key] = cached
+                self.size += cached.size
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def stats(self) -> dict[str, Any]:
+        """Return the size of the cache for diagnostics."""
+        return {
+            "responses": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+        }
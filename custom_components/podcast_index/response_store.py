@@ -0,0 +1,45 @@
+"""Persistence of the API response cache across restarts."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import RESPONSE_CACHE_SAVE_DELAY, RESPONSE_CACHE_STORAGE_KEY, STORAGE_VERSION
+from .response_cache import ResponseCache
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResponseCacheStore:
+    """Keep the response cache of the shared API client in .storage.
+
+    After a restart, cached responses can be revalidated right away, so the
+    first polls get 304 answers instead of full downloads. The cache is
+    written RESPONSE_CACHE_SAVE_DELAY seconds after it changes.
+    """
+
+    def __init__(self, hass: HomeAssistant, cache: ResponseCache) -> None:
+        """Initialize the store of a response cache."""
+        self._store: Store[dict[str, list[Any]]] = Store(
+            hass, STORAGE_VERSION, RESPONSE_CACHE_STORAGE_KEY
+        )
+        self._cache = cache
+
+    async def async_load(self) -> None:
+        """Restore the stored responses and save the cache when it changes."""
+        self._cache.restore(await self._store.async_load() or {})
+        self._cache.on_change = self._async_schedule_save
+        _LOGGER.debug("Restored %d cached API responses", len(self._cache))
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the cache after a delay, merging bursts of changes."""
+        self._store.async_delay_save(self._cache.as_dict, RESPONSE_CACHE_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Stop following the cache and save it now."""
+        self._cache.on_change = None
+        await self._store.async_save(self._cache.as_dict())
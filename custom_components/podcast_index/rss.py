@@ -0,0 +1,116 @@
+"""Streaming parser for the newest episode of an RSS feed."""
+from __future__ import annotations
+
+from email.utils import parsedate_to_datetime
+from typing import Any
+from xml.etree.ElementTree import Element, XMLPullParser
+
+_ITUNES = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+_CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+
+
+def _duration(value: str | None) -> int:
+    """Return an itunes:duration ("3723", "62:03" or "1:02:03") in seconds."""
+    if not value:
+        return 0
+    seconds = 0
+    try:
+        for part in value.strip().split(":"):
+            seconds = seconds * 60 + int(float(part))
+    except ValueError:
+        return 0
+    return seconds
+
+
+def _timestamp(value: str | None) -> int:
+    """Return an RFC 822 pubDate as a Unix timestamp, or 0."""
+    if not value:
+        return 0
+    try:
+        return int(parsedate_to_datetime(value.strip()).timestamp())
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
+
+def _int_or_none(value: str | None) -> int | None:
+    """Return an integer element text, or None."""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+class FirstItemParser:
+    """Incrementally parse an RSS feed until its first item is complete.
+
+    Feed the response body chunk by chunk; once ``feed`` returns True the
+    rest of the document need not be downloaded. Elements are cleared as
+    soon as they are read, so only the first item is ever held in memory.
+    Raises xml.etree.ElementTree.ParseError for malformed feeds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._path: list[str] = []
+        self._fields: dict[str, Any] = {}
+        self.podcast_title = ""
+        self.bytes_read = 0
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse the next chunk; return True once the first item is complete."""
+        if self.done:
+            return True
+        self.bytes_read += len(chunk)
+        self._parser.feed(chunk)
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._path.append(element.tag)
+                continue
+            self._path.pop()
+            if self._end(element):
+                self.done = True
+                break
+        return self.done
+
+    def _end(self, element: Element) -> bool:
+        """Read a completed element; return True at the end of the first item."""
+        tag = element.tag
+        parent = self._path[-1] if self._path else None
+        if tag == "item":
+            return True
+        if parent == "item":
+            if tag == "enclosure":
+                self._fields.setdefault("enclosure", element.get("url"))
+            else:
+                self._fields.setdefault(tag, (element.text or "").strip())
+        elif parent == "channel":
+            if tag == "title":
+                self.podcast_title = (element.text or "").strip()
+            element.clear()
+        return False
+
+    @property
+    def episode(self) -> dict[str, Any] | None:
+        """Return the first item as a parsed episode, once it is complete."""
+        if not self.done:
+            return None
+        fields = self._fields
+        return {
+            "title": fields.get("title") or "",
+            "description": (
+                fields.get(f"{_CONTENT}encoded")
+                or fields.get("description")
+                or fields.get(f"{_ITUNES}summary")
+                or ""
+            ),
+            "publish_date": _timestamp(fields.get("pubDate")),
+            "duration": _duration(fields.get(f"{_ITUNES}duration")),
+            "audio_url": fields.get("enclosure") or "",
+            "podcast_title": self.podcast_title,
+            "episode_number": _int_or_none(fields.get(f"{_ITUNES}episode")),
+            "season_number": _int_or_none(fields.get(f"{_ITUNES}season")),
+            "guid": fields.get("guid") or fields.get("enclosure") or "",
+            "link": fields.get("link") or "",
+        }
@@ -0,0 +1,237 @@
+"""Adaptive per-feed poll scheduling for the PodcastIndex integration."""
+from __future__ import annotations
+
+import logging
+import math
+import statistics
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ADAPTIVE_DORMANT_RELEASES,
+    ADAPTIVE_LEARNING_INTERVAL,
+    ADAPTIVE_MAX_INTERVAL,
+    ADAPTIVE_MIN_HISTORY,
+    ADAPTIVE_MIN_INTERVAL,
+    ADAPTIVE_MIN_WINDOW,
+    ADAPTIVE_REQUEST_BUDGET,
+    ADAPTIVE_TICK_INTERVAL,
+)
+from .coordinator import PodcastIndexTermCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _isoformat(timestamp: float) -> str:
+    """Format a timestamp for logs and service responses."""
+    return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).isoformat(
+        timespec="seconds"
+    )
+
+
+class FeedSchedule:
+    """Learned release pattern and next poll time of one feed."""
+
+    __slots__ = (
+        "coordinator",
+        "cadence",
+        "deferred",
+        "expected_release",
+        "in_window",
+        "next_poll",
+        "polling",
+        "reason",
+    )
+
+    def __init__(self, coordinator: PodcastIndexTermCoordinator) -> None:
+        """Initialize the schedule."""
+        self.coordinator = coordinator
+        self.cadence: float | None = None
+        self.deferred = False
+        self.expected_release: float | None = None
+        self.in_window = False
+        self.next_poll = 0.0
+        self.polling = False
+        self.reason = "not planned yet"
+
+    def plan(self, now: float) -> None:
+        """Work out when to poll next from the feed's past publish times.
+
+        The median gap between releases is the feed's cadence and the next
+        release is expected one cadence after the last one. Around that
+        time, within a window sized by how regular the feed is, the feed is
+        polled every ADAPTIVE_MIN_INTERVAL; outside of it the scheduler
+        waits for the window to open, checking at least every
+        ADAPTIVE_MAX_INTERVAL.
+        """
+        times = self.coordinator.publish_times
+        self.in_window = False
+        if len(times) < ADAPTIVE_MIN_HISTORY:
+            self.cadence = self.expected_release = None
+            self._set(
+                now,
+                ADAPTIVE_LEARNING_INTERVAL,
+                f"learning release pattern ({len(times)} episodes seen)",
+            )
+            return
+
+        intervals = [later - earlier for earlier, later in zip(times, times[1:])]
+        cadence = statistics.median(intervals)
+        deviation = statistics.median(abs(interval - cadence) for interval in intervals)
+        window = min(max(2 * deviation, ADAPTIVE_MIN_WINDOW), cadence / 4)
+        self.cadence = cadence
+
+        missed = max(0, math.ceil((now - window - times[-1]) / cadence) - 1)
+        if missed >= ADAPTIVE_DORMANT_RELEASES:
+            self.expected_release = None
+            self._set(
+                now,
+                ADAPTIVE_MAX_INTERVAL,
+                f"dormant: {missed} expected releases missed",
+            )
+            return
+
+        expected = times[-1] + (missed + 1) * cadence
+        self.expected_release = expected
+        if now >= expected - window:
+            self.in_window = True
+            self._set(
+                now,
+                ADAPTIVE_MIN_INTERVAL,
+                f"in release window around {_isoformat(expected)}",
+            )
+        elif expected - window - now > ADAPTIVE_MAX_INTERVAL:
+            self._set(
+                now,
+                ADAPTIVE_MAX_INTERVAL,
+                f"backing off, next release expected around {_isoformat(expected)}",
+            )
+        else:
+            self._set(
+                now,
+                expected - window - now,
+                f"waiting for release window opening {_isoformat(expected - window)}",
+            )
+
+    def _set(self, now: float, delay: float, reason: str) -> None:
+        """Set the next poll time and the reason for it."""
+        self.deferred = False
+        self.next_poll = now + max(delay, ADAPTIVE_MIN_INTERVAL)
+        self.reason = reason
+        _LOGGER.debug(
+            "Next poll for '%s' at %s: %s",
+            self.coordinator.term,
+            _isoformat(self.next_poll),
+            reason,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Describe the schedule for debugging."""
+        return {
+            "term": self.coordinator.term,
+            "next_poll": _isoformat(self.next_poll),
+            "reason": self.reason,
+            "deferred_by_budget": self.deferred,
+            "cadence_hours": (
+                round(self.cadence / 3600, 1) if self.cadence is not None else None
+            ),
+            "expected_release": (
+                _isoformat(self.expected_release)
+                if self.expected_release is not None
+                else None
+            ),
+            "episodes_seen": len(self.coordinator.publish_times),
+        }
+
+
+class AdaptivePollScheduler:
+    """Refresh term coordinators when their feeds are likely to publish.
+
+    One scheduler serves all config entries so ADAPTIVE_REQUEST_BUDGET caps
+    the polls of the whole integration. Every ADAPTIVE_TICK_INTERVAL the
+    due feeds are refreshed, feeds inside a release window first; feeds
+    that don't fit in the budget wait for the next tick.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._schedules: dict[tuple[str, str], FeedSchedule] = {}
+        self._polls: deque[float] = deque()
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, entry_id: str, coordinator: PodcastIndexTermCoordinator) -> None:
+        """Start scheduling a term coordinator."""
+        schedule = FeedSchedule(coordinator)
+        schedule.plan(time.time())
+        self._schedules[(entry_id, coordinator.term)] = schedule
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=ADAPTIVE_TICK_INTERVAL)
+            )
+
+    @callback
+    def async_remove(self, entry_id: str, term: str | None = None) -> None:
+        """Stop scheduling one term, or every term of an entry."""
+        for key in list(self._schedules):
+            if key[0] == entry_id and term in (None, key[1]):
+                del self._schedules[key]
+        if not self._schedules and self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Refresh the feeds that are due, within the request budget.
+
+        Feeds over budget stay due and are retried on the next tick.
+        """
+        now = time.time()
+        while self._polls and self._polls[0] < now - 3600:
+            self._polls.popleft()
+
+        due = [
+            schedule
+            for schedule in self._schedules.values()
+            if not schedule.polling and schedule.next_poll <= now
+        ]
+        due.sort(key=lambda schedule: (not schedule.in_window, schedule.next_poll))
+        for schedule in due:
+            if len(self._polls) >= ADAPTIVE_REQUEST_BUDGET:
+                schedule.deferred = True
+                continue
+            self._polls.append(now)
+            schedule.polling = True
+            self.hass.async_create_background_task(
+                self._async_poll(schedule),
+                f"podcast_index poll {schedule.coordinator.term}",
+            )
+
+    async def _async_poll(self, schedule: FeedSchedule) -> None:
+        """Refresh one feed and plan its next poll."""
+        try:
+            await schedule.coordinator.async_refresh()
+        finally:
+            schedule.polling = False
+            schedule.plan(time.time())
+
+    def as_dict(self, entry_id: str | None = None) -> list[dict[str, Any]]:
+        """Describe the schedules of one or all entries, soonest poll first."""
+        schedules = sorted(
+            (
+                (key, schedule)
+                for key, schedule in self._schedules.items()
+                if entry_id in (None, key[0])
+            ),
+            key=lambda item: item[1].next_poll,
+        )
+        return [
+            {"entry_id": key[0], **schedule.as_dict()} for key, schedule in schedules
+        ]
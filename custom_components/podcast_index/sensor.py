@@ -1,16 +1,32 @@
 """PodcastIndex sensor platform."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+import html
 import logging
+import re
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_NAME,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -18,6 +34,7 @@ from homeassistant.helpers.update_coordinator import (
 
 from .const import (
     ATTR_AUDIO_URL,
+    ATTR_LOCAL_AUDIO_URL,
     ATTR_DESCRIPTION,
     ATTR_DURATION,
     ATTR_EPISODE_NUMBER,
@@ -29,12 +46,34 @@ from .const import (
     ATTR_FEED_URL,
     ATTR_HOURS_SINCE_PUBLISH,
     ATTR_PODCAST_ICON,
+    ATTR_STALE,
+    ATTR_STALE_SINCE,
+    ATTR_RECENT_EPISODES,
+    CONF_HISTORY_ATTRIBUTE,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_LEAN_ATTRIBUTES,
+    DATA_RESOLUTION_CACHE,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DEFAULT_HISTORY_ATTRIBUTE,
+    DEFAULT_LEAN_ATTRIBUTES,
+    LEAN_DESCRIPTION_LENGTH,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    HOURS_SINCE_PUBLISH_UPDATE_INTERVAL,
+    METRICS_UPDATE_INTERVAL,
 )
+from .metrics import ApiMetrics, CacheStats, to_ms
+from .artwork import ArtworkCache
+from .prefetch import AudioPrefetcher
 
 _LOGGER = logging.getLogger(__name__)
 
+# Only the diagnostic sensors poll; episode sensors follow their coordinator
+SCAN_INTERVAL = timedelta(seconds=METRICS_UPDATE_INTERVAL)
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -46,51 +85,208 @@ async def async_setup_entry(
     name = entry_data["name"]
     coordinators = entry_data["coordinators"]
     search_or_id_list = entry_data["search_or_id_list"]
+    history_attribute = config_entry.options.get(
+        CONF_HISTORY_ATTRIBUTE, DEFAULT_HISTORY_ATTRIBUTE
+    )
+    sensor_class = (
+        PodcastIndexLeanSensor
+        if config_entry.options.get(CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES)
+        else PodcastIndexSensor
+    )
+    prefetcher = entry_data["audio_prefetcher"]
+    artwork_cache = entry_data["artwork_cache"]
 
     entities = []
     for term in search_or_id_list:
         coordinator = coordinators[term]
-        entities.append(PodcastIndexSensor(coordinator, name, term))
+        entities.append(
+            sensor_class(
+                coordinator, name, term, history_attribute, prefetcher, artwork_cache
+            )
+        )
+
+    if config_entry.options.get(CONF_DIAGNOSTIC_SENSORS, DEFAULT_DIAGNOSTIC_SENSORS):
+        resolution_stats = hass.data[DOMAIN][DATA_RESOLUTION_CACHE].stats
+        metrics = entry_data["api"].metrics
+        entities.extend(
+            PodcastIndexMetricSensor(description, metrics, resolution_stats, name)
+            for description in METRIC_SENSORS
+        )
+
+    # Coordinators already hold their first data; refreshing again here
+    # would cost an extra request per term.
+    async_add_entities(entities)
+
+    @callback
+    def async_add_term_sensors(terms: list[str]) -> None:
+        """Add the sensors of search terms added after setup."""
+        async_add_entities(
+            [
+                sensor_class(
+                    coordinators[term],
+                    name,
+                    term,
+                    history_attribute,
+                    prefetcher,
+                    artwork_cache,
+                )
+                for term in terms
+            ]
+        )
+
+    entry_data["async_add_term_sensors"] = async_add_term_sensors
+
+
+def sensor_unique_id(name: str, term: str) -> str:
+    """Return the unique id of the sensor of a search term."""
+    return f"{name.lower().replace(' ', '_')}_{term.lower().replace(' ', '_')}_latest_episode"
+
+
+def _hours_since(timestamp: float | None) -> int | None:
+    """Return the hours elapsed since a timestamp, rounded to whole hours."""
+    if not timestamp:
+        return None
+    try:
+        time_difference = datetime.now() - datetime.fromtimestamp(timestamp)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return round(time_difference.total_seconds() / 3600)
+
 
-    async_add_entities(entities, True)
+def _seconds_until_hours_since_changes(timestamp: float) -> float:
+    """Return the seconds until the rounded hours since a timestamp change."""
+    step = HOURS_SINCE_PUBLISH_UPDATE_INTERVAL
+    return step - (time.time() - timestamp + step / 2) % step
+
+
+def lean_description(description: str) -> str:
+    """Return show notes as plain text, cut to LEAN_DESCRIPTION_LENGTH characters."""
+    text = _WHITESPACE.sub(" ", html.unescape(_HTML_TAG.sub(" ", description))).strip()
+    if len(text) <= LEAN_DESCRIPTION_LENGTH:
+        return text
+    return text[: LEAN_DESCRIPTION_LENGTH - 1].rstrip() + "…"
 
 
 class PodcastIndexSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a PodcastIndex sensor."""
+    """Representation of a PodcastIndex sensor.
+
+    Name, state and attributes are computed once per coordinator update
+    and the state is only written when one of them changed, so polls
+    that find no new episode don't touch the state machine.
+    hours_since_publish is whole hours, refreshed by a timer that fires
+    only when the rounded value changes.
+    """
 
     def __init__(
-        self, coordinator: DataUpdateCoordinator, name: str, term: str
+        self,
+        coordinator: DataUpdateCoordinator,
+        name: str,
+        term: str,
+        history_attribute: bool = DEFAULT_HISTORY_ATTRIBUTE,
+        prefetcher: AudioPrefetcher | None = None,
+        artwork_cache: ArtworkCache | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._term = term
+        self._history_attribute = history_attribute
+        self._prefetcher = prefetcher
+        self._artwork_cache = artwork_cache
         self._base_name = name
-        self._attr_name = f"{name} {term} Latest Episode"
-        self._attr_unique_id = f"{name.lower().replace(' ', '_')}_{term.lower().replace(' ', '_')}_latest_episode"
+        self._attr_unique_id = sensor_unique_id(name, term)
+        self._publish_timestamp: float | None = None
+        self._unsub_hours_since_publish: CALLBACK_TYPE | None = None
+        self._written_state: tuple[Any, ...] | None = None
+        self._update_from_episode()
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        if self.coordinator.data and self.coordinator.data.get(ATTR_PODCAST_TITLE):
-            podcast_title = self.coordinator.data.get(ATTR_PODCAST_TITLE)
-            return f"{self._base_name} {podcast_title} Latest Episode"
-        return f"{self._base_name} {self._term} Latest Episode"
+    async def async_added_to_hass(self) -> None:
+        """Start the hours_since_publish timer."""
+        await super().async_added_to_hass()
+        # The state computed so far is written once the entity is added
+        self._written_state = (
+            self.available,
+            self._attr_name,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
+        self.async_on_remove(self._async_cancel_hours_since_publish)
+        self._async_schedule_hours_since_publish()
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get(ATTR_TITLE, "No episode found")
-        return "No episode found"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state and write it only if something changed."""
+        self._update_from_episode()
+        self._async_write_if_changed()
+        self._async_schedule_hours_since_publish()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data:
-            return {}
+    @callback
+    def _async_schedule_hours_since_publish(self) -> None:
+        """Schedule the next change of hours_since_publish, if it is shown."""
+        self._async_cancel_hours_since_publish()
+        if self._publish_timestamp is not None and self._attr_extra_state_attributes:
+            self._unsub_hours_since_publish = async_call_later(
+                self.hass,
+                _seconds_until_hours_since_changes(self._publish_timestamp),
+                self._async_update_hours_since_publish,
+            )
+
+    @callback
+    def _async_cancel_hours_since_publish(self) -> None:
+        """Cancel the hours_since_publish timer."""
+        if self._unsub_hours_since_publish is not None:
+            self._unsub_hours_since_publish()
+            self._unsub_hours_since_publish = None
 
+    @callback
+    def _async_update_hours_since_publish(self, _now: datetime) -> None:
+        """Move hours_since_publish forward without a coordinator update."""
+        self._unsub_hours_since_publish = None
+        if attributes := self._attr_extra_state_attributes:
+            self._attr_extra_state_attributes = {
+                **attributes,
+                ATTR_HOURS_SINCE_PUBLISH: _hours_since(self._publish_timestamp),
+            }
+            self._async_write_if_changed()
+        self._async_schedule_hours_since_publish()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write the state if it differs from the last one written."""
+        state = (
+            self.available,
+            self._attr_name,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
+        if state != self._written_state:
+            self._written_state = state
+            self.async_write_ha_state()
+
+    def _update_from_episode(self) -> None:
+        """Compute name, state and attributes from the coordinator data."""
         episode = self.coordinator.data
-        
+        if episode and episode.get(ATTR_PODCAST_TITLE):
+            self._attr_name = f"{self._base_name} {episode[ATTR_PODCAST_TITLE]} Latest Episode"
+        else:
+            self._attr_name = f"{self._base_name} {self._term} Latest Episode"
+        if not episode:
+            self._publish_timestamp = None
+            self._attr_native_value = "No episode found"
+            self._attr_extra_state_attributes = {}
+            self._attr_entity_picture = None
+            return
+        self._publish_timestamp = episode.get(ATTR_PUBLISH_DATE) or None
+        self._attr_native_value = episode.get(ATTR_TITLE, "No episode found")
+        self._attr_extra_state_attributes = self._build_attributes(episode)
+        # Only the local thumbnail; the original artwork is too large to show
+        self._attr_entity_picture = (
+            self._artwork_cache.local_url(episode.get("podcast_id"))
+            if self._artwork_cache is not None
+            else None
+        )
+
+    def _build_attributes(self, episode: dict[str, Any]) -> dict[str, Any]:
+        """Return the state attributes of an episode."""
         # Convert publish date from timestamp to readable format
         publish_date = episode.get(ATTR_PUBLISH_DATE)
         if publish_date:
@@ -107,19 +303,12 @@ class PodcastIndexSensor(CoordinatorEntity, SensorEntity):
             except (ValueError, TypeError):
                 duration = None
 
-        # Calculate hours since publish
-        hours_since_publish = None
-        publish_timestamp = episode.get(ATTR_PUBLISH_DATE)
-        if publish_timestamp:
-            try:
-                publish_datetime = datetime.fromtimestamp(publish_timestamp)
-                current_datetime = datetime.now()
-                time_difference = current_datetime - publish_datetime
-                hours_since_publish = round(time_difference.total_seconds() / 3600, 1)
-            except (ValueError, TypeError):
-                hours_since_publish = None
+        # Set while the API is unreachable and the last known episode is shown
+        stale_since = episode.get(ATTR_STALE_SINCE)
+        if stale_since:
+            stale_since = datetime.fromtimestamp(stale_since).isoformat()
 
-        return {
+        attributes = {
             ATTR_TITLE: episode.get(ATTR_TITLE, ""),
             ATTR_DESCRIPTION: episode.get(ATTR_DESCRIPTION, ""),
             ATTR_PUBLISH_DATE: publish_date,
@@ -130,13 +319,188 @@ class PodcastIndexSensor(CoordinatorEntity, SensorEntity):
             ATTR_SEASON_NUMBER: episode.get(ATTR_SEASON_NUMBER),
             ATTR_SEARCH_OR_ID: self._term,
             ATTR_FEED_URL: episode.get(ATTR_FEED_URL, ""),
-            ATTR_HOURS_SINCE_PUBLISH: hours_since_publish,
+            ATTR_HOURS_SINCE_PUBLISH: _hours_since(self._publish_timestamp),
             ATTR_PODCAST_ICON: episode.get(ATTR_PODCAST_ICON, ""),
             "guid": episode.get("guid", ""),
             "link": episode.get("link", ""),
+            ATTR_STALE: episode.get(ATTR_STALE, False),
+            ATTR_STALE_SINCE: stale_since,
         }
 
+        # Dashboards load the local thumbnail once the artwork cache has it
+        if self._artwork_cache is not None and (
+            local_icon := self._artwork_cache.local_url(episode.get("podcast_id"))
+        ):
+            attributes[ATTR_PODCAST_ICON] = local_icon
+
+        # Media source id of the downloaded copy, once the prefetcher has it
+        if self._prefetcher is not None:
+            attributes[ATTR_LOCAL_AUDIO_URL] = self._prefetcher.local_media_id(
+                episode.get(ATTR_AUDIO_URL) or ""
+            )
+
+        # Optional, as it grows the state written on every update
+        if self._history_attribute:
+            attributes[ATTR_RECENT_EPISODES] = [
+                {
+                    ATTR_TITLE: record.title,
+                    ATTR_PUBLISH_DATE: (
+                        datetime.fromtimestamp(record.publish_date).isoformat()
+                        if record.publish_date
+                        else None
+                    ),
+                    ATTR_AUDIO_URL: record.audio_url,
+                    "guid": record.guid,
+                }
+                for record in self.coordinator.history.recent()
+            ]
+        return attributes
+
     @property
     def icon(self) -> str:
         """Return the icon of the sensor."""
-        return "mdi:podcast" 
\ No newline at end of file
+        return "mdi:podcast"
+
+
+class PodcastIndexLeanSensor(PodcastIndexSensor):
+    """PodcastIndex sensor that keeps its recorded state small.
+
+    The description is reduced to a short plain-text summary, and the
+    fields that are large or change without a new episode are left out of
+    the recorder. The full episode is available from the
+    get_episode_details service.
+    """
+
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_DESCRIPTION,
+            ATTR_AUDIO_URL,
+            ATTR_LOCAL_AUDIO_URL,
+            ATTR_FEED_URL,
+            ATTR_PODCAST_ICON,
+            ATTR_HOURS_SINCE_PUBLISH,
+            ATTR_RECENT_EPISODES,
+            "link",
+        }
+    )
+
+    def _build_attributes(self, episode: dict[str, Any]) -> dict[str, Any]:
+        """Return the state attributes with a short plain-text description."""
+        attributes = super()._build_attributes(episode)
+        if attributes.get(ATTR_DESCRIPTION):
+            attributes[ATTR_DESCRIPTION] = lean_description(attributes[ATTR_DESCRIPTION])
+        return attributes
+
+
+@dataclass(frozen=True, kw_only=True)
+class PodcastIndexMetricDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor reading the API metrics."""
+
+    value_fn: Callable[[ApiMetrics, CacheStats], float | int | None]
+    attributes_fn: Callable[[ApiMetrics, CacheStats], dict[str, Any]] | None = None
+
+
+METRIC_SENSORS: tuple[PodcastIndexMetricDescription, ...] = (
+    PodcastIndexMetricDescription(
+        key="api_requests",
+        name="API requests",
+        icon="mdi:swap-vertical",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics, _cache: metrics.requests,
+        attributes_fn=lambda metrics, _cache: {
+            "endpoints": {
+                endpoint: endpoint_metrics.requests
+                for endpoint, endpoint_metrics in metrics.endpoints.items()
+            },
+            "hot_feeds": dict(metrics.feed_requests.most_common(5)),
+        },
+    ),
+    PodcastIndexMetricDescription(
+        key="api_errors",
+        name="API errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics, _cache: metrics.errors,
+        attributes_fn=lambda metrics, _cache: {
+            "error_types": dict(metrics.error_types),
+            "rejected": sum(m.rejected for m in metrics.endpoints.values()),
+        },
+    ),
+    PodcastIndexMetricDescription(
+        key="api_latency",
+        name="API latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics, _cache: to_ms(metrics.mean_latency),
+        attributes_fn=lambda metrics, _cache: {
+            "p95_by_endpoint": {
+                endpoint: to_ms(endpoint_metrics.latency_percentile(0.95))
+                for endpoint, endpoint_metrics in metrics.endpoints.items()
+            },
+        },
+    ),
+    PodcastIndexMetricDescription(
+        key="api_data_received",
+        name="API data received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.MEBIBYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics, _cache: metrics.bytes_received,
+    ),
+    PodcastIndexMetricDescription(
+        key="resolution_cache_hit_rate",
+        name="Resolution cache hit rate",
+        icon="mdi:cached",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda _metrics, cache: (
+            round(cache.hit_rate * 100, 1) if cache.hit_rate is not None else None
+        ),
+        attributes_fn=lambda _metrics, cache: cache.as_dict(),
+    ),
+)
+
+
+class PodcastIndexMetricSensor(SensorEntity):
+    """Diagnostic sensor showing one runtime metric of the API client.
+
+    The client and the resolution cache are shared by every entry, so the
+    numbers cover the whole integration. They are read every
+    METRICS_UPDATE_INTERVAL seconds instead of on every request.
+    """
+
+    entity_description: PodcastIndexMetricDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = True
+    # The breakdowns change every update and only matter while looking
+    _unrecorded_attributes = frozenset({"endpoints", "hot_feeds", "p95_by_endpoint"})
+
+    def __init__(
+        self,
+        description: PodcastIndexMetricDescription,
+        metrics: ApiMetrics,
+        resolution_stats: CacheStats,
+        name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._metrics = metrics
+        self._resolution_stats = resolution_stats
+        self._attr_name = f"{name} {description.name}"
+        self._attr_unique_id = f"{name.lower().replace(' ', '_')}_{description.key}"
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self._metrics, self._resolution_stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the breakdown of the metric."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(
+            self._metrics, self._resolution_stats
+        )
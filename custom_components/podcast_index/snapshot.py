@@ -0,0 +1,96 @@
+"""Persisted snapshot of the last known episodes for warm starts."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_KEY, STORAGE_VERSION
+from .coordinator import PodcastIndexTermCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EpisodeSnapshot:
+    """Last known episode of every term of a config entry, kept in .storage.
+
+    At startup the coordinators are seeded from the snapshot so sensors
+    have a state before the first network refresh finishes, or even when
+    the API is unreachable. The snapshot is rewritten shortly after any
+    coordinator gets new data.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store of an entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{SNAPSHOT_STORAGE_KEY}.{entry_id}"
+        )
+        self._coordinators: dict[str, PodcastIndexTermCoordinator] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    async def async_restore(
+        self, coordinators: dict[str, PodcastIndexTermCoordinator]
+    ) -> set[str]:
+        """Seed coordinators from the stored snapshot; return the restored terms."""
+        stored = await self._store.async_load() or {}
+        restored: set[str] = set()
+        for term, saved in stored.get("terms", {}).items():
+            if (coordinator := coordinators.get(term)) is None or not saved.get("episode"):
+                continue
+            coordinator.publish_times = saved.get("publish_times", [])
+            coordinator.history.restore(saved.get("history", []))
+            coordinator.async_set_updated_data(saved["episode"])
+            restored.add(term)
+        _LOGGER.debug("Restored %d of %d terms from snapshot", len(restored), len(coordinators))
+        return restored
+
+    @callback
+    def async_track(self, coordinator: PodcastIndexTermCoordinator) -> None:
+        """Save the snapshot whenever the coordinator gets new data."""
+        self._coordinators[coordinator.term] = coordinator
+        self._unsubs[coordinator.term] = coordinator.async_add_listener(
+            self._async_schedule_save
+        )
+        if coordinator.data:
+            # Data fetched before tracking started, e.g. for an added term
+            self._async_schedule_save()
+
+    @callback
+    def async_forget(self, term: str) -> None:
+        """Stop tracking a removed term and drop it from the snapshot."""
+        if (unsub := self._unsubs.pop(term, None)) is not None:
+            unsub()
+        if self._coordinators.pop(term, None) is not None:
+            self._async_schedule_save()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking every coordinator, keeping the stored snapshot."""
+        while self._unsubs:
+            self._unsubs.popitem()[1]()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Write the snapshot after a short delay, batching bursts of updates."""
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "terms": {
+                term: {
+                    "episode": coordinator.data,
+                    "publish_times": coordinator.publish_times,
+                    "history": coordinator.history.as_list(),
+                }
+                for term, coordinator in self._coordinators.items()
+                if coordinator.data
+            }
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
@@ -0,0 +1,28 @@
+"""Shared setup of the PodcastIndex tests.
+
+The modules tested here don't need Home Assistant. Like the benchmarks,
+they are imported as the ``podcast_index`` package without running its
+__init__, which does.
+"""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import types
+
+import pytest
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "podcast_index"
+
+if "podcast_index" not in sys.modules:
+    _package = types.ModuleType("podcast_index")
+    _package.__path__ = [str(_PACKAGE_DIR)]
+    sys.modules["podcast_index"] = _package
+
+
+@pytest.fixture
+def allow_local_sockets(request: pytest.FixtureRequest) -> None:
+    """Let a test run a local server where Home Assistant's test plugin blocks sockets."""
+    if importlib.util.find_spec("pytest_socket") is not None:
+        request.getfixturevalue("socket_enabled")
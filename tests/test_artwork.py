@@ -0,0 +1,176 @@
+"""Tests for the local artwork cache."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import io
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.core import HomeAssistant
+from PIL import Image
+
+from custom_components.podcast_index.artwork import ArtworkCache
+from custom_components.podcast_index.const import ARTWORK_SIZE, ARTWORK_URL_PATH
+from custom_components.podcast_index.resolution_cache import ResolutionCache
+
+IMAGE_URL = "https://example.com/haw.png"
+PODCAST = {"id": 41, "title": "Home Automation Weekly", "image": IMAGE_URL, "last_updated": 100}
+
+
+def _png(width: int, height: int) -> bytes:
+    """Return a PNG image of the given size."""
+    output = io.BytesIO()
+    Image.new("RGBA", (width, height), (200, 80, 40, 255)).save(output, "PNG")
+    return output.getvalue()
+
+
+class _Api:
+    """Serves images by URL and counts the downloads."""
+
+    def __init__(self, images: dict[str, bytes]) -> None:
+        """Serve the given images."""
+        self.images = images
+        self.downloads: list[str] = []
+
+    async def get_image(self, url: str, max_bytes: int) -> bytes:
+        """Return an image."""
+        self.downloads.append(url)
+        return self.images[url]
+
+
+class _Coordinator:
+    """A term coordinator whose latest episode the test sets."""
+
+    def __init__(self, term: str, image_url: str = IMAGE_URL) -> None:
+        """Start with an episode of the show."""
+        self.term = term
+        self.data: dict[str, Any] = {"podcast_id": "41", "podcast_icon": image_url}
+        self._listeners: list[Callable[[], None]] = []
+
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener on every update."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def async_update_listeners(self) -> None:
+        """Notify the listeners."""
+        for listener in list(self._listeners):
+            listener()
+
+
+@pytest.fixture
+def cache(hass: HomeAssistant) -> ResolutionCache:
+    """Return a resolution cache that knows the show."""
+    cache = ResolutionCache(hass)
+    cache.async_set("home automation", PODCAST)
+    return cache
+
+
+async def _async_artwork_cache(
+    hass: HomeAssistant, api: _Api, cache: ResolutionCache, directory: Path
+) -> ArtworkCache:
+    """Return a loaded artwork cache of the directory."""
+    artwork_cache = ArtworkCache(hass, api, cache, directory)
+    await artwork_cache.async_load()
+    return artwork_cache
+
+
+def _thumbnail(artwork_cache: ArtworkCache) -> Path:
+    """Return the path of the show's thumbnail."""
+    return artwork_cache.directory / artwork_cache.local_url("41").rsplit("/", 1)[1]
+
+
+async def test_artwork_is_cached_as_a_thumbnail(
+    hass: HomeAssistant, cache: ResolutionCache, tmp_path: Path
+) -> None:
+    """Large artwork is served as a small JPEG that keeps its aspect ratio."""
+    api = _Api({IMAGE_URL: _png(3000, 1500)})
+    artwork_cache = await _async_artwork_cache(hass, api, cache, tmp_path)
+    coordinator = _Coordinator("home automation")
+    updates: list[None] = []
+    coordinator.async_add_listener(lambda: updates.append(None))
+
+    artwork_cache.async_track("entry", coordinator)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert artwork_cache.local_url("41").startswith(f"{ARTWORK_URL_PATH}/41_")
+    with Image.open(_thumbnail(artwork_cache)) as thumbnail:
+        assert thumbnail.format == "JPEG"
+        assert thumbnail.size == (ARTWORK_SIZE, ARTWORK_SIZE // 2)
+    # Sensors are told to switch to the thumbnail
+    assert updates
+
+    # The same version isn't fetched again, after a restart either
+    coordinator.async_update_listeners()
+    restarted = await _async_artwork_cache(hass, api, cache, tmp_path)
+    restarted.async_track("entry", coordinator)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert api.downloads == [IMAGE_URL]
+    assert restarted.local_url("41") == artwork_cache.local_url("41")
+
+
+async def test_updated_feed_replaces_its_artwork(
+    hass: HomeAssistant, cache: ResolutionCache, tmp_path: Path
+) -> None:
+    """A new lastUpdateTime fetches the artwork again and drops the old version."""
+    api = _Api({IMAGE_URL: _png(600, 600)})
+    artwork_cache = await _async_artwork_cache(hass, api, cache, tmp_path)
+    coordinator = _Coordinator("home automation")
+    artwork_cache.async_track("entry", coordinator)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    old = _thumbnail(artwork_cache)
+
+    cache.async_set("home automation", {**PODCAST, "last_updated": 200})
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert api.downloads == [IMAGE_URL, IMAGE_URL]
+    assert _thumbnail(artwork_cache) != old
+    assert sorted(tmp_path.iterdir()) == [_thumbnail(artwork_cache)]
+
+
+async def test_artwork_is_deleted_with_the_last_term_of_the_feed(
+    hass: HomeAssistant, cache: ResolutionCache, tmp_path: Path
+) -> None:
+    """Removing one of two terms for a feed keeps its artwork.
+
+    Only one of the terms has the feed's metadata cached; the other one
+    doesn't make the artwork be fetched again.
+    """
+    api = _Api({IMAGE_URL: _png(600, 600)})
+    artwork_cache = await _async_artwork_cache(hass, api, cache, tmp_path)
+    artwork_cache.async_track("entry", _Coordinator("home automation"))
+    artwork_cache.async_track("entry", _Coordinator("41"))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    thumbnail = _thumbnail(artwork_cache)
+    assert api.downloads == [IMAGE_URL]
+
+    artwork_cache.async_forget("entry", "41")
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert thumbnail.exists()
+
+    artwork_cache.async_forget("entry", "home automation")
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert artwork_cache.local_url("41") is None
+    assert not thumbnail.exists()
+
+
+async def test_unreadable_artwork_is_skipped(
+    hass: HomeAssistant, cache: ResolutionCache, tmp_path: Path
+) -> None:
+    """Dashboards keep the publisher's URL when the image can't be resized."""
+    api = _Api({IMAGE_URL: b"<html>not an image</html>"})
+    artwork_cache = await _async_artwork_cache(hass, api, cache, tmp_path)
+
+    artwork_cache.async_track("entry", _Coordinator("home automation"))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert artwork_cache.local_url("41") is None
+    assert list(tmp_path.iterdir()) == []
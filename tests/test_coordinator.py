@@ -0,0 +1,179 @@
+"""Tests for the data update coordinators."""
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.podcast_index.coordinator import (
+    PodcastIndexBatchCoordinator,
+    PodcastIndexDeltaCoordinator,
+    PodcastIndexTermCoordinator,
+    async_resolve_term,
+)
+from custom_components.podcast_index.podcast_index_api import PodcastIndexAPI
+from custom_components.podcast_index.resolution_cache import ResolutionCache
+
+TERM = "home automation"
+PODCAST = {
+    "id": 41,
+    "title": "Home Automation Weekly",
+    "feed_url": "https://example.com/haw.xml",
+    "image": "https://example.com/haw.png",
+    "last_updated": 100,
+}
+
+
+def _episode(number: int, **fields: Any) -> dict[str, Any]:
+    """Return a parsed API episode of the show."""
+    return {
+        "title": f"Episode {number}",
+        "description": "",
+        "publish_date": 1000 * number,
+        "duration": 3600,
+        "audio_url": f"https://cdn.example.com/{number}.mp3",
+        "podcast_title": "",
+        "episode_number": number,
+        "season_number": None,
+        "guid": f"haw-{number}",
+        "link": "",
+        **fields,
+    }
+
+
+@pytest.fixture
+def api() -> PodcastIndexAPI:
+    """Return an API client that never reaches the network."""
+    return PodcastIndexAPI("key", "secret")
+
+
+@pytest.fixture
+def cache(hass: HomeAssistant) -> ResolutionCache:
+    """Return a resolution cache that knows the show."""
+    cache = ResolutionCache(hass)
+    cache.async_set(TERM, PODCAST)
+    return cache
+
+
+async def test_resolving_counts_one_cache_lookup(
+    hass: HomeAssistant, api: PodcastIndexAPI
+) -> None:
+    """Each resolution is one hit or one miss and says where it came from."""
+    cache = ResolutionCache(hass)
+
+    with patch.object(api, "resolve_feed", AsyncMock(return_value=PODCAST)) as resolve_feed:
+        assert await async_resolve_term(api, cache, TERM) == (PODCAST, False)
+        assert await async_resolve_term(api, cache, TERM) == (PODCAST, True)
+
+    resolve_feed.assert_awaited_once_with(TERM)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    with patch.object(api, "resolve_feed", AsyncMock(return_value=None)):
+        assert await async_resolve_term(api, cache, "nothing") == (None, False)
+        assert await async_resolve_term(api, cache, "nothing") == (None, True)
+
+    assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+
+def _batch_coordinator(
+    hass: HomeAssistant, api: PodcastIndexAPI, cache: ResolutionCache
+) -> tuple[PodcastIndexBatchCoordinator, PodcastIndexTermCoordinator]:
+    """Return a batch coordinator tracking TERM and that term's coordinator."""
+    term_coordinator = PodcastIndexTermCoordinator(
+        hass, api, cache, "Test", TERM, None, history_depth=5
+    )
+    batch = PodcastIndexBatchCoordinator(hass, api, cache, "Test", {TERM: term_coordinator})
+    return batch, term_coordinator
+
+
+async def test_batch_records_episodes_with_the_show_info(
+    hass: HomeAssistant, api: PodcastIndexAPI, cache: ResolutionCache
+) -> None:
+    """Recorded episodes carry the resolved show's title, not the API's feedTitle."""
+    batch, term_coordinator = _batch_coordinator(hass, api, cache)
+    index = MagicMock()
+    term_coordinator.episode_index = index
+    episodes = [_episode(3, podcast_title="HAW"), _episode(2), _episode(1)]
+
+    with patch.object(
+        api, "get_episodes_by_feed_ids", AsyncMock(return_value={"41": episodes})
+    ) as get_episodes:
+        data = await batch._async_update_data()
+
+    # Enough episodes per feed to fill the history
+    assert get_episodes.call_args.args == (["41"], 5)
+    assert data[TERM]["guid"] == "haw-3"
+    assert data[TERM]["podcast_title"] == "Home Automation Weekly"
+    assert [record.guid for record in term_coordinator.history.recent()] == [
+        "haw-3",
+        "haw-2",
+        "haw-1",
+    ]
+    indexed = index.async_add.call_args.args[0]
+    assert {episode["podcast_title"] for episode in indexed} == {"Home Automation Weekly"}
+    assert {episode["feed_url"] for episode in indexed} == {PODCAST["feed_url"]}
+    # The API's own episodes are left untouched
+    assert episodes[0]["podcast_title"] == "HAW"
+
+
+async def test_delta_fetches_only_changed_feeds(
+    hass: HomeAssistant, api: PodcastIndexAPI, cache: ResolutionCache
+) -> None:
+    """After a full sync, polls fetch episodes only for feeds that changed."""
+    bread = {**PODCAST, "id": 42, "title": "Bread Talk", "feed_url": "https://example.com/b.xml"}
+    cache.async_set("bread", bread)
+    term_coordinators = {
+        term: PodcastIndexTermCoordinator(hass, api, cache, "Test", term, None)
+        for term in (TERM, "bread")
+    }
+    delta = PodcastIndexDeltaCoordinator(hass, api, cache, "Test", term_coordinators)
+    episodes = {"41": [_episode(3)], "42": [_episode(7, guid="bread-7")]}
+
+    async def _async_poll(
+        updated: tuple[set[str], int | None, bool]
+    ) -> tuple[AsyncMock, AsyncMock]:
+        """Run one poll where the index reports the given changes."""
+        with (
+            patch.object(
+                api, "get_updated_feed_ids", AsyncMock(return_value=updated)
+            ) as get_updated,
+            patch.object(
+                api,
+                "get_episodes_by_feed_ids",
+                AsyncMock(
+                    side_effect=lambda feed_ids, *args, **kwargs: {
+                        feed_id: episodes[feed_id] for feed_id in feed_ids
+                    }
+                ),
+            ) as get_episodes,
+            # New episodes refetch the feed's metadata; keep the cached one
+            patch.object(api, "get_podcast_by_feed_id", AsyncMock(return_value=None)),
+        ):
+            delta.data = await delta._async_update_data()
+        return get_updated, get_episodes
+
+    get_updated, get_episodes = await _async_poll((set(), None, True))
+    # The first poll is a full sync
+    get_updated.assert_not_awaited()
+    assert sorted(get_episodes.call_args.args[0]) == ["41", "42"]
+
+    # Nothing tracked changed: a single request
+    get_updated, get_episodes = await _async_poll((set(), None, True))
+    get_updated.assert_awaited_once()
+    get_episodes.assert_not_awaited()
+    assert delta.data[TERM]["guid"] == "haw-3"
+
+    episodes["42"] = [_episode(8, guid="bread-8"), *episodes["42"]]
+    get_updated, get_episodes = await _async_poll(({"42"}, None, True))
+    assert get_episodes.call_args.args[0] == ["42"]
+    assert delta.data["bread"]["guid"] == "bread-8"
+    assert delta.data[TERM]["guid"] == "haw-3"
+
+    # More changes than the recent data could list: back to a full sync
+    get_updated, get_episodes = await _async_poll((set(), None, False))
+    assert sorted(get_episodes.call_args.args[0]) == ["41", "42"]
@@ -0,0 +1,129 @@
+"""Tests for the local full-text episode index."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import time
+from typing import Any
+
+import pytest
+
+from podcast_index.episode_index import EpisodeIndex
+
+DAY = 24 * 3600
+
+
+def _row(
+    guid: str, podcast_title: str, title: str, description: str, age_days: float
+) -> tuple[Any, ...]:
+    """Return an episode the way async_add queues it for writing."""
+    return (
+        guid,
+        podcast_title,
+        title,
+        description,
+        f"https://cdn.example.com/{guid}.mp3",
+        int(time.time() - age_days * DAY),
+    )
+
+
+@pytest.fixture
+def index(tmp_path) -> Iterator[EpisodeIndex]:
+    """Return an open index holding a few episodes of two shows.
+
+    Writing and searching run in the executor in Home Assistant; here they
+    are called directly.
+    """
+    index = EpisodeIndex(None, str(tmp_path / "episodes.db"))
+    index.open()
+    if not index.available:
+        pytest.skip("SQLite was built without FTS5")
+    index._write(
+        [
+            _row("haw-41", "Home Automation Weekly", "Matter bridges", "Thread and Matter", 14),
+            _row("haw-42", "Home Automation Weekly", "Zigbee all the things", "Zigbee", 7),
+            _row("bake-1", "Bread Talk", "Feeding a sourdough starter", "Flour and water", 3),
+            _row("bake-2", "Bread Talk", "Baguettes at home", "Steam and heat", 1),
+        ]
+    )
+    yield index
+    index.close()
+
+
+def test_show_name_returns_its_newest_episode(index: EpisodeIndex) -> None:
+    """A (nearly) exact show name plays that show's latest episode."""
+    episode, match = index._search("home automation weekly")
+
+    assert match == "show"
+    assert episode["guid"] == "haw-42"
+
+    episode, match = index._search("Home Automaton Weekly")
+
+    assert match == "show"
+    assert episode["guid"] == "haw-42"
+
+
+def test_words_match_titles_and_show_notes(index: EpisodeIndex) -> None:
+    """Otherwise every word must appear in an episode's title or notes."""
+    episode, match = index._search("sourdough starter")
+
+    assert match == "episode"
+    assert episode["guid"] == "bake-1"
+
+    episode, match = index._search("thread")
+
+    assert match == "episode"
+    assert episode["guid"] == "haw-41"
+
+
+def test_words_must_match_whole(index: EpisodeIndex) -> None:
+    """A word that is only a prefix of an indexed word doesn't match."""
+    assert index._search("zig") == (None, "none")
+    assert index._search("sourdough croissant") == (None, "none")
+
+
+def test_loose_show_names_fall_through_to_words(index: EpisodeIndex) -> None:
+    """A term only vaguely like a show name isn't taken as that show."""
+    episode, match = index._search("bread")
+
+    assert match == "episode"
+    assert episode["podcast_title"] == "Bread Talk"
+
+
+def test_updated_episode_is_found_by_its_new_text(index: EpisodeIndex) -> None:
+    """Rewritten show notes replace the indexed ones."""
+    index._write([_row("bake-2", "Bread Talk", "Baguettes at home", "Poolish", 1)])
+
+    assert index._search("poolish")[0]["guid"] == "bake-2"
+    assert index._search("steam") == (None, "none")
+
+
+def test_prune_by_age_and_count(index: EpisodeIndex) -> None:
+    """Old episodes go first, then all but the newest are dropped."""
+    assert index.prune(max_age=10 * DAY, max_episodes=100) == 1
+    assert index._search("matter") == (None, "none")
+
+    assert index.prune(max_age=365 * DAY, max_episodes=1) == 2
+
+    assert index._search("baguettes")[0]["guid"] == "bake-2"
+    assert index._search("zigbee") == (None, "none")
+    assert index._search("home automation weekly") == (None, "none")
+
+
+def test_open_creates_the_directory(tmp_path) -> None:
+    """The database can be the first file in a new storage directory."""
+    index = EpisodeIndex(None, str(tmp_path / ".storage" / "episodes.db"))
+
+    index.open()
+
+    assert index.available
+    index.close()
+
+
+def test_unopenable_database_leaves_the_index_unavailable(tmp_path) -> None:
+    """An index that can't be opened is skipped instead of failing setup."""
+    (tmp_path / "file").write_text("")
+    index = EpisodeIndex(None, str(tmp_path / "file" / "episodes.db"))
+
+    index.open()
+
+    assert not index.available
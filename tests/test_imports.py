@@ -0,0 +1,35 @@
+"""Smoke tests that every module of the integration can be imported."""
+from __future__ import annotations
+
+import ast
+import importlib
+from pathlib import Path
+
+import pytest
+
+from podcast_index import const
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "podcast_index"
+_MODULES = sorted(path.stem for path in _PACKAGE_DIR.glob("*.py"))
+
+
+@pytest.mark.parametrize("module", _MODULES)
+def test_imported_constants_are_defined(module: str) -> None:
+    """Every name a module imports from const exists there."""
+    tree = ast.parse((_PACKAGE_DIR / f"{module}.py").read_text())
+    imported = [
+        alias.name
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module == "const"
+        for alias in node.names
+    ]
+
+    assert [name for name in imported if not hasattr(const, name)] == []
+
+
+@pytest.mark.parametrize("module", _MODULES)
+def test_module_imports(module: str) -> None:
+    """The integration loads, which needs Home Assistant."""
+    pytest.importorskip("homeassistant")
+    name = "custom_components.podcast_index"
+    importlib.import_module(name if module == "__init__" else f"{name}.{module}")
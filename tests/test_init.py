@@ -0,0 +1,369 @@
+"""Tests for setting up config entries and the integration's services."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_mock_service
+
+from custom_components.podcast_index.const import (
+    CONF_SEARCH_OR_ID,
+    CONF_SYNC_MODE,
+    DOMAIN,
+    RESOLUTION_CACHE_STORAGE_KEY,
+    SNAPSHOT_STORAGE_KEY,
+    STORAGE_VERSION,
+    SYNC_MODE_PER_TERM,
+)
+from custom_components.podcast_index.podcast_index_api import PodcastIndexAPI
+from custom_components.podcast_index.sensor import sensor_unique_id
+
+ENTRY_SERVICES = ("search_and_play", "add_search_term", "remove_search_term")
+SHARED_SERVICES = (
+    "import_opml",
+    "clear_resolution_cache",
+    "prune_episode_index",
+    "get_poll_schedule",
+    "get_recent_episodes",
+    "get_episode_details",
+)
+
+PODCASTS = {
+    "home automation": {
+        "id": 41,
+        "title": "Home Automation Weekly",
+        "feed_url": "https://example.com/haw.xml",
+        "image": "https://example.com/haw.png",
+        "last_updated": 100,
+    },
+    "bread": {
+        "id": 42,
+        "title": "Bread Talk",
+        "feed_url": "https://example.com/bread.xml",
+        "image": "https://example.com/bread.png",
+        "last_updated": 100,
+    },
+}
+
+
+def _episodes(podcast: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return a show's parsed episodes, newest first."""
+    return [
+        {
+            "title": f"{podcast['title']} {number}",
+            "description": "",
+            "publish_date": 1_790_000_000 + 1000 * number,
+            "duration": 3600,
+            "audio_url": f"https://cdn.example.com/{podcast['id']}/{number}.mp3",
+            "podcast_title": podcast["title"],
+            "episode_number": number,
+            "season_number": None,
+            "guid": f"{podcast['id']}-{number}",
+            "link": "",
+        }
+        for number in (3, 2, 1)
+    ]
+
+
+class FakeCatalog:
+    """Answers the API client's lookups from PODCASTS instead of the network."""
+
+    def __init__(self) -> None:
+        """Start with every show reachable."""
+        self.podcasts = dict(PODCASTS)
+        self.searches: list[str] = []
+        self.batches: list[list[str]] = []
+        # Raised by every lookup while set, like an unreachable API
+        self.error: Exception | None = None
+
+    async def resolve_feed(self, api: PodcastIndexAPI, term: str) -> dict[str, Any] | None:
+        """Resolve a term like a search would."""
+        self.searches.append(term)
+        if self.error is not None:
+            raise self.error
+        return self.podcasts.get(term.strip().lower())
+
+    async def get_episodes_for_podcast(
+        self,
+        api: PodcastIndexAPI,
+        podcast: dict[str, Any],
+        search_term: str,
+        max_episodes: int = 1,
+        since: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return a show's newest episodes with the podcast info added."""
+        if self.error is not None:
+            raise self.error
+        return [
+            api.add_podcast_info(dict(episode), podcast, search_term)
+            for episode in _episodes(podcast)[:max_episodes]
+            if not since or episode["publish_date"] > since
+        ]
+
+    async def get_episodes_by_feed_ids(
+        self,
+        api: PodcastIndexAPI,
+        feed_ids: list[str],
+        max_episodes: int = 1,
+        since: dict[str, int] | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return the newest episodes of several feeds."""
+        self.batches.append(feed_ids)
+        if self.error is not None:
+            raise self.error
+        podcasts = {str(podcast["id"]): podcast for podcast in self.podcasts.values()}
+        return {
+            feed_id: _episodes(podcasts[feed_id])[:max_episodes]
+            for feed_id in feed_ids
+            if feed_id in podcasts
+        }
+
+    async def get_updated_feed_ids(
+        self, api: PodcastIndexAPI, since: int, feed_ids: set[str]
+    ) -> tuple[set[str], int | None, bool]:
+        """Report that no tracked feed changed."""
+        if self.error is not None:
+            raise self.error
+        return set(), None, True
+
+    async def get_podcast_by_feed_id(
+        self, api: PodcastIndexAPI, feed_id: str
+    ) -> dict[str, Any] | None:
+        """Return a show's metadata by feed id."""
+        return next(
+            (podcast for podcast in self.podcasts.values() if str(podcast["id"]) == feed_id),
+            None,
+        )
+
+
+@pytest.fixture
+def catalog() -> Iterator[FakeCatalog]:
+    """Route the API client's lookups to a FakeCatalog."""
+    catalog = FakeCatalog()
+    with patch.multiple(
+        PodcastIndexAPI,
+        resolve_feed=lambda api, *args: catalog.resolve_feed(api, *args),
+        get_episodes_for_podcast=lambda api, *args, **kwargs: catalog.get_episodes_for_podcast(
+            api, *args, **kwargs
+        ),
+        get_episodes_by_feed_ids=lambda api, *args, **kwargs: catalog.get_episodes_by_feed_ids(
+            api, *args, **kwargs
+        ),
+        get_updated_feed_ids=lambda api, *args: catalog.get_updated_feed_ids(api, *args),
+        get_podcast_by_feed_id=lambda api, *args: catalog.get_podcast_by_feed_id(api, *args),
+    ):
+        yield catalog
+
+
+@pytest.fixture(autouse=True)
+def config(hass: HomeAssistant, tmp_path) -> None:
+    """Keep the entries' files in a temporary directory and provide the API credentials."""
+    hass.config.config_dir = str(tmp_path)
+    hass.data["secrets"] = {
+        "podcast_index_api_key": "key",
+        "podcast_index_api_secret": "secret",
+    }
+
+
+async def _async_setup_entry(
+    hass: HomeAssistant, terms: str = "home automation", **options: Any
+) -> MockConfigEntry:
+    """Add and set up an entry tracking the given comma-separated terms."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_NAME: "Podcasts", CONF_SEARCH_OR_ID: terms},
+        options=options,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.mark.usefixtures("enable_custom_integrations", "catalog")
+async def test_shared_services_outlive_entries(hass: HomeAssistant) -> None:
+    """Entry-independent services are registered once and use the loaded entries."""
+    first = await _async_setup_entry(hass, **{CONF_SYNC_MODE: SYNC_MODE_PER_TERM})
+    second = await _async_setup_entry(hass, "bread", **{CONF_SYNC_MODE: SYNC_MODE_PER_TERM})
+    for service in (*ENTRY_SERVICES, *SHARED_SERVICES):
+        assert hass.services.has_service(DOMAIN, service)
+
+    assert await hass.config_entries.async_unload(second.entry_id)
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN, "get_episode_details", {}, blocking=True, return_response=True
+    )
+    assert [episode["entry_id"] for episode in response["episodes"]] == [first.entry_id]
+    # Without an entry_id, the feeds go to a loaded entry
+    response = await hass.services.async_call(
+        DOMAIN,
+        "import_opml",
+        {"content": "<opml><body></body></opml>"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["total"] == 0
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    await hass.async_block_till_done()
+
+    assert first.state is ConfigEntryState.NOT_LOADED
+    for service in SHARED_SERVICES:
+        assert hass.services.has_service(DOMAIN, service)
+    response = await hass.services.async_call(
+        DOMAIN, "get_episode_details", {}, blocking=True, return_response=True
+    )
+    assert response == {"episodes": []}
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_warm_start_from_the_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any], catalog: FakeCatalog
+) -> None:
+    """Sensors show the last known episode even when the API can't be reached."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_NAME: "Podcasts", CONF_SEARCH_OR_ID: "home automation"}
+    )
+    podcast = PODCASTS["home automation"]
+    episode = PodcastIndexAPI("key", "secret").add_podcast_info(
+        _episodes(podcast)[0], podcast, "home automation"
+    )
+    hass_storage[f"{SNAPSHOT_STORAGE_KEY}.{entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "key": f"{SNAPSHOT_STORAGE_KEY}.{entry.entry_id}",
+        "data": {
+            "terms": {
+                "home automation": {
+                    "episode": episode,
+                    "publish_times": [episode["publish_date"]],
+                    "history": [episode],
+                }
+            }
+        },
+    }
+    # Resolved long ago, so the expired resolution is searched again
+    hass_storage[RESOLUTION_CACHE_STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": RESOLUTION_CACHE_STORAGE_KEY,
+        "data": {"home automation": {"podcast": podcast, "resolved_at": 0}},
+    }
+    catalog.error = aiohttp.ClientConnectionError()
+
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, sensor_unique_id("Podcasts", "home automation")
+    )
+    state = hass.states.get(entity_id)
+    assert state.state == "Home Automation Weekly 3"
+    # The refresh after setup failed, so the restored episode is marked stale
+    assert catalog.searches == ["home automation"]
+    assert state.attributes["stale"] is True
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinators"]["home automation"]
+    assert [record.guid for record in coordinator.history.recent()] == ["41-3"]
+
+
+def _sensor_entity_id(hass: HomeAssistant, term: str) -> str | None:
+    """Return the entity id of a term's sensor, if it is registered."""
+    return er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, sensor_unique_id("Podcasts", term)
+    )
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_terms_are_added_and_removed_in_place(
+    hass: HomeAssistant, catalog: FakeCatalog
+) -> None:
+    """Changing the terms doesn't reload the entry or refetch the other feeds."""
+    entry = await _async_setup_entry(hass)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    batch_coordinator = entry_data["batch_coordinator"]
+    assert catalog.batches == [["41"]]
+
+    await hass.services.async_call(
+        DOMAIN, "add_search_term", {"search_term": "bread"}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert entry.data[CONF_SEARCH_OR_ID] == "home automation, bread"
+    assert hass.data[DOMAIN][entry.entry_id] is entry_data
+    assert set(batch_coordinator.data) == {"home automation", "bread"}
+    assert catalog.batches == [["41"]]
+    state = hass.states.get(_sensor_entity_id(hass, "bread"))
+    assert state.state == "Bread Talk 3"
+
+    # A term without a feed isn't added
+    await hass.services.async_call(
+        DOMAIN, "add_search_term", {"search_term": "nothing"}, blocking=True
+    )
+    assert entry.data[CONF_SEARCH_OR_ID] == "home automation, bread"
+
+    await hass.services.async_call(
+        DOMAIN, "remove_search_term", {"search_term": "bread"}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert entry.data[CONF_SEARCH_OR_ID] == "home automation"
+    assert hass.data[DOMAIN][entry.entry_id] is entry_data
+    assert set(batch_coordinator.data) == {"home automation"}
+    assert _sensor_entity_id(hass, "bread") is None
+    assert "bread" not in entry_data["coordinators"]
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_search_and_play_falls_back_in_order(
+    hass: HomeAssistant, catalog: FakeCatalog
+) -> None:
+    """Tracked episodes come first, then the API, then the local episode index."""
+    await _async_setup_entry(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    played = async_mock_service(hass, "media_player", "play_media")
+    async_mock_service(hass, "media_player", "unjoin")
+
+    async def _async_play(search_term: str) -> dict[str, Any]:
+        """Play a term's latest episode on a speaker."""
+        return await hass.services.async_call(
+            DOMAIN,
+            "search_and_play",
+            {"entity_id": "media_player.kitchen", "search_term": search_term},
+            blocking=True,
+            return_response=True,
+        )
+
+    catalog.searches.clear()
+    response = await _async_play("Home Automation")
+    assert (response["source"], response["title"]) == ("coordinator", "Home Automation Weekly 3")
+    assert catalog.searches == []
+
+    response = await _async_play("bread")
+    assert (response["source"], response["title"]) == ("search", "Bread Talk 3")
+    response = await _async_play("bread")
+    assert response["source"] == "resolution_cache"
+    assert catalog.searches == ["bread"]
+
+    # Only the local index knows a word of a tracked episode's title
+    catalog.error = aiohttp.ClientConnectionError()
+    response = await _async_play("weekly")
+    assert (response["source"], response["title"]) == ("local_index", "Home Automation Weekly 3")
+
+    response = await _async_play("gardening")
+    assert response["played"] is False
+    assert [call.data["media_content_id"] for call in played] == [
+        "https://cdn.example.com/41/3.mp3",
+        "https://cdn.example.com/42/3.mp3",
+        "https://cdn.example.com/42/3.mp3",
+        "https://cdn.example.com/41/3.mp3",
+    ]
@@ -0,0 +1,86 @@
+"""Tests for the API request metrics."""
+from __future__ import annotations
+
+import pytest
+
+from podcast_index.metrics import ApiMetrics, CacheStats, EndpointMetrics, to_ms
+
+
+def _endpoint_with_latencies(*latencies: float) -> EndpointMetrics:
+    """Return endpoint metrics that saw requests with the given latencies."""
+    metrics = EndpointMetrics()
+    for latency in latencies:
+        metrics.record(latency, 200, 100, False)
+    return metrics
+
+
+def test_percentiles_report_the_bucket_bound() -> None:
+    """A percentile is the upper bound of the histogram bucket it falls in."""
+    metrics = _endpoint_with_latencies(*[0.03] * 90, *[0.2] * 9, 0.7)
+
+    assert metrics.latency_percentile(0.5) == 0.05
+    assert metrics.latency_percentile(0.9) == 0.05
+    assert metrics.latency_percentile(0.95) == 0.25
+    assert metrics.latency_percentile(0.99) == 0.25
+    assert metrics.latency_percentile(1.0) == 0.7
+
+
+def test_percentile_is_capped_at_the_slowest_request() -> None:
+    """A bucket bound above every latency seen is not reported."""
+    metrics = _endpoint_with_latencies(0.12, 0.13)
+
+    assert metrics.latency_percentile(0.95) == 0.13
+
+
+def test_latencies_beyond_the_last_bucket() -> None:
+    """Overflowing latencies report the slowest one."""
+    metrics = _endpoint_with_latencies(0.01, 42.0)
+
+    assert metrics.latency_percentile(0.95) == 42.0
+    assert metrics.as_dict()["latency_histogram"]["overflow"] == 1
+
+
+def test_no_requests_no_percentile() -> None:
+    """Without requests there is nothing to report."""
+    metrics = EndpointMetrics()
+
+    assert metrics.latency_percentile(0.95) is None
+    assert metrics.mean_latency is None
+
+
+def test_api_metrics_aggregate_endpoints() -> None:
+    """Totals add up the endpoints; errors, rejections and feeds are counted."""
+    metrics = ApiMetrics()
+    metrics.record_request("/search/byterm", 0.1, 200, 500)
+    metrics.record_request("/episodes/byfeedid", 0.3, 200, 1500, feed_ids=["1", "2"])
+    metrics.record_request(
+        "/episodes/byfeedid", 0.2, 503, 0, TimeoutError(), feed_ids=["1"]
+    )
+    metrics.record_rejected("/episodes/byfeedid")
+
+    assert metrics.requests == 3
+    assert metrics.errors == 1
+    assert metrics.bytes_received == 2000
+    assert metrics.mean_latency == pytest.approx(0.2)
+    diagnostics = metrics.as_dict()
+    assert diagnostics["error_types"] == {"TimeoutError": 1}
+    assert diagnostics["hot_feeds"] == {"1": 2, "2": 1}
+    assert diagnostics["endpoints"]["/episodes/byfeedid"]["rejected"] == 1
+    assert diagnostics["endpoints"]["/episodes/byfeedid"]["statuses"] == {200: 1, 503: 1}
+
+
+def test_cache_hit_rate() -> None:
+    """The hit rate is unknown until the first lookup."""
+    stats = CacheStats()
+    assert stats.hit_rate is None
+
+    for hit in (True, True, False):
+        stats.record(hit)
+
+    assert stats.as_dict() == {"hits": 2, "misses": 1, "hit_rate": 0.667}
+
+
+def test_milliseconds() -> None:
+    """Seconds are reported as milliseconds rounded to 0.1 ms."""
+    assert to_ms(0.12345) == 123.5
+    assert to_ms(None) is None
@@ -0,0 +1,73 @@
+"""Tests for OPML subscription list parsing."""
+from __future__ import annotations
+
+import io
+from xml.etree.ElementTree import ParseError
+
+import pytest
+
+from podcast_index.opml import OpmlFeed, iter_opml_feeds, podcast_guid
+
+SUBSCRIPTIONS = b"""<?xml version="1.0" encoding="utf-8"?>
+<opml version="2.0">
+  <head><title>Podcast subscriptions</title></head>
+  <body>
+    <outline text="Home Automation Weekly" type="rss"
+             xmlUrl="https://example.com/haw.xml"/>
+    <outline text="Tech">
+      <outline text="News" title="Tech News Daily" type="rss"
+               xmlUrl=" https://example.com/news.xml "/>
+      <outline text="Deeper">
+        <outline type="rss" xmlUrl="https://example.com/untitled.xml"/>
+      </outline>
+    </outline>
+    <outline text="Duplicate" type="rss" xmlUrl="https://example.com/haw.xml"/>
+    <outline text="A folder without feeds"/>
+  </body>
+</opml>
+"""
+
+
+def test_feeds_are_found_at_any_depth() -> None:
+    """Nested folders are flattened, titles fall back, duplicates are dropped."""
+    feeds = list(iter_opml_feeds(io.BytesIO(SUBSCRIPTIONS)))
+
+    assert feeds == [
+        OpmlFeed("Home Automation Weekly", "https://example.com/haw.xml"),
+        OpmlFeed("Tech News Daily", "https://example.com/news.xml"),
+        OpmlFeed("https://example.com/untitled.xml", "https://example.com/untitled.xml"),
+    ]
+
+
+def test_feeds_are_yielded_while_reading() -> None:
+    """A large list is parsed as a stream, one feed at a time."""
+    outlines = b"".join(
+        b'<outline text="Show %d" xmlUrl="https://example.com/%d.xml"/>' % (n, n)
+        for n in range(5000)
+    )
+    document = b"<opml><body>" + outlines + b"</body></opml>"
+    source = io.BytesIO(document)
+    feeds = iter_opml_feeds(source)
+
+    assert next(feeds) == OpmlFeed("Show 0", "https://example.com/0.xml")
+    assert source.tell() < len(document) / 4
+    assert sum(1 for _feed in feeds) == 4999
+
+
+def test_malformed_document_raises() -> None:
+    """Broken XML is reported as a ParseError."""
+    with pytest.raises(ParseError):
+        list(iter_opml_feeds(io.BytesIO(b"<opml><body><outline></body>")))
+
+
+@pytest.mark.parametrize(
+    "feed_url",
+    [
+        "https://mp3s.nashownotes.com/pc20rss.xml",
+        "http://mp3s.nashownotes.com/pc20rss.xml/",
+        "mp3s.nashownotes.com/pc20rss.xml",
+    ],
+)
+def test_podcast_guid_matches_the_namespace_specification(feed_url: str) -> None:
+    """The guid ignores the scheme and trailing slashes, as the specification says."""
+    assert podcast_guid(feed_url) == "917393e3-1b1e-5cef-ace4-edaa54e1f810"
@@ -0,0 +1,144 @@
+"""Tests for the background download of episode audio."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.podcast_index import prefetch
+from custom_components.podcast_index.const import PREFETCH_DIRECTORY
+from custom_components.podcast_index.prefetch import AudioPrefetcher
+
+AUDIO = {
+    "https://cdn.example.com/1.mp3": b"episode 1",
+    "https://cdn.example.com/2.mp3": b"episode 2",
+    "https://cdn.example.com/long.mp3": b"a very long episode",
+}
+
+
+class _Api:
+    """Streams the audio of AUDIO and counts the downloads."""
+
+    def __init__(self) -> None:
+        """Start without downloads."""
+        self.downloads: list[str] = []
+
+    async def stream_audio(self, url: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Yield an episode's audio in chunks."""
+        self.downloads.append(url)
+        audio = AUDIO[url]
+        for start in range(0, len(audio), chunk_size):
+            yield audio[start : start + chunk_size]
+
+
+class _Coordinator:
+    """A term coordinator whose latest episode the test sets."""
+
+    def __init__(self, term: str, url: str) -> None:
+        """Start with an episode at url."""
+        self.term = term
+        self.data: dict[str, Any] = {"audio_url": url}
+        self._listeners: list[Callable[[], None]] = []
+
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener on every update."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def async_update_listeners(self) -> None:
+        """Notify the listeners."""
+        for listener in list(self._listeners):
+            listener()
+
+    def async_set_episode(self, url: str) -> None:
+        """Get a new latest episode."""
+        self.data = {"audio_url": url}
+        self.async_update_listeners()
+
+
+@pytest.fixture
+def api() -> _Api:
+    """Return an API client that streams AUDIO."""
+    return _Api()
+
+
+async def _async_prefetcher(hass: HomeAssistant, api: _Api, media_dir: Path) -> AudioPrefetcher:
+    """Return a loaded prefetcher of the media directory."""
+    prefetcher = AudioPrefetcher(hass, api, str(media_dir))
+    await prefetcher.async_load()
+    return prefetcher
+
+
+def _local_files(media_dir: Path) -> set[str]:
+    """Return the names of the files in the prefetch directory."""
+    return {path.name for path in (media_dir / PREFETCH_DIRECTORY).iterdir()}
+
+
+async def test_new_episode_is_downloaded(
+    hass: HomeAssistant, api: _Api, tmp_path: Path
+) -> None:
+    """The latest episode is played from disk once it is downloaded."""
+    prefetcher = await _async_prefetcher(hass, api, tmp_path)
+    url = "https://cdn.example.com/1.mp3"
+
+    prefetcher.async_track("entry", _Coordinator("show", url))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    media_id = prefetcher.local_media_id(url)
+    assert media_id.startswith(f"media-source://media_source/local/{PREFETCH_DIRECTORY}/")
+    name = media_id.rsplit("/", 1)[1]
+    assert (tmp_path / PREFETCH_DIRECTORY / name).read_bytes() == AUDIO[url]
+    assert prefetcher.size == len(AUDIO[url])
+
+    # A restart finds the download and drops unfinished ones
+    (tmp_path / PREFETCH_DIRECTORY / "unfinished.mp3.part").write_bytes(b"epi")
+    restarted = await _async_prefetcher(hass, api, tmp_path)
+
+    assert restarted.local_media_id(url) == media_id
+    assert _local_files(tmp_path) == {name}
+
+
+async def test_quota_evicts_old_episodes_but_not_current_ones(
+    hass: HomeAssistant, api: _Api, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The least recently used episode goes, and isn't downloaded again."""
+    monkeypatch.setattr(prefetch, "PREFETCH_QUOTA", 15)
+    prefetcher = await _async_prefetcher(hass, api, tmp_path)
+    first, second = "https://cdn.example.com/1.mp3", "https://cdn.example.com/2.mp3"
+    coordinator = _Coordinator("show", first)
+    prefetcher.async_track("entry", coordinator)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    coordinator.async_set_episode(second)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert prefetcher.local_media_id(first) is None
+    assert prefetcher.local_media_id(second) is not None
+    assert prefetcher.size == len(AUDIO[second])
+
+    coordinator.async_set_episode(first)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert api.downloads == [first, second]
+
+
+async def test_episode_over_the_quota_is_skipped(
+    hass: HomeAssistant, api: _Api, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An episode that doesn't fit next to the current ones isn't kept."""
+    monkeypatch.setattr(prefetch, "PREFETCH_QUOTA", 15)
+    prefetcher = await _async_prefetcher(hass, api, tmp_path)
+    long = "https://cdn.example.com/long.mp3"
+
+    prefetcher.async_track("entry", _Coordinator("show", long))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert prefetcher.local_media_id(long) is None
+    assert _local_files(tmp_path) == set()
+    assert prefetcher.stats()["skipped"] == 1
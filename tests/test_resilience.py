@@ -0,0 +1,208 @@
+"""Tests for the per-endpoint backoff and the circuit breaker."""
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from podcast_index import resilience
+from podcast_index.const import (
+    BACKOFF_INITIAL,
+    BACKOFF_MAX,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+)
+from podcast_index.resilience import (
+    CircuitBreaker,
+    EndpointBackoff,
+    PodcastIndexUnavailableError,
+    is_outage,
+)
+
+ENDPOINT = "/episodes/byfeedid"
+
+
+class _Clock:
+    """A monotonic clock the test moves forward by hand."""
+
+    def __init__(self) -> None:
+        """Start at an arbitrary time."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Replace the monotonic clock the module reads."""
+    clock = _Clock()
+    monkeypatch.setattr(resilience.time, "monotonic", clock)
+    return clock
+
+
+def _response_error(
+    status: int, headers: dict[str, str] | None = None
+) -> aiohttp.ClientResponseError:
+    """Return the error aiohttp raises for an HTTP error status."""
+    return aiohttp.ClientResponseError(None, (), status=status, headers=headers)
+
+
+@pytest.mark.parametrize(
+    ("error", "outage"),
+    [
+        (_response_error(404), False),
+        (_response_error(400), False),
+        (_response_error(429), True),
+        (_response_error(503), True),
+        (aiohttp.ClientConnectionError(), True),
+        (asyncio.TimeoutError(), True),
+        (ValueError(), False),
+    ],
+)
+def test_only_outages_count(error: BaseException, outage: bool) -> None:
+    """Rejected requests say nothing about the API's health."""
+    assert is_outage(error) is outage
+
+
+def test_backoff_doubles_up_to_the_cap(clock: _Clock, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each consecutive failure doubles the rest, up to BACKOFF_MAX."""
+    # No jitter: the whole delay
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    backoff = EndpointBackoff()
+    error = _response_error(503)
+
+    delays = []
+    for _failure in range(12):
+        backoff.record_failure(ENDPOINT, error)
+        started = clock.now
+        while True:
+            try:
+                backoff.check(ENDPOINT)
+            except PodcastIndexUnavailableError:
+                clock.now += 1
+            else:
+                break
+        delays.append(clock.now - started)
+
+    assert delays[:3] == [BACKOFF_INITIAL, 2 * BACKOFF_INITIAL, 4 * BACKOFF_INITIAL]
+    assert max(delays) == BACKOFF_MAX
+
+
+def test_backoff_jitter_keeps_half_the_delay(
+    clock: _Clock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The randomized share never shortens the rest below half."""
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: low)
+    backoff = EndpointBackoff()
+
+    backoff.record_failure(ENDPOINT, _response_error(503))
+
+    clock.now += BACKOFF_INITIAL / 2 - 1
+    with pytest.raises(PodcastIndexUnavailableError):
+        backoff.check(ENDPOINT)
+    clock.now += 1
+    backoff.check(ENDPOINT)
+
+
+def test_backoff_honors_retry_after(clock: _Clock) -> None:
+    """A longer Retry-After from the API wins over the computed delay."""
+    backoff = EndpointBackoff()
+
+    backoff.record_failure(ENDPOINT, _response_error(429, {"Retry-After": "120"}))
+
+    clock.now += 119
+    with pytest.raises(PodcastIndexUnavailableError):
+        backoff.check(ENDPOINT)
+    clock.now += 1
+    backoff.check(ENDPOINT)
+
+
+def test_backoff_is_per_endpoint_and_reset_by_success(clock: _Clock) -> None:
+    """Other endpoints keep working, and a success clears the failures."""
+    backoff = EndpointBackoff()
+    backoff.record_failure(ENDPOINT, _response_error(503))
+
+    backoff.check("/search/byterm")
+    with pytest.raises(PodcastIndexUnavailableError):
+        backoff.check(ENDPOINT)
+
+    backoff.record_success(ENDPOINT)
+    backoff.check(ENDPOINT)
+
+
+def test_circuit_opens_after_consecutive_failures(clock: _Clock) -> None:
+    """Requests are refused once the threshold is reached, not before."""
+    breaker = CircuitBreaker()
+    for _failure in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.check()
+
+    breaker.record_failure()
+
+    assert breaker.is_open
+    with pytest.raises(PodcastIndexUnavailableError):
+        breaker.check()
+
+
+def test_success_resets_the_failure_count(clock: _Clock) -> None:
+    """Only consecutive failures open the circuit."""
+    breaker = CircuitBreaker()
+    for _failure in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert not breaker.is_open
+
+
+def _open_circuit() -> CircuitBreaker:
+    """Return a circuit breaker that just opened."""
+    breaker = CircuitBreaker()
+    for _failure in range(CIRCUIT_FAILURE_THRESHOLD):
+        breaker.record_failure()
+    return breaker
+
+
+def test_one_probe_after_the_reset_timeout(clock: _Clock) -> None:
+    """A single request goes through once the circuit has rested."""
+    breaker = _open_circuit()
+
+    clock.now += CIRCUIT_RESET_TIMEOUT
+    breaker.check()
+    with pytest.raises(PodcastIndexUnavailableError):
+        breaker.check()
+
+    breaker.record_success()
+
+    assert not breaker.is_open
+    breaker.check()
+
+
+def test_failed_probe_opens_the_circuit_again(clock: _Clock) -> None:
+    """The reset timeout starts over after a failed probe."""
+    breaker = _open_circuit()
+    clock.now += CIRCUIT_RESET_TIMEOUT
+    breaker.check()
+
+    breaker.record_failure()
+
+    clock.now += CIRCUIT_RESET_TIMEOUT - 1
+    with pytest.raises(PodcastIndexUnavailableError):
+        breaker.check()
+    clock.now += 1
+    breaker.check()
+
+
+def test_released_probe_lets_another_through(clock: _Clock) -> None:
+    """A probe that ended without a verdict, e.g. cancelled, isn't waited for."""
+    breaker = _open_circuit()
+    clock.now += CIRCUIT_RESET_TIMEOUT
+    breaker.check()
+
+    breaker.release_probe()
+
+    breaker.check()
+    assert breaker.is_open
@@ -0,0 +1,160 @@
+"""Tests for the conditional-request response cache."""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from podcast_index import podcast_index_api
+from podcast_index.const import (
+    PODCAST_INDEX_EPISODES_BY_ID_ENDPOINT,
+    PODCAST_INDEX_SEARCH_ENDPOINT,
+)
+from podcast_index.metrics import ApiMetrics
+from podcast_index.podcast_index_api import PodcastIndexAPI
+from podcast_index.response_cache import ResponseCache, response_cache_key
+
+SEARCH = PODCAST_INDEX_SEARCH_ENDPOINT
+EPISODES = PODCAST_INDEX_EPISODES_BY_ID_ENDPOINT
+
+
+def test_key_ignores_parameter_order() -> None:
+    """Equivalent requests share a cache entry."""
+    assert response_cache_key(SEARCH, {"q": "news", "max": 1}) == response_cache_key(
+        SEARCH, {"max": "1", "q": "news"}
+    )
+    assert response_cache_key(SEARCH, {"q": "news"}) != response_cache_key(
+        SEARCH, {"q": "tech"}
+    )
+
+
+def test_least_recently_used_response_is_evicted() -> None:
+    """Bodies beyond max_bytes push out the response used longest ago."""
+    cache = ResponseCache(max_bytes=100)
+    cache.store("a", SEARCH, {"body": "a"}, 40, {})
+    cache.store("b", SEARCH, {"body": "b"}, 40, {})
+    assert cache.get("a") is not None
+
+    cache.store("c", SEARCH, {"body": "c"}, 40, {})
+
+    assert cache.get("b") is None
+    assert cache.get("a").data == {"body": "a"}
+    assert cache.get("c").data == {"body": "c"}
+    assert cache.size == 80
+
+
+def test_response_larger_than_the_cache_is_not_stored() -> None:
+    """A single oversized body doesn't flush the cache."""
+    cache = ResponseCache(max_bytes=100)
+    cache.store("a", SEARCH, {"body": "a"}, 40, {})
+    cache.store("big", SEARCH, {"body": "big"}, 101, {})
+
+    assert cache.get("big") is None
+    assert cache.get("a") is not None
+    assert cache.size == 40
+
+
+def test_validators_become_conditional_headers() -> None:
+    """ETag and Last-Modified are sent back as If-None-Match and If-Modified-Since."""
+    cache = ResponseCache()
+    cache.store(
+        "a",
+        EPISODES,
+        {"items": []},
+        10,
+        {"ETag": '"v1"', "Last-Modified": "Sat, 17 Oct 2026 08:00:00 GMT"},
+    )
+
+    assert cache.get("a").validators() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sat, 17 Oct 2026 08:00:00 GMT",
+    }
+
+
+def test_revalidate_only_responses_need_a_validator() -> None:
+    """Endpoints without a TTL are only kept when they can be revalidated."""
+    cache = ResponseCache()
+    cache.store("plain", EPISODES, {"items": []}, 10, {})
+    cache.store("tagged", EPISODES, {"items": []}, 10, {"ETag": '"v1"'})
+
+    assert cache.get("plain") is None
+    tagged = cache.get("tagged")
+    assert not tagged.fresh
+    assert tagged.revalidatable
+
+    cache.revalidated("tagged", EPISODES, {"ETag": '"v2"'})
+
+    assert cache.get("tagged").validators() == {"If-None-Match": '"v2"'}
+
+
+def test_restore_skips_unusable_responses() -> None:
+    """Stored responses that are stale and have no validator are dropped."""
+    cache = ResponseCache()
+    cache.store("fresh", SEARCH, {"feeds": []}, 10, {})
+    cache.store("tagged", EPISODES, {"items": []}, 10, {"ETag": '"v1"'})
+    stored = cache.as_dict()
+    stored["stale"] = [{"feeds": []}, None, None, 0, 10]
+
+    restored = ResponseCache()
+    restored.restore(stored)
+
+    assert len(restored) == 2
+    assert restored.get("stale") is None
+    assert restored.size == 20
+
+
+@pytest.mark.usefixtures("allow_local_sockets")
+def test_not_modified_reuses_the_decoded_body(monkeypatch) -> None:
+    """A 304 answer is served from the cache without downloading or decoding."""
+    body = json.dumps(
+        {
+            "status": "true",
+            "items": [
+                {"feedId": 1, "title": "Episode 2", "datePublished": 200, "guid": "e2"},
+            ],
+        }
+    ).encode()
+    conditional: list[str | None] = []
+
+    async def episodes(request: web.Request) -> web.Response:
+        conditional.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": '"v1"'}
+        )
+
+    decoded: list[bytes] = []
+    decode_response = podcast_index_api.decode_response
+
+    def counting_decode(data: bytes) -> dict[str, Any]:
+        decoded.append(data)
+        return decode_response(data)
+
+    monkeypatch.setattr(podcast_index_api, "decode_response", counting_decode)
+
+    async def run() -> tuple[dict[str, Any], dict[str, Any], ApiMetrics]:
+        app = web.Application()
+        app.router.add_get(EPISODES, episodes)
+        async with TestServer(app) as server:
+            api = PodcastIndexAPI("key", "secret", base_url=str(server.make_url("")))
+            try:
+                first = await api.get_episodes_by_feed_ids(["1"])
+                second = await api.get_episodes_by_feed_ids(["1"])
+            finally:
+                await api.close()
+            return first, second, api.metrics
+
+    first, second, metrics = asyncio.run(run())
+
+    assert first == second
+    assert [episode["title"] for episode in first["1"]] == ["Episode 2"]
+    assert conditional == [None, '"v1"']
+    assert len(decoded) == 1
+    assert metrics.endpoints[EPISODES].statuses == {200: 1, 304: 1}
+    assert metrics.endpoints[EPISODES].bytes_received == len(body)
+    assert metrics.cache("response").hits == 1
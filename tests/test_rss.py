@@ -0,0 +1,123 @@
+"""Tests for the streaming RSS parser."""
+from __future__ import annotations
+
+from xml.etree.ElementTree import ParseError
+
+import pytest
+
+from podcast_index.rss import FirstItemParser
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+     xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Home Automation Weekly</title>
+    <description>Everything about local control.</description>
+    <image><title>Not the show title</title></image>
+    <item>
+      <title>Episode 42: Zigbee all the things</title>
+      <description>Short summary</description>
+      <content:encoded><![CDATA[<p>Full show notes</p>]]></content:encoded>
+      <pubDate>Sat, 17 Oct 2026 08:00:00 +0000</pubDate>
+      <itunes:duration>1:02:03</itunes:duration>
+      <itunes:episode>42</itunes:episode>
+      <itunes:season>3</itunes:season>
+      <enclosure url="https://cdn.example.com/42.mp3" length="1" type="audio/mpeg"/>
+      <guid>episode-42</guid>
+      <link>https://example.com/42</link>
+    </item>
+"""
+
+
+def _older_items(count: int) -> bytes:
+    """Return items the parser must never get to."""
+    return b"".join(
+        b"<item><title>Episode %d</title><guid>episode-%d</guid></item>" % (n, n)
+        for n in range(count)
+    )
+
+
+def _feed_in_chunks(parser: FirstItemParser, document: bytes, size: int) -> bool:
+    """Feed a document chunk by chunk until the parser is done."""
+    for start in range(0, len(document), size):
+        if parser.feed(document[start:start + size]):
+            return True
+    return False
+
+
+def test_first_item_is_parsed() -> None:
+    """The first item becomes an episode with the fields the API returns."""
+    parser = FirstItemParser()
+
+    assert _feed_in_chunks(parser, FEED + _older_items(3) + b"</channel></rss>", 64)
+
+    assert parser.episode == {
+        "title": "Episode 42: Zigbee all the things",
+        "description": "<p>Full show notes</p>",
+        "publish_date": 1792224000,
+        "duration": 3723,
+        "audio_url": "https://cdn.example.com/42.mp3",
+        "podcast_title": "Home Automation Weekly",
+        "episode_number": 42,
+        "season_number": 3,
+        "guid": "episode-42",
+        "link": "https://example.com/42",
+    }
+
+
+def test_parsing_stops_after_the_first_item() -> None:
+    """The rest of a long feed is never read."""
+    document = FEED + _older_items(2000) + b"</channel></rss>"
+    parser = FirstItemParser()
+
+    assert _feed_in_chunks(parser, document, 1024)
+
+    assert parser.bytes_read < len(FEED) + 1024
+    assert parser.feed(b"<not even xml") is True
+
+
+def test_episode_is_none_until_the_item_is_complete() -> None:
+    """A feed cut off inside its first item has no episode yet."""
+    parser = FirstItemParser()
+
+    assert not parser.feed(FEED[: FEED.index(b"<guid>")])
+    assert parser.episode is None
+
+
+@pytest.mark.parametrize(
+    ("duration", "seconds"),
+    [("3723", 3723), ("62:03", 3723), ("1:02:03", 3723), ("", 0), ("soon", 0)],
+)
+def test_duration_formats(duration: str, seconds: int) -> None:
+    """itunes:duration is read as seconds, minutes:seconds or hours:minutes:seconds."""
+    document = FEED.replace(b"1:02:03", duration.encode())
+    parser = FirstItemParser()
+
+    parser.feed(document)
+
+    assert parser.episode["duration"] == seconds
+
+
+def test_missing_fields_fall_back() -> None:
+    """Without a guid the enclosure identifies the episode; bad numbers are None."""
+    document = (
+        FEED.replace(b"<guid>episode-42</guid>", b"")
+        .replace(b"<itunes:episode>42</itunes:episode>", b"<itunes:episode>x</itunes:episode>")
+        .replace(b"<pubDate>Sat, 17 Oct 2026 08:00:00 +0000</pubDate>", b"")
+    )
+    parser = FirstItemParser()
+
+    parser.feed(document)
+
+    assert parser.episode["guid"] == "https://cdn.example.com/42.mp3"
+    assert parser.episode["episode_number"] is None
+    assert parser.episode["publish_date"] == 0
+
+
+def test_malformed_feed_raises() -> None:
+    """Broken XML is reported as a ParseError."""
+    parser = FirstItemParser()
+
+    with pytest.raises(ParseError):
+        parser.feed(b"<rss><channel><item></channel>")
@@ -0,0 +1,113 @@
+"""Tests for the adaptive per-feed poll scheduler."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.podcast_index import scheduler
+from custom_components.podcast_index.const import (
+    ADAPTIVE_LEARNING_INTERVAL,
+    ADAPTIVE_MAX_INTERVAL,
+    ADAPTIVE_MIN_INTERVAL,
+    ADAPTIVE_MIN_WINDOW,
+)
+from custom_components.podcast_index.scheduler import AdaptivePollScheduler, FeedSchedule
+
+HOUR = 3600
+WEEK = 7 * 24 * HOUR
+LAST_RELEASE = 1_790_000_000
+
+
+def _coordinator(term: str, publish_times: list[int]) -> MagicMock:
+    """Return a term coordinator that has seen the given publish times."""
+    coordinator = MagicMock()
+    coordinator.term = term
+    coordinator.publish_times = publish_times
+    coordinator.async_refresh = AsyncMock()
+    return coordinator
+
+
+def _weekly(releases: int = 4) -> list[int]:
+    """Return the publish times of a show released every week, oldest first."""
+    return [LAST_RELEASE - WEEK * number for number in reversed(range(releases))]
+
+
+def test_few_episodes_poll_at_the_learning_interval() -> None:
+    """Without enough releases to learn from, the feed is polled steadily."""
+    schedule = FeedSchedule(_coordinator("new show", _weekly(2)))
+
+    schedule.plan(LAST_RELEASE)
+
+    assert schedule.cadence is None
+    assert schedule.next_poll == LAST_RELEASE + ADAPTIVE_LEARNING_INTERVAL
+
+
+def test_waits_for_the_release_window() -> None:
+    """Far from the next release, polls back off; just before, they wait for the window."""
+    schedule = FeedSchedule(_coordinator("weekly", _weekly()))
+
+    schedule.plan(LAST_RELEASE + HOUR)
+
+    assert schedule.cadence == WEEK
+    assert schedule.expected_release == LAST_RELEASE + WEEK
+    assert schedule.next_poll == LAST_RELEASE + HOUR + ADAPTIVE_MAX_INTERVAL
+
+    now = LAST_RELEASE + WEEK - ADAPTIVE_MIN_WINDOW - 2 * HOUR
+    schedule.plan(now)
+
+    assert not schedule.in_window
+    assert schedule.next_poll == LAST_RELEASE + WEEK - ADAPTIVE_MIN_WINDOW
+
+
+def test_polls_often_inside_the_release_window() -> None:
+    """Around the expected release, the feed is polled every ADAPTIVE_MIN_INTERVAL."""
+    schedule = FeedSchedule(_coordinator("weekly", _weekly()))
+    now = LAST_RELEASE + WEEK - ADAPTIVE_MIN_WINDOW / 2
+
+    schedule.plan(now)
+
+    assert schedule.in_window
+    assert schedule.next_poll == now + ADAPTIVE_MIN_INTERVAL
+
+
+def test_dormant_feed_polls_at_the_longest_interval() -> None:
+    """A feed that missed several releases isn't expected back on schedule."""
+    schedule = FeedSchedule(_coordinator("weekly", _weekly()))
+    now = LAST_RELEASE + 6 * WEEK
+
+    schedule.plan(now)
+
+    assert schedule.expected_release is None
+    assert schedule.next_poll == now + ADAPTIVE_MAX_INTERVAL
+
+
+async def test_tick_polls_due_feeds_within_the_budget(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Feeds in a release window go first; those over budget wait a tick."""
+    monkeypatch.setattr(scheduler, "ADAPTIVE_REQUEST_BUDGET", 2)
+    poll_scheduler = AdaptivePollScheduler(hass)
+    coordinators = [_coordinator(f"show {number}", []) for number in range(3)]
+    for coordinator in coordinators:
+        poll_scheduler.async_add("entry", coordinator)
+    schedules = poll_scheduler._schedules
+    for schedule in schedules.values():
+        schedule.next_poll = 0
+    schedules[("entry", "show 2")].in_window = True
+
+    poll_scheduler._async_tick(dt_util.utcnow())
+    await hass.async_block_till_done()
+
+    assert [coordinator.async_refresh.await_count for coordinator in coordinators] == [1, 0, 1]
+    assert schedules[("entry", "show 1")].deferred
+    assert not schedules[("entry", "show 0")].polling
+
+    poll_scheduler.async_remove("entry")
+
+    assert poll_scheduler.as_dict() == []
@@ -0,0 +1,92 @@
+"""Tests for the persisted snapshot of the last known episodes."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    flush_store,
+)
+
+from custom_components.podcast_index.const import SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_KEY
+from custom_components.podcast_index.coordinator import PodcastIndexTermCoordinator
+from custom_components.podcast_index.podcast_index_api import PodcastIndexAPI
+from custom_components.podcast_index.resolution_cache import ResolutionCache
+from custom_components.podcast_index.snapshot import EpisodeSnapshot
+
+TERM = "home automation"
+EPISODE = {
+    "title": "Episode 3",
+    "publish_date": 3000,
+    "audio_url": "https://cdn.example.com/3.mp3",
+    "podcast_title": "Home Automation Weekly",
+    "guid": "haw-3",
+}
+
+
+def _coordinator(hass: HomeAssistant, term: str = TERM) -> PodcastIndexTermCoordinator:
+    """Return a term coordinator that never reaches the network."""
+    return PodcastIndexTermCoordinator(
+        hass,
+        PodcastIndexAPI("key", "secret"),
+        ResolutionCache(hass),
+        "Test",
+        term,
+        None,
+        history_depth=5,
+    )
+
+
+async def test_saved_episodes_are_restored(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """New data is saved after a delay and seeds the coordinators of the next start."""
+    coordinator = _coordinator(hass)
+    snapshot = EpisodeSnapshot(hass, "entry")
+    snapshot.async_track(coordinator)
+    coordinator.publish_times = [1000, 2000, 3000]
+    coordinator.record_episodes([EPISODE])
+    coordinator.async_set_updated_data(EPISODE)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY))
+    await hass.async_block_till_done()
+    snapshot.async_stop()
+
+    assert hass_storage[f"{SNAPSHOT_STORAGE_KEY}.entry"]["data"]["terms"][TERM]["episode"] == (
+        EPISODE
+    )
+
+    restored_coordinator = _coordinator(hass)
+    untracked = _coordinator(hass, "bread")
+    restored = await EpisodeSnapshot(hass, "entry").async_restore(
+        {TERM: restored_coordinator, "bread": untracked}
+    )
+
+    assert restored == {TERM}
+    assert restored_coordinator.data == EPISODE
+    assert restored_coordinator.publish_times == [1000, 2000, 3000]
+    assert [record.guid for record in restored_coordinator.history.recent()] == ["haw-3"]
+    assert untracked.data is None
+
+
+async def test_forgotten_term_is_dropped(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """A removed term isn't restored on the next start."""
+    coordinators = {term: _coordinator(hass, term) for term in (TERM, "bread")}
+    snapshot = EpisodeSnapshot(hass, "entry")
+    for coordinator in coordinators.values():
+        snapshot.async_track(coordinator)
+        coordinator.async_set_updated_data({**EPISODE, "guid": coordinator.term})
+
+    snapshot.async_forget("bread")
+    await flush_store(snapshot._store)
+
+    assert set(hass_storage[f"{SNAPSHOT_STORAGE_KEY}.entry"]["data"]["terms"]) == {TERM}